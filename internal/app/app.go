@@ -5,6 +5,7 @@ import (
 	"context"
 	"fmt"
 	"os/exec"
+	"path/filepath"
 	"strings"
 	"sync"
 	"time"
@@ -51,11 +52,15 @@ const (
 	onExistsNew              = "new"
 	onExistsSwitch           = "switch"
 
-	detailsCacheTTL  = 2 * time.Second
-	debounceDelay    = 200 * time.Millisecond
-	ciCacheTTL       = 30 * time.Second
-	defaultDirPerms  = utils.DefaultDirPerms
-	defaultFilePerms = 0o600
+	detailsCacheTTL        = 2 * time.Second
+	commitDetailsCacheSize = 64
+	commitFilesCacheSize   = 128
+	noteLinesCacheSize     = 64
+	notifyOnceCacheSize    = 256
+	debounceDelay          = 50 * time.Millisecond
+	ciCacheTTL             = 30 * time.Second
+	defaultDirPerms        = utils.DefaultDirPerms
+	defaultFilePerms       = 0o600
 
 	osDarwin  = "darwin"
 	osWindows = "windows"
@@ -81,6 +86,12 @@ type (
 		worktrees []*models.WorktreeInfo
 		err       error
 	}
+	// worktreeProbedMsg carries one worktree of an in-flight initial listing;
+	// next yields the following update, ending with a worktreesLoadedMsg.
+	worktreeProbedMsg struct {
+		worktree *models.WorktreeInfo
+		next     <-chan tea.Msg
+	}
 	prDataLoadedMsg struct {
 		prMap          map[string]*models.PRInfo
 		worktreePRs    map[string]*models.PRInfo // keyed by worktree path
@@ -90,8 +101,10 @@ type (
 	statusUpdatedMsg struct {
 		info        string
 		statusFiles []StatusFile
+		statusTree  *services.StatusTreeNode // built from statusFiles off the update loop
 		log         []commitLogEntry
 		path        string
+		request     int // requestDetails token, zero for other loads
 	}
 	refreshCompleteMsg      struct{}
 	fetchRemotesCompleteMsg struct{}
@@ -100,9 +113,13 @@ type (
 	debouncedDetailsMsg     struct {
 		selectedIndex int
 	}
+	debouncedFilterMsg struct{}
 	cachedWorktreesMsg struct {
 		worktrees []*models.WorktreeInfo
 	}
+	repoKeyResolvedMsg struct {
+		key string
+	}
 	detailsCacheEntry struct {
 		statusRaw    string
 		logRaw       string
@@ -110,6 +127,16 @@ type (
 		unmergedSHAs map[string]bool
 		fetchedAt    time.Time
 	}
+	// commitDetailsKey identifies commit history for a worktree at a given HEAD.
+	commitDetailsKey struct {
+		path    string
+		headSHA string
+	}
+	// commitFilesKey identifies a commit opened from a worktree.
+	commitFilesKey struct {
+		path string
+		sha  string
+	}
 	pruneResultMsg struct {
 		worktrees      []*models.WorktreeInfo
 		err            error
@@ -199,6 +226,7 @@ type (
 		sha          string
 		worktreePath string
 		files        []models.CommitFile
+		tree         *screen.CommitFileTreeNode
 		meta         commitMeta
 		err          error
 	}
@@ -279,10 +307,11 @@ type dataState struct {
 	worktrees       []*models.WorktreeInfo
 	filteredWts     []*models.WorktreeInfo
 	selectedIndex   int
-	accessHistory   map[string]int64 // worktree path -> last access timestamp
-	statusFiles     []StatusFile     // parsed list of files from git status (kept for compatibility)
-	statusFilesAll  []StatusFile     // full list of files from git status
-	statusFileIndex int              // currently selected file index in status pane
+	accessHistory   map[string]int64         // worktree path -> last access timestamp
+	statusFiles     []StatusFile             // parsed list of files from git status (kept for compatibility)
+	statusFilesAll  []StatusFile             // full list of files from git status
+	statusTreeAll   *services.StatusTreeNode // tree of statusFilesAll, reused while no filter is active
+	statusFileIndex int                      // currently selected file index in status pane
 	logEntries      []commitLogEntry
 	logEntriesAll   []commitLogEntry
 }
@@ -315,7 +344,6 @@ type Model struct {
 	prDataLoaded              bool
 	checkMergedAfterPRRefresh bool // Flag to trigger merged check after PR data refresh
 	repoKey                   string
-	repoKeyOnce               sync.Once
 	currentDetailsPath        string
 	loading                   bool
 	loadingOperation          string // Tracks what operation is loading (push, sync, etc.)
@@ -333,8 +361,22 @@ type Model struct {
 		ciCache         services.CICheckCache // branch -> CI checks cache
 		detailsCache    map[string]*detailsCacheEntry
 		detailsCacheMu  sync.RWMutex
+		commitDetails   *utils.LRUCache[commitDetailsKey, *detailsCacheEntry]
+		// commitFiles holds loaded commit views; commits are immutable so
+		// entries never need invalidating.
+		commitFiles *utils.LRUCache[commitFilesKey, commitFilesLoadedMsg]
+		// noteLines holds rendered worktree notes, so redrawing the info
+		// pane does not re-render unchanged Markdown.
+		noteLines       *utils.LRUCache[noteLinesKey, []string]
+		filterHaystacks map[*models.WorktreeInfo]*worktreeHaystack
+		rowCells        map[*models.WorktreeInfo]*worktreeRowCache
+		// worktreeIndex maps paths to the list whose first element is worktreeIndexHead.
+		worktreeIndex     map[string]*models.WorktreeInfo
+		worktreeIndexHead **models.WorktreeInfo
 	}
 	worktreesLoaded bool
+	// worktreesPartial is set while the list only holds streamed probe results.
+	worktreesPartial bool
 
 	// Create from current state
 	createFromCurrent struct {
@@ -350,8 +392,17 @@ type Model struct {
 	cancel context.CancelFunc
 
 	// Debouncing
-	detailUpdateCancel  context.CancelFunc
-	pendingDetailsIndex int
+	detailUpdateCancel   context.CancelFunc
+	pendingDetailsIndex  int
+	lastDetailsRequestAt time.Time
+	detailsInFlight      bool
+	detailsRequest       int
+	detailsStale         bool
+	filterUpdateCancel   context.CancelFunc
+	lastFilterKeyAt      time.Time
+
+	// Layout last pushed to the tables, so unchanged frames skip resizing
+	appliedLayout *appliedLayoutKey
 
 	// Auto refresh
 	autoRefreshStarted bool
@@ -362,7 +413,9 @@ type Model struct {
 	// Trust / repo commands
 	repoConfig     *config.RepoConfig
 	repoConfigPath string
-	pending        *state.PendingState
+	// repoConfigStamp records the .wt file state repoConfig was loaded from.
+	repoConfigStamp fileStamp
+	pending         *state.PendingState
 
 	// Command history for ! command
 	commandHistory []string
@@ -402,8 +455,9 @@ func NewModel(cfg *config.AppConfig, initialFilter string) *Model {
 		SetIconProvider(&NerdFontV3Provider{})
 	}
 
-	debugNotified := map[string]bool{}
-	var debugMu sync.Mutex // Protects debugNotified map
+	// Bounded so transient failures over a long session cannot grow it forever.
+	debugNotified := utils.NewLRUCache[string, struct{}](notifyOnceCacheSize)
+	var debugMu sync.Mutex // Makes the check-and-record below atomic
 
 	log.Printf("debug logging enabled")
 
@@ -413,10 +467,10 @@ func NewModel(cfg *config.AppConfig, initialFilter string) *Model {
 	notifyOnce := func(key string, message string, severity string) {
 		debugMu.Lock()
 		defer debugMu.Unlock()
-		if debugNotified[key] {
+		if _, seen := debugNotified.Get(key); seen {
 			return
 		}
-		debugNotified[key] = true
+		debugNotified.Set(key, struct{}{})
 		log.Printf("[%s] %s", severity, message)
 	}
 
@@ -531,6 +585,9 @@ func NewModel(cfg *config.AppConfig, initialFilter string) *Model {
 	m.cache.notifiedErrors = make(map[string]bool)
 	m.cache.ciCache = services.NewCICheckCache()
 	m.cache.detailsCache = make(map[string]*detailsCacheEntry)
+	m.cache.commitDetails = utils.NewLRUCache[commitDetailsKey, *detailsCacheEntry](commitDetailsCacheSize)
+	m.cache.commitFiles = utils.NewLRUCache[commitFilesKey, commitFilesLoadedMsg](commitFilesCacheSize)
+	m.cache.noteLines = utils.NewLRUCache[noteLinesKey, []string](noteLinesCacheSize)
 
 	m.state.ui.worktreeTable = t
 	m.state.ui.statusViewport = statusVp
@@ -540,6 +597,7 @@ func NewModel(cfg *config.AppConfig, initialFilter string) *Model {
 	m.state.ui.screenManager = screen.NewManager()
 
 	m.state.services.git = gitService
+	gitService.SetRepoNameCacheFile(filepath.Join(m.getWorktreeDir(), models.RepoNamesFilename))
 	m.state.services.trustManager = trustManager
 	m.state.services.worktree = services.NewWorktreeService(gitService)
 	m.state.services.statusTree = services.NewStatusService()
@@ -566,12 +624,8 @@ func NewModel(cfg *config.AppConfig, initialFilter string) *Model {
 
 // Init satisfies the tea.Model interface and starts with no command.
 func (m *Model) Init() tea.Cmd {
-	m.loadCommandHistory()
-	m.loadAccessHistory()
-	m.loadWorktreeNotes()
-	m.loadPaletteHistory()
 	cmds := []tea.Cmd{
-		m.loadCache(),
+		m.resolveRepoKey(),
 		m.refreshWorktrees(),
 		m.state.ui.spinner.Tick,
 	}
@@ -609,7 +663,7 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 		}
 		return m.handleKeyMsg(msg)
 
-	case worktreesLoadedMsg, cachedWorktreesMsg, pruneResultMsg, absorbMergeResultMsg:
+	case worktreesLoadedMsg, worktreeProbedMsg, cachedWorktreesMsg, repoKeyResolvedMsg, pruneResultMsg, absorbMergeResultMsg:
 		return m.handleWorktreeMessages(msg)
 
 	case openPRsLoadedMsg:
@@ -651,12 +705,11 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.setWorktreeNote(msg.targetPath, msg.note)
 		}
 		env := m.buildCommandEnv(msg.branch, msg.targetPath)
-		initCmds := m.collectInitCommands()
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{worktrees: worktrees, err: err}
 		}
-		return m, m.runCommandsWithTrust(initCmds, msg.targetPath, env, after)
+		return m, m.runInitCommandsWithTrust(msg.targetPath, env, after)
 
 	case createFromIssueResultMsg:
 		m.loading = false
@@ -670,12 +723,11 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.setWorktreeNote(msg.targetPath, msg.note)
 		}
 		env := m.buildCommandEnv(msg.branch, msg.targetPath)
-		initCmds := m.collectInitCommands()
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{worktrees: worktrees, err: err}
 		}
-		return m, m.runCommandsWithTrust(initCmds, msg.targetPath, env, after)
+		return m, m.runInitCommandsWithTrust(msg.targetPath, env, after)
 
 	case renameWorktreeResultMsg:
 		if msg.err != nil {
@@ -783,10 +835,18 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 		return m.handlePRMessages(msg)
 
 	case statusUpdatedMsg:
+		var next tea.Cmd
+		if m.detailsInFlight && msg.request == m.detailsRequest {
+			m.detailsInFlight = false
+			if m.detailsStale {
+				m.detailsStale = false
+				next = m.requestDetails()
+			}
+		}
 		if msg.info != "" {
 			m.infoContent = msg.info
 		}
-		m.setStatusFiles(msg.statusFiles)
+		m.setStatusFilesWithTree(msg.statusFiles, msg.statusTree)
 		m.updateWorktreeStatus(msg.path, msg.statusFiles)
 		if msg.log != nil {
 			reset := false
@@ -797,16 +857,21 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.setLogEntries(msg.log, reset)
 		}
 		// Trigger CI fetch if worktree has a PR and cache is stale
-		return m, m.maybeFetchCIStatus()
+		return m, tea.Batch(next, m.maybeFetchCIStatus())
 
 	case debouncedDetailsMsg:
 		// Only update if the index matches and is still valid
 		if msg.selectedIndex == m.state.ui.worktreeTable.Cursor() &&
 			msg.selectedIndex >= 0 && msg.selectedIndex < len(m.state.data.filteredWts) {
-			return m, m.updateDetailsView()
+			return m, m.requestDetails()
 		}
 		return m, nil
 
+	case debouncedFilterMsg:
+		m.filterUpdateCancel = nil
+		m.updateTable()
+		return m, nil
+
 	case errMsg:
 		if msg.err != nil {
 			m.showInfo(fmt.Sprintf("Error: %v", msg.err), nil)
@@ -937,10 +1002,15 @@ func (m *Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			Date:    msg.meta.date,
 			Subject: msg.meta.subject,
 		}
-		commitFilesScr := screen.NewCommitFilesScreen(
+		tree := msg.tree
+		if tree == nil {
+			tree = screen.BuildCompressedCommitFileTree(msg.files)
+		}
+		commitFilesScr := screen.NewCommitFilesScreenWithTree(
 			msg.sha,
 			msg.worktreePath,
 			msg.files,
+			tree,
 			screenMeta,
 			m.state.view.WindowWidth,
 			m.state.view.WindowHeight,
@@ -992,7 +1062,13 @@ func (m *Model) Close() {
 	if m.detailUpdateCancel != nil {
 		m.detailUpdateCancel()
 	}
+	if m.filterUpdateCancel != nil {
+		m.filterUpdateCancel()
+	}
 	if m.cancel != nil {
 		m.cancel()
 	}
+	if m.state.services.git != nil {
+		m.state.services.git.Close()
+	}
 }
@@ -1,6 +1,7 @@
 package app
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -62,7 +63,7 @@ func (m *Model) openPR() tea.Cmd {
 
 func (m *Model) openRepoInBrowser() tea.Cmd {
 	// Get remote URL
-	remoteURL := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "remote", "get-url", "origin"}, "", []int{0}, true, false))
+	remoteURL := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "remote", "get-url", "origin"}, "", nil, true, false))
 	if remoteURL == "" {
 		return func() tea.Msg {
 			return errMsg{err: fmt.Errorf("could not determine repository remote URL")}
@@ -216,7 +217,8 @@ func (m *Model) executeCustomCommandWithPager(customCmd *config.CustomCommand, w
 	return m.execProcess(c, func(err error) tea.Msg {
 		if err != nil {
 			// Ignore exit status 141 (SIGPIPE) which happens when the pager is closed early
-			if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() == 141 {
+			var exitErr *exec.ExitError
+			if errors.As(err, &exitErr) && exitErr.ExitCode() == 141 {
 				return refreshCompleteMsg{}
 			}
 			return errMsg{err: err}
@@ -259,7 +261,8 @@ func (m *Model) executeArbitraryCommand(cmdStr string) tea.Cmd {
 	return m.execProcess(c, func(err error) tea.Msg {
 		if err != nil {
 			// Ignore exit status 141 (SIGPIPE) which happens when the pager is closed early
-			if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() == 141 {
+			var exitErr *exec.ExitError
+			if errors.As(err, &exitErr) && exitErr.ExitCode() == 141 {
 				return refreshCompleteMsg{}
 			}
 			return errMsg{err: err}
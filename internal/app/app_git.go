@@ -5,7 +5,9 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"time"
 
 	tea "github.com/charmbracelet/bubbletea"
 	"github.com/chmouel/lazyworktree/internal/app/screen"
@@ -32,32 +34,33 @@ func (m *Model) fetchPRData() tea.Cmd {
 
 		// Also fetch PRs per worktree for cases where local branch differs from remote
 		// This handles fork PRs where local branch name doesn't match headRefName
-		worktreePRs := make(map[string]*models.PRInfo)
-		worktreeErrors := make(map[string]string)
+		var unmatched []string
 		for _, wt := range m.state.data.worktrees {
 			log.Printf("Checking worktree: Branch=%q Path=%q", wt.Branch, wt.Path)
+			// Skip if already matched by headRefName
 			if pr, ok := prMap[wt.Branch]; ok {
 				log.Printf("  Found in prMap: PR#%d", pr.Number)
-			} else {
-				log.Printf("  Not in prMap, will fetch per-worktree")
-			}
-
-			// Skip if already matched by headRefName
-			if _, ok := prMap[wt.Branch]; ok {
 				continue
 			}
-			// Try to fetch PR for this worktree directly
-			pr, fetchErr := m.state.services.git.FetchPRForWorktreeWithError(m.ctx, wt.Path)
+			log.Printf("  Not in prMap, will fetch per-worktree")
+			unmatched = append(unmatched, wt.Path)
+		}
+
+		// The per-worktree lookups each spawn gh/glab, so they run
+		// concurrently rather than one after another.
+		worktreePRs, fetchErrs := m.state.services.git.FetchPRsForWorktrees(m.ctx, unmatched)
+		worktreeErrors := make(map[string]string, len(fetchErrs))
+		for _, path := range unmatched {
+			pr, fetchErr := worktreePRs[path], fetchErrs[path]
 			if pr != nil {
-				worktreePRs[wt.Path] = pr
-				log.Printf("  FetchPRForWorktree returned PR#%d", pr.Number)
+				log.Printf("  FetchPRForWorktree(%q) returned PR#%d", path, pr.Number)
 			}
 			if fetchErr != nil {
-				worktreeErrors[wt.Path] = fetchErr.Error()
-				log.Printf("  FetchPRForWorktree error: %v", fetchErr)
+				worktreeErrors[path] = fetchErr.Error()
+				log.Printf("  FetchPRForWorktree(%q) error: %v", path, fetchErr)
 			}
 			if pr == nil && fetchErr == nil {
-				log.Printf("  FetchPRForWorktree returned nil (no PR)")
+				log.Printf("  FetchPRForWorktree(%q) returned nil (no PR)", path)
 			}
 		}
 
@@ -71,12 +74,23 @@ func (m *Model) fetchPRData() tea.Cmd {
 }
 
 func (m *Model) fetchRemotes() tea.Cmd {
+	// Let git fetch the remotes in parallel rather than one after another.
+	jobs := fmt.Sprintf("--jobs=%d", m.fetchJobs())
 	return func() tea.Msg {
-		m.state.services.git.RunGit(m.ctx, []string{"git", "fetch", "--all", "--quiet"}, "", []int{0}, false, false)
+		m.state.services.git.RunGit(m.ctx, []string{"git", "fetch", "--all", jobs, "--quiet"}, "", nil, false, false)
 		return fetchRemotesCompleteMsg{}
 	}
 }
 
+// fetchJobs returns the configured fetch parallelism, defaulting to the
+// number of CPUs capped at 8.
+func (m *Model) fetchJobs() int {
+	if m.config.FetchJobs > 0 {
+		return m.config.FetchJobs
+	}
+	return min(8, runtime.NumCPU())
+}
+
 // refreshCurrentWorktreePR fetches PR info for the currently selected worktree only.
 func (m *Model) refreshCurrentWorktreePR() tea.Cmd {
 	if m.config.DisablePR {
@@ -390,7 +404,17 @@ func (m *Model) collectTerminateCommands() []string {
 	return cmds
 }
 
+// runInitCommandsWithTrust runs the configured init commands, concurrently
+// when init_commands_parallel is set.
+func (m *Model) runInitCommandsWithTrust(cwd string, env map[string]string, after func() tea.Msg) tea.Cmd {
+	return m.runCommandListWithTrust(m.collectInitCommands(), m.config.InitCommandsParallel, cwd, env, after)
+}
+
 func (m *Model) runCommandsWithTrust(cmds []string, cwd string, env map[string]string, after func() tea.Msg) tea.Cmd {
+	return m.runCommandListWithTrust(cmds, false, cwd, env, after)
+}
+
+func (m *Model) runCommandListWithTrust(cmds []string, parallel bool, cwd string, env map[string]string, after func() tea.Msg) tea.Cmd {
 	if len(cmds) == 0 {
 		if after == nil {
 			return nil
@@ -415,12 +439,13 @@ func (m *Model) runCommandsWithTrust(cmds []string, cwd string, env map[string]s
 	}
 
 	if trustMode == "always" || status == security.TrustStatusTrusted {
-		return m.runCommands(cmds, cwd, env, after)
+		return m.runCommands(cmds, parallel, cwd, env, after)
 	}
 
 	// TOFU: prompt user
 	if trustPath != "" {
 		m.pending.Commands = cmds
+		m.pending.CommandsParallel = parallel
 		m.pending.CommandEnv = env
 		m.pending.CommandCwd = cwd
 		m.pending.After = after
@@ -430,7 +455,7 @@ func (m *Model) runCommandsWithTrust(cmds []string, cwd string, env map[string]s
 			if m.pending.TrustPath != "" {
 				_ = m.state.services.trustManager.TrustFile(m.pending.TrustPath)
 			}
-			cmd := m.runCommands(m.pending.Commands, m.pending.CommandCwd, m.pending.CommandEnv, m.pending.After)
+			cmd := m.runCommands(m.pending.Commands, m.pending.CommandsParallel, m.pending.CommandCwd, m.pending.CommandEnv, m.pending.After)
 			m.clearPendingTrust()
 			return cmd
 		}
@@ -451,9 +476,13 @@ func (m *Model) runCommandsWithTrust(cmds []string, cwd string, env map[string]s
 	return nil
 }
 
-func (m *Model) runCommands(cmds []string, cwd string, env map[string]string, after func() tea.Msg) tea.Cmd {
+func (m *Model) runCommands(cmds []string, parallel bool, cwd string, env map[string]string, after func() tea.Msg) tea.Cmd {
+	execute := m.state.services.git.ExecuteCommands
+	if parallel {
+		execute = m.state.services.git.ExecuteCommandsParallel
+	}
 	return func() tea.Msg {
-		if err := m.state.services.git.ExecuteCommands(m.ctx, cmds, cwd, env); err != nil {
+		if err := execute(m.ctx, cmds, cwd, env); err != nil {
 			// Still refresh UI even if commands failed, so user sees current state
 			if after != nil {
 				return after()
@@ -469,20 +498,48 @@ func (m *Model) runCommands(cmds []string, cwd string, env map[string]string, af
 
 func (m *Model) clearPendingTrust() {
 	m.pending.Commands = nil
+	m.pending.CommandsParallel = false
 	m.pending.CommandEnv = nil
 	m.pending.CommandCwd = ""
 	m.pending.After = nil
 	m.pending.TrustPath = ""
 }
 
+// fileStamp identifies a version of a file by modification time and size.
+// The zero value stands for a missing file.
+type fileStamp struct {
+	modTime time.Time
+	size    int64
+}
+
+func statFileStamp(path string) fileStamp {
+	info, err := os.Stat(path)
+	if err != nil {
+		return fileStamp{}
+	}
+	return fileStamp{modTime: info.ModTime(), size: info.Size()}
+}
+
+func (s fileStamp) equal(other fileStamp) bool {
+	return s.size == other.size && s.modTime.Equal(other.modTime)
+}
+
+// ensureRepoConfig loads the repository .wt file, parsing it again only when
+// the file changed since the last load.
 func (m *Model) ensureRepoConfig() {
-	if m.repoConfig != nil || m.repoConfigPath != "" {
+	if m.repoConfigPath != "" {
+		if statFileStamp(m.repoConfigPath).equal(m.repoConfigStamp) {
+			return
+		}
+	} else if m.repoConfig != nil {
 		return
 	}
 	mainPath := m.getMainWorktreePath()
 	if mainPath == "" {
 		mainPath = m.state.services.git.GetMainWorktreePath(m.ctx)
 	}
+	// Stamp before reading so a write racing the load triggers another one.
+	stamp := statFileStamp(filepath.Join(mainPath, ".wt"))
 	repoCfg, cfgPath, err := config.LoadRepoConfig(mainPath)
 	if err != nil {
 		m.showInfo(fmt.Sprintf("Failed to load .wt: %v", err), nil)
@@ -490,4 +547,5 @@ func (m *Model) ensureRepoConfig() {
 	}
 	m.repoConfigPath = cfgPath
 	m.repoConfig = repoCfg
+	m.repoConfigStamp = stamp
 }
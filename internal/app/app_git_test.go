@@ -429,3 +429,34 @@ func TestCollectInitTerminateCommands(t *testing.T) {
 		t.Fatalf("unexpected terminate commands: %v", termCmds)
 	}
 }
+
+func TestEnsureRepoConfigReloadsOnlyWhenFileChanges(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	mainPath := t.TempDir()
+	m.state.data.worktrees = []*models.WorktreeInfo{{Path: mainPath, IsMain: true}}
+	wtFile := filepath.Join(mainPath, ".wt")
+	if err := os.WriteFile(wtFile, []byte("init_commands:\n  - echo one\n"), 0o600); err != nil {
+		t.Fatalf("write .wt: %v", err)
+	}
+
+	m.ensureRepoConfig()
+	if m.repoConfig == nil || len(m.repoConfig.InitCommands) != 1 {
+		t.Fatalf("expected .wt to be loaded, got %+v", m.repoConfig)
+	}
+	loaded := m.repoConfig
+
+	m.ensureRepoConfig()
+	if m.repoConfig != loaded {
+		t.Fatal("expected unchanged .wt to reuse the loaded config")
+	}
+
+	if err := os.WriteFile(wtFile, []byte("init_commands:\n  - echo one\n  - echo two\n"), 0o600); err != nil {
+		t.Fatalf("rewrite .wt: %v", err)
+	}
+	m.ensureRepoConfig()
+	if m.repoConfig == loaded || len(m.repoConfig.InitCommands) != 2 {
+		t.Fatalf("expected modified .wt to be reloaded, got %+v", m.repoConfig)
+	}
+}
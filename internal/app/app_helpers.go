@@ -11,6 +11,7 @@ import (
 	appscreen "github.com/chmouel/lazyworktree/internal/app/screen"
 	"github.com/chmouel/lazyworktree/internal/app/services"
 	"github.com/chmouel/lazyworktree/internal/app/util"
+	"github.com/chmouel/lazyworktree/internal/git"
 	log "github.com/chmouel/lazyworktree/internal/log"
 	"github.com/chmouel/lazyworktree/internal/models"
 )
@@ -97,6 +98,23 @@ func parseCommitMeta(raw string) commitMeta {
 	}
 }
 
+// commitMetaFormat is the pretty format parsed by parseCommitMeta.
+const commitMetaFormat = "%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b"
+
+// gitDefaultDateLayout is git's default date format, as printed by %ad.
+const gitDefaultDateLayout = "Mon Jan 2 15:04:05 2006 -0700"
+
+func commitMetaFromObject(commit *git.CommitObject) commitMeta {
+	return commitMeta{
+		sha:     commit.SHA,
+		author:  commit.AuthorName,
+		email:   commit.AuthorEmail,
+		date:    commit.AuthorDate.Format(gitDefaultDateLayout),
+		subject: commit.Subject,
+		body:    strings.Split(commit.Body, "\n"),
+	}
+}
+
 func sanitizePRURL(raw string) (string, error) {
 	return util.SanitizePRURL(raw)
 }
@@ -119,9 +137,9 @@ func filterNonEmpty(values []string) []string {
 
 // loadCache loads worktree data from the cache file.
 func (m *Model) loadCache() tea.Cmd {
+	repoKey, worktreeDir := m.getRepoKey(), m.getWorktreeDir()
 	return func() tea.Msg {
-		repoKey := m.getRepoKey()
-		worktrees, err := services.LoadCache(repoKey, m.getWorktreeDir())
+		worktrees, err := services.LoadCache(repoKey, worktreeDir)
 		if err != nil {
 			return errMsg{err: err}
 		}
@@ -135,11 +153,14 @@ func (m *Model) loadCache() tea.Cmd {
 // saveCache saves worktree data to the cache file.
 // Only valid git worktrees are saved to prevent stale entries.
 func (m *Model) saveCache() {
-	repoKey := m.getRepoKey()
+	repoKey := m.repoKey
+	if repoKey == "" {
+		return
+	}
 
 	// Filter to only valid git worktrees before saving
 	// If validPaths is nil, git service is unavailable - save all worktrees
-	validPaths := m.getValidWorktreePaths()
+	validPaths := m.getValidWorktreePaths(git.WorktreeListTTL)
 	var validWorktrees []*models.WorktreeInfo
 	if validPaths == nil {
 		validWorktrees = m.state.data.worktrees
@@ -157,6 +178,33 @@ func (m *Model) saveCache() {
 	}
 }
 
+// saveCacheCmd writes the worktree cache off the update loop. The listed
+// worktrees are what git last reported, so unlike saveCache they are not
+// checked against a fresh listing. They are copied here because the update
+// loop keeps modifying them while the file is written.
+func (m *Model) saveCacheCmd() tea.Cmd {
+	repoKey := m.repoKey
+	if repoKey == "" {
+		return nil
+	}
+	worktreeDir := m.getWorktreeDir()
+	snapshot := make([]*models.WorktreeInfo, len(m.state.data.worktrees))
+	for i, wt := range m.state.data.worktrees {
+		wtCopy := *wt
+		if wt.PR != nil {
+			pr := *wt.PR
+			wtCopy.PR = &pr
+		}
+		snapshot[i] = &wtCopy
+	}
+	return func() tea.Msg {
+		if err := services.SaveCache(repoKey, worktreeDir, snapshot); err != nil {
+			return errMsg{err: fmt.Errorf("failed to write cache: %w", err)}
+		}
+		return nil
+	}
+}
+
 func (m *Model) newLoadingScreen(message string) *appscreen.LoadingScreen {
 	operation := appscreen.TipOperationFromContext(m.loadingOperation, message)
 	return appscreen.NewLoadingScreen(message, operation, m.theme, spinnerFrameSet(m.config.IconsEnabled()), m.config.IconsEnabled())
@@ -200,7 +248,10 @@ func (m *Model) loadCommandHistory() {
 
 // saveCommandHistory saves command history to file.
 func (m *Model) saveCommandHistory() {
-	if err := services.SaveCommandHistory(m.getRepoKey(), m.getWorktreeDir(), m.commandHistory); err != nil {
+	if m.repoKey == "" {
+		return
+	}
+	if err := services.SaveCommandHistory(m.repoKey, m.getWorktreeDir(), m.commandHistory); err != nil {
 		m.debugf("failed to write command history: %v", err)
 	}
 }
@@ -246,7 +297,10 @@ func (m *Model) loadAccessHistory() {
 
 // saveAccessHistory saves access history to file.
 func (m *Model) saveAccessHistory() {
-	if err := services.SaveAccessHistory(m.getRepoKey(), m.getWorktreeDir(), m.state.data.accessHistory); err != nil {
+	if m.repoKey == "" {
+		return
+	}
+	if err := services.SaveAccessHistory(m.repoKey, m.getWorktreeDir(), m.state.data.accessHistory); err != nil {
 		m.debugf("failed to write access history: %v", err)
 	}
 }
@@ -265,7 +319,10 @@ func (m *Model) loadPaletteHistory() {
 
 // savePaletteHistory saves palette usage history to file.
 func (m *Model) savePaletteHistory() {
-	if err := services.SavePaletteHistory(m.getRepoKey(), m.getWorktreeDir(), m.paletteHistory); err != nil {
+	if m.repoKey == "" {
+		return
+	}
+	if err := services.SavePaletteHistory(m.repoKey, m.getWorktreeDir(), m.paletteHistory); err != nil {
 		m.debugf("failed to write palette history: %v", err)
 	}
 }
@@ -321,14 +378,43 @@ func (m *Model) recordAccess(path string) {
 	m.saveAccessHistory()
 }
 
+// resolveRepoKey resolves the repo key off the update loop; resolution may
+// shell out to git, gh or glab. The key is stored on the model when the
+// message is handled, so m.repoKey is only ever written by the update loop.
+func (m *Model) resolveRepoKey() tea.Cmd {
+	ctx, git := m.ctx, m.state.services.git
+	return func() tea.Msg {
+		return repoKeyResolvedMsg{key: git.ResolveRepoName(ctx)}
+	}
+}
+
+// getRepoKey returns the repo key, asking the git service for it while the
+// startup resolution is still pending. The service memoises the name, so the
+// fallback only waits on a resolution that is already running. Code on the
+// update loop that merely persists state reads m.repoKey instead and skips
+// persisting until the key is known.
 func (m *Model) getRepoKey() string {
 	if m.repoKey != "" {
 		return m.repoKey
 	}
-	m.repoKeyOnce.Do(func() {
-		m.repoKey = m.state.services.git.ResolveRepoName(m.ctx)
-	})
-	return m.repoKey
+	return m.state.services.git.ResolveRepoName(m.ctx)
+}
+
+// worktreeByPath returns the loaded worktree at path, or nil. The path index
+// is rebuilt lazily whenever the worktree list is replaced.
+func (m *Model) worktreeByPath(path string) *models.WorktreeInfo {
+	wts := m.state.data.worktrees
+	if len(wts) == 0 {
+		return nil
+	}
+	if len(m.cache.worktreeIndex) != len(wts) || m.cache.worktreeIndexHead != &wts[0] {
+		m.cache.worktreeIndex = make(map[string]*models.WorktreeInfo, len(wts))
+		for _, wt := range wts {
+			m.cache.worktreeIndex[wt.Path] = wt
+		}
+		m.cache.worktreeIndexHead = &wts[0]
+	}
+	return m.cache.worktreeIndex[path]
 }
 
 func (m *Model) getMainWorktreePath() string {
@@ -367,15 +453,15 @@ func normalizePath(path string) string {
 }
 
 // getValidWorktreePaths returns a set of paths that git recognizes as valid worktrees.
+// A listing younger than maxAge, such as the one the last refresh made, is
+// reused; pass 0 when the worktrees may have just changed.
 // Returns nil if git service is unavailable or no worktrees found (allows bypass of validation).
-func (m *Model) getValidWorktreePaths() map[string]bool {
+func (m *Model) getValidWorktreePaths(maxAge time.Duration) map[string]bool {
 	if m.state.services.git == nil {
 		return nil
 	}
 
-	raw := m.state.services.git.RunGit(m.ctx,
-		[]string{"git", "worktree", "list", "--porcelain"},
-		"", []int{0}, true, false)
+	raw := m.state.services.git.RecentWorktreeList(m.ctx, maxAge)
 
 	if raw == "" {
 		return nil
@@ -400,7 +486,7 @@ func (m *Model) getValidWorktreePaths() map[string]bool {
 // but are not registered with git worktree.
 func (m *Model) findOrphanedWorktreeDirs() []string {
 	repoWorktreeDir := m.getRepoWorktreeDir()
-	validPaths := m.getValidWorktreePaths()
+	validPaths := m.getValidWorktreePaths(0)
 
 	// If validPaths is nil, git service is unavailable - can't determine orphans
 	if validPaths == nil {
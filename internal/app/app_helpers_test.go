@@ -1,12 +1,15 @@
 package app
 
 import (
+	"context"
 	"os"
+	"os/exec"
 	"path/filepath"
 	"reflect"
 	"runtime"
 	"testing"
 
+	"github.com/chmouel/lazyworktree/internal/app/services"
 	"github.com/chmouel/lazyworktree/internal/config"
 	"github.com/chmouel/lazyworktree/internal/models"
 )
@@ -418,3 +421,100 @@ func containsHelper(s, substr string) bool {
 	}
 	return false
 }
+
+func TestWorktreeByPathFollowsReplacedList(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	first := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "first")}
+	m.state.data.worktrees = []*models.WorktreeInfo{first}
+	if got := m.worktreeByPath(first.Path); got != first {
+		t.Fatalf("expected first worktree, got %v", got)
+	}
+
+	second := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "second")}
+	m.state.data.worktrees = []*models.WorktreeInfo{second}
+	if got := m.worktreeByPath(first.Path); got != nil {
+		t.Fatalf("expected stale path to miss, got %v", got)
+	}
+	if got := m.worktreeByPath(second.Path); got != second {
+		t.Fatalf("expected second worktree, got %v", got)
+	}
+}
+
+func TestPRDataLoadedPersistsToCache(t *testing.T) {
+	tempDir := t.TempDir()
+	cfg := &config.AppConfig{WorktreeDir: tempDir}
+	m := NewModel(cfg, "")
+	m.repoKey = "test-repo"
+
+	spawned := 0
+	m.state.services.git.SetCommandRunner(func(_ context.Context, _ string, _ ...string) *exec.Cmd {
+		spawned++
+		return exec.Command("false")
+	})
+	wtPath := filepath.Join(tempDir, "wt1")
+	m.state.data.worktrees = []*models.WorktreeInfo{{Path: wtPath, Branch: "feature"}}
+
+	_, cmd := m.handlePRDataLoaded(prDataLoadedMsg{
+		prMap: map[string]*models.PRInfo{"feature": {Number: 42, State: "OPEN", Title: "Cached PR"}},
+	})
+	if cmd == nil {
+		t.Fatal("expected a command writing the cache")
+	}
+	if spawned != 0 {
+		t.Fatalf("expected no git call on the update loop, got %d", spawned)
+	}
+	// Changes made after the handler returns are not part of the write.
+	m.state.data.worktrees[0].PR.Number = 7
+	if msg := cmd(); msg != nil {
+		t.Fatalf("expected the cache to be written, got %v", msg)
+	}
+
+	cached, err := services.LoadCache("test-repo", tempDir)
+	if err != nil {
+		t.Fatalf("failed to load cache: %v", err)
+	}
+	if len(cached) != 1 || cached[0].PR == nil || cached[0].PR.Number != 42 {
+		t.Fatalf("expected PR #42 to be persisted, got %+v", cached)
+	}
+}
+
+func TestRepoKeyResolvedLoadsHistoryForListedWorktrees(t *testing.T) {
+	tempDir := t.TempDir()
+	cfg := &config.AppConfig{WorktreeDir: tempDir}
+	m := NewModel(cfg, "")
+
+	wtPath := filepath.Join(tempDir, "wt1")
+	if err := services.SaveAccessHistory("test-repo", tempDir, map[string]int64{wtPath: 1234}); err != nil {
+		t.Fatalf("failed to save access history: %v", err)
+	}
+	m.state.data.worktrees = []*models.WorktreeInfo{{Path: wtPath, Branch: "feature"}}
+
+	_, cmd := m.Update(repoKeyResolvedMsg{key: "test-repo"})
+	if cmd == nil {
+		t.Fatal("expected the worktree cache to be loaded")
+	}
+	if m.repoKey != "test-repo" {
+		t.Fatalf("expected the resolved key to be stored, got %q", m.repoKey)
+	}
+	if got := m.state.data.worktrees[0].LastSwitchedTS; got != 1234 {
+		t.Fatalf("expected LastSwitchedTS 1234, got %d", got)
+	}
+}
+
+func TestSaveCacheWaitsForRepoKey(t *testing.T) {
+	tempDir := t.TempDir()
+	cfg := &config.AppConfig{WorktreeDir: tempDir}
+	m := NewModel(cfg, "")
+	m.state.data.worktrees = []*models.WorktreeInfo{{Path: filepath.Join(tempDir, "wt1"), Branch: "feature"}}
+
+	m.saveCache()
+	entries, err := os.ReadDir(tempDir)
+	if err != nil {
+		t.Fatalf("failed to read worktree dir: %v", err)
+	}
+	if len(entries) != 0 {
+		t.Fatalf("expected nothing to be persisted before the repo key is known, got %d entries", len(entries))
+	}
+}
@@ -1,16 +1,18 @@
 package app
 
 import (
+	"cmp"
 	"context"
 	"fmt"
 	"path/filepath"
-	"sort"
+	"slices"
 	"strings"
 	"time"
 
 	"github.com/charmbracelet/bubbles/table"
 	"github.com/charmbracelet/bubbles/textinput"
 	tea "github.com/charmbracelet/bubbletea"
+	"github.com/chmouel/lazyworktree/internal/app/services"
 	"github.com/chmouel/lazyworktree/internal/models"
 )
 
@@ -117,55 +119,63 @@ func (m *Model) startFilter(target filterTarget) tea.Cmd {
 	return textinput.Blink
 }
 
+// worktreeSortKey holds the columns worktrees are ordered by, copied out of
+// the WorktreeInfo structs so a sort compares contiguous keys instead of
+// chasing two pointers per comparison.
+type worktreeSortKey struct {
+	ts   int64
+	path string
+	wt   *models.WorktreeInfo
+}
+
 func sortWorktrees(wts []*models.WorktreeInfo, mode int) {
+	var sortTS func(wt *models.WorktreeInfo) int64
 	switch mode {
 	case sortModeLastActive:
-		sort.SliceStable(wts, func(i, j int) bool {
-			ti, tj := wts[i].LastActiveTS, wts[j].LastActiveTS
-			if ti != tj {
-				return ti > tj
-			}
-			return wts[i].Path < wts[j].Path
-		})
+		sortTS = func(wt *models.WorktreeInfo) int64 { return wt.LastActiveTS }
 	case sortModeLastSwitched:
-		sort.SliceStable(wts, func(i, j int) bool {
-			ti, tj := wts[i].LastSwitchedTS, wts[j].LastSwitchedTS
-			if ti != tj {
-				return ti > tj
-			}
-			return wts[i].Path < wts[j].Path
-		})
+		sortTS = func(wt *models.WorktreeInfo) int64 { return wt.LastSwitchedTS }
 	default: // sortModePath
-		sort.SliceStable(wts, func(i, j int) bool {
-			return wts[i].Path < wts[j].Path
-		})
+		sortTS = func(*models.WorktreeInfo) int64 { return 0 }
+	}
+	// Most recent first, then by path.
+	compare := func(a, b worktreeSortKey) int {
+		if c := cmp.Compare(b.ts, a.ts); c != 0 {
+			return c
+		}
+		return strings.Compare(a.path, b.path)
+	}
+
+	// Worktrees arrive from git already ordered by last activity, so the
+	// common case is a linear check with no sorting.
+	if slices.IsSortedFunc(wts, func(a, b *models.WorktreeInfo) int {
+		return compare(worktreeSortKey{ts: sortTS(a), path: a.Path}, worktreeSortKey{ts: sortTS(b), path: b.Path})
+	}) {
+		return
+	}
+
+	keys := make([]worktreeSortKey, len(wts))
+	for i, wt := range wts {
+		keys[i] = worktreeSortKey{ts: sortTS(wt), path: wt.Path, wt: wt}
+	}
+	slices.SortStableFunc(keys, compare)
+	for i, key := range keys {
+		wts[i] = key.wt
 	}
 }
 
 func (m *Model) updateTable() {
 	// Filter worktrees
 	query := strings.ToLower(strings.TrimSpace(m.state.services.filter.FilterQuery))
-	m.state.data.filteredWts = []*models.WorktreeInfo{}
+	m.state.data.filteredWts = make([]*models.WorktreeInfo, 0, len(m.state.data.worktrees))
 
 	if query == "" {
-		m.state.data.filteredWts = make([]*models.WorktreeInfo, len(m.state.data.worktrees))
-		copy(m.state.data.filteredWts, m.state.data.worktrees)
+		m.state.data.filteredWts = append(m.state.data.filteredWts, m.state.data.worktrees...)
 	} else {
 		hasPathSep := strings.Contains(query, "/")
 		for _, wt := range m.state.data.worktrees {
-			name := filepath.Base(wt.Path)
-			if wt.IsMain {
-				name = mainWorktreeName
-			}
-			haystacks := []string{strings.ToLower(name), strings.ToLower(wt.Branch)}
-			if hasPathSep {
-				haystacks = append(haystacks, strings.ToLower(wt.Path))
-			}
-			for _, haystack := range haystacks {
-				if strings.Contains(haystack, query) {
-					m.state.data.filteredWts = append(m.state.data.filteredWts, wt)
-					break
-				}
+			if m.worktreeHaystack(wt).matches(query, hasPathSep) {
+				m.state.data.filteredWts = append(m.state.data.filteredWts, wt)
 			}
 		}
 	}
@@ -174,66 +184,149 @@ func (m *Model) updateTable() {
 
 	// Update table rows
 	showIcons := m.config.IconsEnabled()
+	// Only include PR column if PR data has been loaded and PR is not disabled
+	prColumn := m.prDataLoaded && !m.config.DisablePR
 	rows := make([]table.Row, 0, len(m.state.data.filteredWts))
 	for _, wt := range m.state.data.filteredWts {
-		name := filepath.Base(wt.Path)
-		worktreeIcon := UIIconWorktree
-		if wt.IsMain {
-			worktreeIcon = UIIconWorktreeMain
-			name = mainWorktreeName
-		}
-		if showIcons {
-			name = iconPrefix(worktreeIcon, showIcons) + name
-		} else {
-			name = " " + name
-		}
+		// Rows are copied since the arrow marker is written into them.
+		rows = append(rows, slices.Clone(m.worktreeRowCells(wt, showIcons, prColumn)))
+	}
 
-		// Truncate to configured max length with ellipsis if needed
-		if m.config.MaxNameLength > 0 {
-			nameRunes := []rune(name)
-			if len(nameRunes) > m.config.MaxNameLength {
-				name = string(nameRunes[:m.config.MaxNameLength]) + "..."
-			}
-		}
-		statusStr := combinedStatusIndicator(wt.Dirty, wt.HasUpstream, wt.Ahead, wt.Behind, wt.Unpushed, showIcons, m.config.IconSet)
+	cursor := min(max(m.state.ui.worktreeTable.Cursor(), 0), len(rows)-1)
+	markWorktreeArrow(rows, cursor)
 
-		row := table.Row{
-			name,
-			statusStr,
-			wt.LastActive,
-		}
+	// Filter keystrokes often keep the same result set; leave the table
+	// untouched then instead of re-rendering every row.
+	if !tableRowsEqual(m.state.ui.worktreeTable.Rows(), rows) {
+		m.state.ui.worktreeTable.SetRows(rows)
+	}
+	if len(m.state.data.filteredWts) > 0 {
+		m.state.data.selectedIndex = cursor
+		m.state.ui.worktreeTable.SetCursor(cursor)
+	}
+}
 
-		// Only include PR column if PR data has been loaded and PR is not disabled
-		if m.prDataLoaded && !m.config.DisablePR {
-			prStr := "-"
-			if wt.PR != nil && !wt.IsMain {
-				prIcon := ""
-				if showIcons {
-					prIcon = iconWithSpace(getIconPR())
-				}
-				stateSymbol := prStateIndicator(wt.PR.State, showIcons)
-				// Right-align PR numbers for consistent column width
-				prStr = fmt.Sprintf("%s#%-5d%s", prIcon, wt.PR.Number, stateSymbol)
-			}
-			row = append(row, prStr)
+// worktreeRowKey captures every input that affects a worktree's table row.
+type worktreeRowKey struct {
+	path          string
+	isMain        bool
+	dirty         bool
+	hasUpstream   bool
+	ahead         int
+	behind        int
+	unpushed      int
+	lastActive    string
+	hasPR         bool
+	prNumber      int
+	prState       string
+	showIcons     bool
+	iconSet       string
+	maxNameLength int
+	prColumn      bool
+}
+
+type worktreeRowCache struct {
+	key worktreeRowKey
+	row table.Row
+}
+
+// worktreeRowCells returns the table cells for wt, rebuilding them only when
+// one of the inputs in worktreeRowKey changed since the last call.
+func (m *Model) worktreeRowCells(wt *models.WorktreeInfo, showIcons, prColumn bool) table.Row {
+	key := worktreeRowKey{
+		path:          wt.Path,
+		isMain:        wt.IsMain,
+		dirty:         wt.Dirty,
+		hasUpstream:   wt.HasUpstream,
+		ahead:         wt.Ahead,
+		behind:        wt.Behind,
+		unpushed:      wt.Unpushed,
+		lastActive:    wt.LastActive,
+		hasPR:         wt.PR != nil,
+		showIcons:     showIcons,
+		iconSet:       m.config.IconSet,
+		maxNameLength: m.config.MaxNameLength,
+		prColumn:      prColumn,
+	}
+	if wt.PR != nil {
+		key.prNumber = wt.PR.Number
+		key.prState = wt.PR.State
+	}
+	if cached, ok := m.cache.rowCells[wt]; ok && cached.key == key {
+		return cached.row
+	}
+	if m.cache.rowCells == nil || len(m.cache.rowCells) > 2*len(m.state.data.worktrees) {
+		// Drop entries left behind by replaced worktree lists.
+		m.cache.rowCells = make(map[*models.WorktreeInfo]*worktreeRowCache, len(m.state.data.worktrees))
+	}
+
+	name := filepath.Base(wt.Path)
+	worktreeIcon := UIIconWorktree
+	if wt.IsMain {
+		worktreeIcon = UIIconWorktreeMain
+		name = mainWorktreeName
+	}
+	if showIcons {
+		name = iconPrefix(worktreeIcon, showIcons) + name
+	} else {
+		name = " " + name
+	}
+
+	// Truncate to configured max length with ellipsis if needed
+	if m.config.MaxNameLength > 0 {
+		nameRunes := []rune(name)
+		if len(nameRunes) > m.config.MaxNameLength {
+			name = string(nameRunes[:m.config.MaxNameLength]) + "..."
 		}
+	}
+	statusStr := combinedStatusIndicator(wt.Dirty, wt.HasUpstream, wt.Ahead, wt.Behind, wt.Unpushed, showIcons, m.config.IconSet)
 
-		rows = append(rows, row)
+	row := table.Row{
+		name,
+		statusStr,
+		wt.LastActive,
 	}
 
-	m.state.ui.worktreeTable.SetRows(rows)
-	if len(m.state.data.filteredWts) > 0 && m.state.data.selectedIndex >= len(m.state.data.filteredWts) {
-		m.state.data.selectedIndex = len(m.state.data.filteredWts) - 1
+	if prColumn {
+		prStr := "-"
+		if wt.PR != nil && !wt.IsMain {
+			prIcon := ""
+			if showIcons {
+				prIcon = iconWithSpace(getIconPR())
+			}
+			stateSymbol := prStateIndicator(wt.PR.State, showIcons)
+			// Right-align PR numbers for consistent column width
+			prStr = fmt.Sprintf("%s#%-5d%s", prIcon, wt.PR.Number, stateSymbol)
+		}
+		row = append(row, prStr)
 	}
-	if len(m.state.data.filteredWts) > 0 {
-		cursor := max(m.state.ui.worktreeTable.Cursor(), 0)
-		if cursor >= len(m.state.data.filteredWts) {
-			cursor = len(m.state.data.filteredWts) - 1
+
+	m.cache.rowCells[wt] = &worktreeRowCache{key: key, row: row}
+	return row
+}
+
+// tableRowsEqual reports whether two sets of table rows render identically.
+func tableRowsEqual(a, b []table.Row) bool {
+	return slices.EqualFunc(a, b, func(x, y table.Row) bool {
+		return slices.Equal(x, y)
+	})
+}
+
+// markWorktreeArrow replaces the first rune of each row's name with the
+// selection arrow for the cursor row and a space for the others.
+func markWorktreeArrow(rows []table.Row, cursor int) {
+	for i, row := range rows {
+		if len(row) == 0 || row[0] == "" {
+			continue
 		}
-		m.state.data.selectedIndex = cursor
-		m.state.ui.worktreeTable.SetCursor(cursor)
+		runes := []rune(row[0])
+		if i == cursor {
+			runes[0] = '›'
+		} else {
+			runes[0] = ' '
+		}
+		row[0] = string(runes)
 	}
-	m.updateWorktreeArrows()
 }
 
 func (m *Model) syncSelectedIndexFromCursor() {
@@ -248,21 +341,7 @@ func (m *Model) syncSelectedIndexFromCursor() {
 // updateWorktreeArrows updates the arrow indicator on the selected row.
 func (m *Model) updateWorktreeArrows() {
 	rows := m.state.ui.worktreeTable.Rows()
-	cursor := m.state.ui.worktreeTable.Cursor()
-	for i, row := range rows {
-		if len(row) > 0 && row[0] != "" {
-			runes := []rune(row[0])
-			if len(runes) > 0 {
-				// Replace first rune with arrow or space
-				if i == cursor {
-					runes[0] = '›'
-				} else {
-					runes[0] = ' '
-				}
-				rows[i][0] = string(runes)
-			}
-		}
-	}
+	markWorktreeArrow(rows, m.state.ui.worktreeTable.Cursor())
 	m.state.ui.worktreeTable.SetRows(rows)
 }
 
@@ -307,15 +386,46 @@ func (m *Model) updateDetailsView() tea.Cmd {
 				isUnmerged:     unmerged[sha],
 			})
 		}
+		statusFiles := parseStatusFiles(statusRaw)
 		return statusUpdatedMsg{
 			info:        m.buildInfoContent(wt),
-			statusFiles: parseStatusFiles(statusRaw),
+			statusFiles: statusFiles,
+			statusTree:  services.BuildStatusTree(statusFiles),
 			log:         logEntries,
 			path:        wt.Path,
 		}
 	}
 }
 
+// requestDetails loads the details of the selected worktree for a cursor
+// move. While an earlier load is still running it only marks the details as
+// stale, and the load is repeated for the then-selected worktree once the
+// running one returns, so scrolling never has more than one set of git
+// processes in flight.
+func (m *Model) requestDetails() tea.Cmd {
+	if m.detailsInFlight {
+		m.detailsStale = true
+		return nil
+	}
+	cmd := m.updateDetailsView()
+	if cmd == nil {
+		return nil
+	}
+	// Tag the result so only this load, and not a refresh finishing in the
+	// meantime, releases the slot.
+	m.detailsInFlight = true
+	m.detailsRequest++
+	request := m.detailsRequest
+	return func() tea.Msg {
+		msg := cmd()
+		if status, ok := msg.(statusUpdatedMsg); ok {
+			status.request = request
+			return status
+		}
+		return msg
+	}
+}
+
 func (m *Model) debouncedUpdateDetailsView() tea.Cmd {
 	// Cancel any existing pending detail update
 	if m.detailUpdateCancel != nil {
@@ -327,6 +437,17 @@ func (m *Model) debouncedUpdateDetailsView() tea.Cmd {
 	m.pendingDetailsIndex = m.state.ui.worktreeTable.Cursor()
 	selectedIndex := m.pendingDetailsIndex
 
+	// A lone cursor move updates the details straight away; only moves
+	// arriving within debounceDelay of the previous one are coalesced.
+	now := time.Now()
+	burst := now.Sub(m.lastDetailsRequestAt) < debounceDelay
+	m.lastDetailsRequestAt = now
+	if !burst {
+		return func() tea.Msg {
+			return debouncedDetailsMsg{selectedIndex: selectedIndex}
+		}
+	}
+
 	ctx, cancel := context.WithCancel(context.Background())
 	m.detailUpdateCancel = cancel
 
@@ -345,13 +466,90 @@ func (m *Model) debouncedUpdateDetailsView() tea.Cmd {
 	}
 }
 
+// debouncedUpdateTable applies the worktree filter after a keystroke. A lone
+// keystroke filters straight away; keystrokes arriving within debounceDelay
+// of the previous one are coalesced into a single table rebuild.
+func (m *Model) debouncedUpdateTable() tea.Cmd {
+	if m.filterUpdateCancel != nil {
+		m.filterUpdateCancel()
+		m.filterUpdateCancel = nil
+	}
+
+	now := time.Now()
+	burst := now.Sub(m.lastFilterKeyAt) < debounceDelay
+	m.lastFilterKeyAt = now
+	if !burst {
+		m.updateTable()
+		return nil
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	m.filterUpdateCancel = cancel
+
+	return func() tea.Msg {
+		timer := time.NewTimer(debounceDelay)
+		defer timer.Stop()
+
+		select {
+		case <-ctx.Done():
+			return nil
+		case <-timer.C:
+		}
+		return debouncedFilterMsg{}
+	}
+}
+
+// flushFilterUpdate applies a pending debounced filter update immediately.
+func (m *Model) flushFilterUpdate() {
+	if m.filterUpdateCancel == nil {
+		return
+	}
+	m.filterUpdateCancel()
+	m.filterUpdateCancel = nil
+	m.updateTable()
+}
+
 func (m *Model) refreshWorktrees() tea.Cmd {
+	if len(m.state.data.worktrees) > 0 {
+		return func() tea.Msg {
+			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
+			return worktreesLoadedMsg{
+				worktrees: worktrees,
+				err:       err,
+			}
+		}
+	}
+
+	// Nothing is listed yet, so show each worktree as soon as its status is
+	// known instead of waiting for the slowest one.
+	ctx := m.ctx
 	return func() tea.Msg {
-		worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
-		return worktreesLoadedMsg{
-			worktrees: worktrees,
-			err:       err,
+		updates := make(chan tea.Msg)
+		go func() {
+			defer close(updates)
+			send := func(msg tea.Msg) {
+				select {
+				case updates <- msg:
+				case <-ctx.Done():
+				}
+			}
+			worktrees, err := m.state.services.git.GetWorktreesWithProgress(ctx, func(wt models.WorktreeInfo) {
+				send(worktreeProbedMsg{worktree: &wt, next: updates})
+			})
+			send(worktreesLoadedMsg{worktrees: worktrees, err: err})
+		}()
+		return <-updates
+	}
+}
+
+// waitForWorktreeUpdate reads the next message of a streamed worktree listing.
+func waitForWorktreeUpdate(updates <-chan tea.Msg) tea.Cmd {
+	return func() tea.Msg {
+		msg, ok := <-updates
+		if !ok {
+			return nil
 		}
+		return msg
 	}
 }
 
@@ -389,21 +587,57 @@ func (m *Model) findWorktreeMatchIndex(query string, start int, forward bool) in
 	}
 	hasPathSep := strings.Contains(lowerQuery, "/")
 	return findMatchIndex(len(m.state.data.filteredWts), start, forward, func(i int) bool {
-		wt := m.state.data.filteredWts[i]
-		name := filepath.Base(wt.Path)
-		if wt.IsMain {
-			name = mainWorktreeName
-		}
-		if strings.Contains(strings.ToLower(name), lowerQuery) {
-			return true
-		}
-		if strings.Contains(strings.ToLower(wt.Branch), lowerQuery) {
-			return true
-		}
-		return hasPathSep && strings.Contains(strings.ToLower(wt.Path), lowerQuery)
+		return m.worktreeHaystack(m.state.data.filteredWts[i]).matches(lowerQuery, hasPathSep)
 	})
 }
 
+// worktreeHaystack holds the lowercased strings a worktree is filtered on,
+// along with the values they were derived from.
+type worktreeHaystack struct {
+	path   string
+	branch string
+	isMain bool
+
+	nameLower   string
+	branchLower string
+	pathLower   string
+}
+
+// worktreeHaystack returns the cached filter strings for wt, recomputing them
+// only when its path, branch or main flag changed.
+func (m *Model) worktreeHaystack(wt *models.WorktreeInfo) *worktreeHaystack {
+	if h, ok := m.cache.filterHaystacks[wt]; ok && h.path == wt.Path && h.branch == wt.Branch && h.isMain == wt.IsMain {
+		return h
+	}
+	if m.cache.filterHaystacks == nil || len(m.cache.filterHaystacks) > 2*len(m.state.data.worktrees) {
+		// Drop entries left behind by replaced worktree lists.
+		m.cache.filterHaystacks = make(map[*models.WorktreeInfo]*worktreeHaystack, len(m.state.data.worktrees))
+	}
+
+	name := filepath.Base(wt.Path)
+	if wt.IsMain {
+		name = mainWorktreeName
+	}
+	h := &worktreeHaystack{
+		path:        wt.Path,
+		branch:      wt.Branch,
+		isMain:      wt.IsMain,
+		nameLower:   strings.ToLower(name),
+		branchLower: strings.ToLower(wt.Branch),
+		pathLower:   strings.ToLower(wt.Path),
+	}
+	m.cache.filterHaystacks[wt] = h
+	return h
+}
+
+// matches reports whether the lowercased query appears in the worktree name
+// or branch, or in its path when the query contains a path separator.
+func (h *worktreeHaystack) matches(query string, hasPathSep bool) bool {
+	return strings.Contains(h.nameLower, query) ||
+		strings.Contains(h.branchLower, query) ||
+		(hasPathSep && strings.Contains(h.pathLower, query))
+}
+
 func (m *Model) findStatusMatchIndex(query string, start int, forward bool) int {
 	lowerQuery := strings.ToLower(strings.TrimSpace(query))
 	if lowerQuery == "" {
@@ -6,6 +6,7 @@ import (
 	"testing"
 
 	"github.com/charmbracelet/bubbles/viewport"
+	tea "github.com/charmbracelet/bubbletea"
 	"github.com/chmouel/lazyworktree/internal/config"
 	"github.com/chmouel/lazyworktree/internal/models"
 	"github.com/chmouel/lazyworktree/internal/theme"
@@ -341,3 +342,217 @@ func TestRenderZoomedRightBottomPane(t *testing.T) {
 		t.Error("expected render to contain 'Log' title")
 	}
 }
+
+func TestUpdateTableFilterTracksBranchChanges(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	wt := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "wt1"), Branch: "Feature-Login"}
+	m.state.data.worktrees = []*models.WorktreeInfo{wt}
+
+	m.state.services.filter.FilterQuery = "login"
+	m.updateTable()
+	if len(m.state.data.filteredWts) != 1 {
+		t.Fatalf("expected branch match, got %d worktrees", len(m.state.data.filteredWts))
+	}
+
+	wt.Branch = "bugfix-signup"
+	m.updateTable()
+	if len(m.state.data.filteredWts) != 0 {
+		t.Fatalf("expected renamed branch to stop matching, got %d worktrees", len(m.state.data.filteredWts))
+	}
+
+	m.state.services.filter.FilterQuery = "SIGNUP"
+	m.updateTable()
+	if len(m.state.data.filteredWts) != 1 {
+		t.Fatalf("expected case-insensitive match on new branch, got %d worktrees", len(m.state.data.filteredWts))
+	}
+}
+
+func TestUpdateTableMarksCursorRowOnce(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+	m.state.data.worktrees = []*models.WorktreeInfo{
+		{Path: filepath.Join(cfg.WorktreeDir, "alpha"), Branch: "alpha"},
+		{Path: filepath.Join(cfg.WorktreeDir, "beta"), Branch: "beta"},
+	}
+
+	m.updateTable()
+	rows := m.state.ui.worktreeTable.Rows()
+	if len(rows) != 2 {
+		t.Fatalf("expected 2 rows, got %d", len(rows))
+	}
+	if !strings.HasPrefix(rows[0][0], "›") || !strings.HasPrefix(rows[1][0], " ") {
+		t.Fatalf("expected arrow on cursor row only, got %q and %q", rows[0][0], rows[1][0])
+	}
+
+	m.updateTable()
+	if !tableRowsEqual(rows, m.state.ui.worktreeTable.Rows()) {
+		t.Fatal("expected unchanged rows to be kept as-is")
+	}
+}
+
+func TestDebouncedUpdateDetailsViewCoalescesBursts(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	first := m.debouncedUpdateDetailsView()
+	if _, ok := first().(debouncedDetailsMsg); !ok {
+		t.Fatal("expected an isolated move to update details immediately")
+	}
+
+	burst := m.debouncedUpdateDetailsView()
+	latest := m.debouncedUpdateDetailsView()
+	if msg := burst(); msg != nil {
+		t.Fatalf("expected superseded burst update to be cancelled, got %T", msg)
+	}
+	if _, ok := latest().(debouncedDetailsMsg); !ok {
+		t.Fatal("expected the latest move of a burst to update details")
+	}
+}
+
+func TestRequestDetailsKeepsOneLoadInFlight(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+	m.worktreesLoaded = true
+	wt := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "wt1"), Branch: "feature"}
+	m.state.data.worktrees = []*models.WorktreeInfo{wt}
+	m.state.data.filteredWts = m.state.data.worktrees
+
+	if m.requestDetails() == nil {
+		t.Fatal("expected the first move to load details")
+	}
+	if cmd := m.requestDetails(); cmd != nil {
+		t.Fatal("expected a move during a running load to wait for it")
+	}
+
+	m.Update(statusUpdatedMsg{path: wt.Path})
+	if !m.detailsInFlight || !m.detailsStale {
+		t.Fatal("expected a refresh result to leave the running load in flight")
+	}
+
+	first := m.detailsRequest
+	m.Update(statusUpdatedMsg{path: wt.Path, request: first})
+	if !m.detailsInFlight || m.detailsStale || m.detailsRequest == first {
+		t.Fatal("expected the finished load to start one for the latest selection")
+	}
+
+	m.Update(statusUpdatedMsg{path: wt.Path, request: first})
+	if !m.detailsInFlight {
+		t.Fatal("expected an outdated result to leave the latest load in flight")
+	}
+
+	m.Update(statusUpdatedMsg{path: wt.Path, request: m.detailsRequest})
+	if m.detailsInFlight {
+		t.Fatal("expected no further load once the details are current")
+	}
+}
+
+func TestUpdateTableRebuildsRowCellsOnChange(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+	m.prDataLoaded = true
+	m.updateTableColumns(100)
+
+	wt := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "wt1"), Branch: "feature"}
+	m.state.data.worktrees = []*models.WorktreeInfo{wt}
+
+	m.updateTable()
+	if got := m.state.ui.worktreeTable.Rows()[0][3]; got != "-" {
+		t.Fatalf("expected empty PR cell, got %q", got)
+	}
+
+	wt.PR = &models.PRInfo{Number: 7, State: "OPEN"}
+	wt.Dirty = true
+	m.updateTable()
+	row := m.state.ui.worktreeTable.Rows()[0]
+	if !strings.Contains(row[3], "#7") {
+		t.Fatalf("expected PR cell to be rebuilt, got %q", row[3])
+	}
+	if !strings.Contains(row[1], "~") {
+		t.Fatalf("expected status cell to be rebuilt, got %q", row[1])
+	}
+}
+
+func TestSortWorktreesModes(t *testing.T) {
+	a := &models.WorktreeInfo{Path: "/a", LastActiveTS: 10, LastSwitchedTS: 30}
+	b := &models.WorktreeInfo{Path: "/b", LastActiveTS: 30, LastSwitchedTS: 10}
+	c := &models.WorktreeInfo{Path: "/c", LastActiveTS: 30, LastSwitchedTS: 20}
+
+	paths := func(wts []*models.WorktreeInfo) string {
+		out := make([]string, 0, len(wts))
+		for _, wt := range wts {
+			out = append(out, wt.Path)
+		}
+		return strings.Join(out, ",")
+	}
+
+	wts := []*models.WorktreeInfo{a, c, b}
+	sortWorktrees(wts, sortModeLastActive)
+	if got := paths(wts); got != "/b,/c,/a" {
+		t.Fatalf("last active order = %s", got)
+	}
+
+	sortWorktrees(wts, sortModeLastSwitched)
+	if got := paths(wts); got != "/a,/c,/b" {
+		t.Fatalf("last switched order = %s", got)
+	}
+
+	sortWorktrees(wts, sortModePath)
+	if got := paths(wts); got != "/a,/b,/c" {
+		t.Fatalf("path order = %s", got)
+	}
+}
+
+func TestWorktreeProbedMsgStreamsUntilLoaded(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	updates := make(chan tea.Msg, 1)
+	first := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "a"), Branch: "a"}
+	second := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "b"), Branch: "b"}
+
+	_, cmd := m.Update(worktreeProbedMsg{worktree: first, next: updates})
+	if cmd == nil {
+		t.Fatal("expected a command waiting for the next update")
+	}
+	_, _ = m.Update(worktreeProbedMsg{worktree: second, next: updates})
+	if len(m.state.data.filteredWts) != 2 {
+		t.Fatalf("expected 2 streamed worktrees, got %d", len(m.state.data.filteredWts))
+	}
+
+	updates <- worktreesLoadedMsg{worktrees: []*models.WorktreeInfo{first}}
+	if _, ok := cmd().(worktreesLoadedMsg); !ok {
+		t.Fatal("expected the final listing from the stream")
+	}
+	_, _ = m.Update(worktreesLoadedMsg{worktrees: []*models.WorktreeInfo{first}})
+
+	_, _ = m.Update(worktreeProbedMsg{worktree: second, next: updates})
+	if len(m.state.data.worktrees) != 1 {
+		t.Fatalf("expected late probe results to be ignored, got %d worktrees", len(m.state.data.worktrees))
+	}
+}
+
+func TestWorktreeProbedMsgTakesQueuedProbesTogether(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	updates := make(chan tea.Msg, 3)
+	first := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "a"), Branch: "a"}
+	second := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "b"), Branch: "b"}
+	third := &models.WorktreeInfo{Path: filepath.Join(cfg.WorktreeDir, "c"), Branch: "c"}
+	updates <- worktreeProbedMsg{worktree: second, next: updates}
+	updates <- worktreeProbedMsg{worktree: third, next: updates}
+	updates <- worktreesLoadedMsg{worktrees: []*models.WorktreeInfo{first, second, third}}
+
+	_, cmd := m.Update(worktreeProbedMsg{worktree: first, next: updates})
+	if len(m.state.data.filteredWts) != 3 {
+		t.Fatalf("expected queued probes to be shown at once, got %d worktrees", len(m.state.data.filteredWts))
+	}
+	if cmd == nil {
+		t.Fatal("expected the final listing to follow")
+	}
+	if _, ok := cmd().(worktreesLoadedMsg); !ok {
+		t.Fatal("expected the final listing from the stream")
+	}
+}
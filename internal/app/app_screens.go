@@ -557,14 +557,7 @@ func (m *Model) showCherryPick() tea.Cmd {
 	)
 
 	listScreen.OnSelect = func(item appscreen.SelectionItem) tea.Cmd {
-		var targetWorktree *models.WorktreeInfo
-		for _, wt := range m.state.data.worktrees {
-			if wt.Path == item.ID {
-				targetWorktree = wt
-				break
-			}
-		}
-
+		targetWorktree := m.worktreeByPath(item.ID)
 		if targetWorktree == nil {
 			return func() tea.Msg {
 				return errMsg{err: fmt.Errorf("target worktree not found")}
@@ -583,35 +576,49 @@ func (m *Model) showCherryPick() tea.Cmd {
 }
 
 func (m *Model) showCommitFilesScreen(commitSHA, worktreePath string) tea.Cmd {
+	cacheKey := commitFilesKey{path: worktreePath, sha: commitSHA}
+	if m.cache.commitFiles != nil {
+		if cached, ok := m.cache.commitFiles.Get(cacheKey); ok {
+			return func() tea.Msg { return cached }
+		}
+	}
 	return func() tea.Msg {
-		files, err := m.state.services.git.GetCommitFiles(m.ctx, commitSHA, worktreePath)
-		if err != nil {
-			return errMsg{err: err}
-		}
-		// Fetch commit metadata
-		metaRaw := m.state.services.git.RunGit(
-			m.ctx,
-			[]string{
-				"git", "log", "-1",
-				"--pretty=format:%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b",
-				commitSHA,
-			},
-			worktreePath,
-			[]int{0},
-			true,
-			false,
-		)
-		meta := parseCommitMeta(metaRaw)
+		// Commit metadata comes from the persistent cat-file process when
+		// possible; otherwise diff-tree reports it alongside the file list,
+		// so opening a commit costs a single git call either way.
+		var meta commitMeta
+		var files []models.CommitFile
+		if commit, err := m.state.services.git.ReadCommit(m.ctx, worktreePath, commitSHA); err == nil {
+			files, err = m.state.services.git.GetCommitFiles(m.ctx, commitSHA, worktreePath)
+			if err != nil {
+				return errMsg{err: err}
+			}
+			meta = commitMetaFromObject(commit)
+		} else {
+			metaRaw, commitFiles, err := m.state.services.git.GetCommitFilesWithHeader(m.ctx, commitSHA, worktreePath, commitMetaFormat)
+			if err != nil {
+				return errMsg{err: err}
+			}
+			files = commitFiles
+			meta = parseCommitMeta(metaRaw)
+		}
 		// Ensure SHA is set even if parsing fails
 		if meta.sha == "" {
 			meta.sha = commitSHA
 		}
-		return commitFilesLoadedMsg{
+		// The file tree is built here, off the UI goroutine, and cached with
+		// the commit so reopening it skips the rebuild.
+		msg := commitFilesLoadedMsg{
 			sha:          commitSHA,
 			worktreePath: worktreePath,
 			files:        files,
+			tree:         appscreen.BuildCompressedCommitFileTree(files),
 			meta:         meta,
 		}
+		if m.cache.commitFiles != nil {
+			m.cache.commitFiles.Set(cacheKey, msg)
+		}
+		return msg
 	}
 }
 
@@ -648,8 +655,11 @@ func (m *Model) persistLastSelected(path string) {
 	if strings.TrimSpace(path) == "" {
 		return
 	}
+	repoKey := m.repoKey
+	if repoKey == "" {
+		return
+	}
 	m.debugf("persist last-selected: %s", path)
-	repoKey := m.getRepoKey()
 	lastSelectedPath := filepath.Join(m.getWorktreeDir(), repoKey, models.LastSelectedFilename)
 	if err := os.MkdirAll(filepath.Dir(lastSelectedPath), defaultDirPerms); err != nil {
 		return
@@ -1035,3 +1035,59 @@ func TestErrMsgShowsInfo(t *testing.T) {
 		t.Fatalf("expected info modal to include error, got %q", infoScr.Message)
 	}
 }
+
+func TestShowCommitFilesScreenUsesCachedCommit(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	wtPath := filepath.Join(cfg.WorktreeDir, "missing")
+	cached := commitFilesLoadedMsg{
+		sha:          "abc123",
+		worktreePath: wtPath,
+		files:        []models.CommitFile{{Filename: "main.go", ChangeType: "M"}},
+		meta:         commitMeta{sha: "abc123", subject: "cached"},
+	}
+	m.cache.commitFiles.Set(commitFilesKey{path: wtPath, sha: "abc123"}, cached)
+
+	cmd := m.showCommitFilesScreen("abc123", wtPath)
+	if cmd == nil {
+		t.Fatal("expected a command")
+	}
+	raw := cmd()
+	msg, ok := raw.(commitFilesLoadedMsg)
+	if !ok {
+		t.Fatalf("expected commitFilesLoadedMsg, got %T", raw)
+	}
+	if msg.meta.subject != "cached" || len(msg.files) != 1 {
+		t.Fatalf("expected cached commit view, got %+v", msg)
+	}
+}
+
+func TestCommitFilesLoadedReusesCachedTree(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	files := []models.CommitFile{
+		{Filename: "cmd/main.go", ChangeType: "M"},
+		{Filename: "README.md", ChangeType: "A"},
+	}
+	tree := appscreen.BuildCompressedCommitFileTree(files)
+	m.Update(commitFilesLoadedMsg{
+		sha:          "abc123",
+		worktreePath: cfg.WorktreeDir,
+		files:        files,
+		tree:         tree,
+		meta:         commitMeta{sha: "abc123"},
+	})
+
+	scr, ok := m.state.ui.screenManager.Current().(*appscreen.CommitFilesScreen)
+	if !ok {
+		t.Fatalf("expected commit files screen, got %T", m.state.ui.screenManager.Current())
+	}
+	if scr.Tree != tree {
+		t.Fatal("expected the prebuilt tree to be reused")
+	}
+	if len(scr.TreeFlat) != 3 {
+		t.Fatalf("expected 3 flattened nodes, got %d", len(scr.TreeFlat))
+	}
+}
@@ -13,13 +13,7 @@ func (m *Model) updateWorktreeStatus(path string, files []StatusFile) {
 	if path == "" {
 		return
 	}
-	var target *models.WorktreeInfo
-	for _, wt := range m.state.data.worktrees {
-		if wt.Path == path {
-			target = wt
-			break
-		}
-	}
+	target := m.worktreeByPath(path)
 	if target == nil {
 		return
 	}
@@ -41,42 +35,39 @@ func parseStatusFiles(statusRaw string) []StatusFile {
 		return nil
 	}
 
-	// Parse all files into statusFiles
-	statusLines := strings.Split(statusRaw, "\n")
-	parsedFiles := make([]StatusFile, 0, len(statusLines))
-	for _, line := range statusLines {
-		if line == "" || strings.HasPrefix(line, "#") {
-			continue
-		}
-
-		// Parse git status --porcelain=v2 format
-		fields := strings.Fields(line)
-		if len(fields) < 2 {
+	// Parse git status --porcelain=v2 format, dispatching on the first byte
+	// of each line and cutting the path off after the fixed fields rather
+	// than splitting every field out.
+	parsedFiles := make([]StatusFile, 0, strings.Count(statusRaw, "\n")+1)
+	for line := range strings.SplitSeq(statusRaw, "\n") {
+		if len(line) < 3 || line[1] != ' ' {
 			continue
 		}
 
 		var status, filename string
 		var isUntracked bool
 
-		switch fields[0] {
-		case "1": // Ordinary changed entry: 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
-			if len(fields) < 9 {
+		switch line[0] {
+		case '1': // Ordinary changed entry: 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+			path, ok := afterStatusFields(line, 8)
+			if !ok {
 				continue
 			}
-			status = fields[1] // XY status code (e.g., ".M", "M.", "MM")
-			filename = fields[8]
-		case "?": // Untracked: ? <path>
+			status = line[2:4] // XY status code (e.g., ".M", "M.", "MM")
+			filename = path
+		case '?': // Untracked: ? <path>
 			status = " ?" // Single ? with space for alignment
-			filename = fields[1]
+			filename = line[2:]
 			isUntracked = true
-		case "2": // Renamed/copied: 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path><sep><origPath>
-			if len(fields) < 10 {
+		case '2': // Renamed/copied: 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path><tab><origPath>
+			paths, ok := afterStatusFields(line, 9)
+			if !ok {
 				continue
 			}
-			status = fields[1]
-			filename = fields[9]
+			status = line[2:4]
+			filename, _, _ = strings.Cut(paths, "\t")
 		default:
-			continue // Skip unhandled entry types
+			continue // Skip headers and unhandled entry types
 		}
 
 		parsedFiles = append(parsedFiles, StatusFile{
@@ -89,6 +80,20 @@ func parseStatusFiles(statusRaw string) []StatusFile {
 	return parsedFiles
 }
 
+// afterStatusFields returns the rest of a porcelain v2 line after its first
+// n space-separated fields, which is where the path starts. Paths may
+// contain spaces, so they are never split themselves.
+func afterStatusFields(line string, n int) (string, bool) {
+	for range n {
+		_, rest, ok := strings.Cut(line, " ")
+		if !ok || rest == "" {
+			return "", false
+		}
+		line = rest
+	}
+	return line, true
+}
+
 func statusCounts(files []StatusFile) (staged, modified, untracked int) {
 	for _, file := range files {
 		if file.IsUntracked {
@@ -112,7 +117,14 @@ func statusCounts(files []StatusFile) (staged, modified, untracked int) {
 }
 
 func (m *Model) setStatusFiles(files []StatusFile) {
+	m.setStatusFilesWithTree(files, nil)
+}
+
+// setStatusFilesWithTree is setStatusFiles with the unfiltered tree already
+// built, so the update loop only has to flatten and render it.
+func (m *Model) setStatusFilesWithTree(files []StatusFile, tree *services.StatusTreeNode) {
 	m.state.data.statusFilesAll = files
+	m.state.data.statusTreeAll = tree
 
 	m.applyStatusFilter()
 }
@@ -135,8 +147,15 @@ func (m *Model) applyStatusFilter() {
 	// Keep statusFiles for compatibility
 	m.state.data.statusFiles = filtered
 
-	// Build tree from filtered files
-	m.state.services.statusTree.Tree = services.BuildStatusTree(filtered)
+	// Build tree from filtered files, reusing the unfiltered one when possible
+	if query == "" {
+		if m.state.data.statusTreeAll == nil {
+			m.state.data.statusTreeAll = services.BuildStatusTree(filtered)
+		}
+		m.state.services.statusTree.Tree = m.state.data.statusTreeAll
+	} else {
+		m.state.services.statusTree.Tree = services.BuildStatusTree(filtered)
+	}
 	m.state.services.statusTree.RebuildFlat()
 
 	// Try to restore selection
@@ -255,15 +274,24 @@ func (m *Model) setDetailsCache(cacheKey string, entry *detailsCacheEntry) {
 }
 
 func (m *Model) deleteDetailsCache(cacheKey string) {
+	m.state.services.git.ForgetStatus(cacheKey)
 	m.cache.detailsCacheMu.Lock()
 	defer m.cache.detailsCacheMu.Unlock()
 	delete(m.cache.detailsCache, cacheKey)
+	if m.cache.commitDetails != nil {
+		m.cache.commitDetails.DeleteFunc(func(key commitDetailsKey) bool {
+			return key.path == cacheKey
+		})
+	}
 }
 
 func (m *Model) resetDetailsCache() {
 	m.cache.detailsCacheMu.Lock()
 	defer m.cache.detailsCacheMu.Unlock()
 	m.cache.detailsCache = make(map[string]*detailsCacheEntry)
+	if m.cache.commitDetails != nil {
+		m.cache.commitDetails.Clear()
+	}
 }
 
 func (m *Model) getCachedDetails(wt *models.WorktreeInfo) (string, string, map[string]bool, map[string]bool) {
@@ -272,19 +300,44 @@ func (m *Model) getCachedDetails(wt *models.WorktreeInfo) (string, string, map[s
 	}
 
 	cacheKey := wt.Path
-	if cached, ok := m.getDetailsCache(cacheKey); ok {
-		if time.Since(cached.fetchedAt) < detailsCacheTTL {
-			return cached.statusRaw, cached.logRaw, cached.unpushedSHAs, cached.unmergedSHAs
+	if cached, ok := m.getDetailsCache(cacheKey); ok && time.Since(cached.fetchedAt) < detailsCacheTTL {
+		return cached.statusRaw, cached.logRaw, cached.unpushedSHAs, cached.unmergedSHAs
+	}
+
+	// Get status (using porcelain format for reliable machine parsing). A
+	// refresh has usually just run git status for every worktree, so that
+	// output is reused while it is as fresh as a cached details entry.
+	statusRaw, ok := m.state.services.git.RecentStatus(wt.Path, detailsCacheTTL)
+	if !ok {
+		statusRaw = m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain=v2"}, wt.Path, nil, true, false)
+	}
+
+	// Commit history only changes when HEAD moves, which the worktree's
+	// persistent cat-file process answers without spawning git. Entries are
+	// memoised per (path, HEAD) so revisiting a worktree or a previous HEAD
+	// skips the log and rev-list calls.
+	commitKey := commitDetailsKey{
+		path:    wt.Path,
+		headSHA: m.state.services.git.ResolveRevision(m.ctx, wt.Path, "HEAD"),
+	}
+	if commitKey.headSHA != "" && m.cache.commitDetails != nil {
+		if commits, found := m.cache.commitDetails.Get(commitKey); found {
+			m.setDetailsCache(cacheKey, &detailsCacheEntry{
+				statusRaw:    statusRaw,
+				logRaw:       commits.logRaw,
+				unpushedSHAs: commits.unpushedSHAs,
+				unmergedSHAs: commits.unmergedSHAs,
+				fetchedAt:    time.Now(),
+			})
+			return statusRaw, commits.logRaw, commits.unpushedSHAs, commits.unmergedSHAs
 		}
 	}
 
-	// Get status (using porcelain format for reliable machine parsing)
-	statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain=v2"}, wt.Path, []int{0}, true, false)
 	// Use %H for full SHA to ensure reliable matching
-	logRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "log", "-50", "--pretty=format:%H%x09%an%x09%s"}, wt.Path, []int{0}, true, false)
+	logRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "log", "-50", "--pretty=format:%H%x09%an%x09%s"}, wt.Path, nil, true, false)
 
 	// Get unpushed SHAs (commits not on any remote)
-	unpushedRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-list", "-100", "HEAD", "--not", "--remotes"}, wt.Path, []int{0}, true, false)
+	unpushedRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-list", "-100", "HEAD", "--not", "--remotes"}, wt.Path, nil, true, false)
 	unpushedSHAs := make(map[string]bool)
 	for sha := range strings.SplitSeq(unpushedRaw, "\n") {
 		if s := strings.TrimSpace(sha); s != "" {
@@ -296,7 +349,7 @@ func (m *Model) getCachedDetails(wt *models.WorktreeInfo) (string, string, map[s
 	mainBranch := m.state.services.git.GetMainBranch(m.ctx)
 	unmergedSHAs := make(map[string]bool)
 	if mainBranch != "" {
-		unmergedRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-list", "-100", "HEAD", "^" + mainBranch}, wt.Path, []int{0}, true, false)
+		unmergedRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-list", "-100", "HEAD", "^" + mainBranch}, wt.Path, nil, true, false)
 		for sha := range strings.SplitSeq(unmergedRaw, "\n") {
 			if s := strings.TrimSpace(sha); s != "" {
 				unmergedSHAs[s] = true
@@ -304,13 +357,17 @@ func (m *Model) getCachedDetails(wt *models.WorktreeInfo) (string, string, map[s
 		}
 	}
 
-	m.setDetailsCache(cacheKey, &detailsCacheEntry{
+	entry := &detailsCacheEntry{
 		statusRaw:    statusRaw,
 		logRaw:       logRaw,
 		unpushedSHAs: unpushedSHAs,
 		unmergedSHAs: unmergedSHAs,
 		fetchedAt:    time.Now(),
-	})
+	}
+	m.setDetailsCache(cacheKey, entry)
+	if commitKey.headSHA != "" && m.cache.commitDetails != nil {
+		m.cache.commitDetails.Set(commitKey, entry)
+	}
 
 	return statusRaw, logRaw, unpushedSHAs, unmergedSHAs
 }
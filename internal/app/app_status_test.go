@@ -147,3 +147,27 @@ func TestTruncateToHeightFromEnd(t *testing.T) {
 		})
 	}
 }
+
+func TestParseStatusFilesKeepsWholePaths(t *testing.T) {
+	t.Parallel()
+	raw := "# branch.oid abc\n" +
+		"1 .M N... 100644 100644 100644 abc123 abc123 docs/read me.md\n" +
+		"? new dir/notes.txt\n" +
+		"2 R. N... 100644 100644 100644 abc123 def456 R100 renamed file.go\told.go\n" +
+		"1 M. truncated\n"
+
+	files := parseStatusFiles(raw)
+	want := []StatusFile{
+		{Filename: "docs/read me.md", Status: ".M"},
+		{Filename: "new dir/notes.txt", Status: " ?", IsUntracked: true},
+		{Filename: "renamed file.go", Status: "R."},
+	}
+	if len(files) != len(want) {
+		t.Fatalf("expected %d files, got %d: %+v", len(want), len(files), files)
+	}
+	for i := range want {
+		if files[i] != want[i] {
+			t.Errorf("file %d: expected %+v, got %+v", i, want[i], files[i])
+		}
+	}
+}
@@ -46,6 +46,37 @@ func TestStatusUpdatedMsgUpdatesWorktreeStatus(t *testing.T) {
 	}
 }
 
+func TestStatusUpdatedMsgReusesPrebuiltTree(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	files := []StatusFile{
+		{Filename: "dir/a.txt", Status: ".M"},
+		{Filename: "b.txt", Status: "M."},
+	}
+	tree := services.BuildStatusTree(files)
+	_, _ = m.Update(statusUpdatedMsg{statusFiles: files, statusTree: tree})
+
+	if m.state.services.statusTree.Tree != tree {
+		t.Fatal("expected the prebuilt status tree to be used")
+	}
+
+	m.state.services.filter.StatusFilterQuery = "b.txt"
+	m.applyStatusFilter()
+	if m.state.services.statusTree.Tree == tree {
+		t.Fatal("expected a filtered tree to be built")
+	}
+	if len(m.state.services.statusTree.TreeFlat) != 1 {
+		t.Fatalf("expected 1 filtered node, got %d", len(m.state.services.statusTree.TreeFlat))
+	}
+
+	m.state.services.filter.StatusFilterQuery = ""
+	m.applyStatusFilter()
+	if m.state.services.statusTree.Tree != tree {
+		t.Fatal("expected clearing the filter to restore the prebuilt tree")
+	}
+}
+
 func TestRefreshDetails(t *testing.T) {
 	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
 	m := NewModel(cfg, "")
@@ -259,3 +290,27 @@ func TestShouldRefreshGitEventDebounce(t *testing.T) {
 		t.Fatal("expected refresh after debounce window")
 	}
 }
+
+func TestDeleteDetailsCacheDropsCommitDetailsForPath(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+
+	wt1 := filepath.Join(cfg.WorktreeDir, "wt1")
+	wt2 := filepath.Join(cfg.WorktreeDir, "wt2")
+	m.cache.commitDetails.Set(commitDetailsKey{path: wt1, headSHA: "a"}, &detailsCacheEntry{})
+	m.cache.commitDetails.Set(commitDetailsKey{path: wt1, headSHA: "b"}, &detailsCacheEntry{})
+	m.cache.commitDetails.Set(commitDetailsKey{path: wt2, headSHA: "a"}, &detailsCacheEntry{})
+
+	m.deleteDetailsCache(wt1)
+	if m.cache.commitDetails.Len() != 1 {
+		t.Fatalf("expected only wt2 commit details to remain, got %d entries", m.cache.commitDetails.Len())
+	}
+	if _, ok := m.cache.commitDetails.Get(commitDetailsKey{path: wt2, headSHA: "a"}); !ok {
+		t.Fatal("expected wt2 commit details to be kept")
+	}
+
+	m.resetDetailsCache()
+	if m.cache.commitDetails.Len() != 0 {
+		t.Fatal("expected reset to clear commit details")
+	}
+}
@@ -49,7 +49,7 @@ func (m *Model) showBaseSelection(defaultBase string) tea.Cmd {
 	hasChanges := false
 	currentWt := m.determineCurrentWorktree()
 	if currentWt != nil {
-		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, []int{0}, true, false)
+		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, nil, true, false)
 		hasChanges = strings.TrimSpace(statusRaw) != ""
 	}
 
@@ -254,7 +254,7 @@ func (m *Model) showCommitSelection(baseBranch string) tea.Cmd {
 			baseBranch,
 		},
 		"",
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -408,7 +408,7 @@ func (m *Model) suggestBranchName(baseName string) string {
 			"refs/heads",
 		},
 		"",
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -444,7 +444,7 @@ func (m *Model) commitLog(hash string) string {
 		m.ctx,
 		[]string{"git", "show", "--quiet", "--pretty=format:%s%n%b", hash},
 		"",
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -455,29 +455,12 @@ func (m *Model) baseRefExists(ref string) bool {
 	if ref == "" {
 		return false
 	}
-	refQuery := fmt.Sprintf("%s^{commit}", ref)
-	out := m.state.services.git.RunGit(
-		m.ctx,
-		[]string{"git", "rev-parse", "--verify", refQuery},
-		"",
-		[]int{0, 1},
-		true,
-		true,
-	)
-	return strings.TrimSpace(out) != ""
+	return m.state.services.git.RevisionExists(m.ctx, "", fmt.Sprintf("%s^{commit}", ref))
 }
 
 // localBranchExists checks if a local branch with the given name exists.
 func (m *Model) localBranchExists(branch string) bool {
-	output := m.state.services.git.RunGit(
-		m.ctx,
-		[]string{"git", "show-ref", "--verify", fmt.Sprintf("refs/heads/%s", branch)},
-		"",
-		[]int{0, 1},
-		true,
-		true,
-	)
-	return strings.TrimSpace(output) != ""
+	return m.state.services.git.RevisionExists(m.ctx, "", fmt.Sprintf("refs/heads/%s", branch))
 }
 
 func (m *Model) branchCheckedOutInWorktree(branch string) bool {
@@ -604,14 +587,13 @@ func (m *Model) checkoutExistingBranchAsync(worktreeName, targetPath, branchName
 		m.pendingSelectWorktreePath = targetPath
 
 		env := m.buildCommandEnv(branchName, targetPath)
-		initCmds := m.collectInitCommands()
 
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{worktrees: worktrees, err: err}
 		}
 
-		cmd := m.runCommandsWithTrust(initCmds, targetPath, env, after)
+		cmd := m.runInitCommandsWithTrust(targetPath, env, after)
 		if cmd != nil {
 			return cmd()
 		}
@@ -653,7 +635,6 @@ func (m *Model) createWorktreeFromBaseAsync(newBranch, targetPath, baseRef strin
 		m.pendingSelectWorktreePath = targetPath
 
 		env := m.buildCommandEnv(newBranch, targetPath)
-		initCmds := m.collectInitCommands()
 
 		// Run init commands with trust checks, passing after callback
 		after := func() tea.Msg {
@@ -674,7 +655,7 @@ func (m *Model) createWorktreeFromBaseAsync(newBranch, targetPath, baseRef strin
 		}
 
 		// Return the init commands execution, which will handle the 'after' callback
-		cmd := m.runCommandsWithTrust(initCmds, targetPath, env, after)
+		cmd := m.runInitCommandsWithTrust(targetPath, env, after)
 		if cmd != nil {
 			return cmd()
 		}
@@ -720,7 +701,7 @@ func (m *Model) branchSelectionItemsForRefs(refs []string) []selectionItem {
 		m.ctx,
 		args,
 		"",
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -755,13 +736,15 @@ func parseBranchOptionsWithDate(raw string) []branchOption {
 		if line == "" {
 			continue
 		}
-		parts := strings.Split(line, "\t")
-		if len(parts) < 3 {
+		name, rest, ok1 := strings.Cut(line, "\t")
+		fullRef, rest, ok2 := strings.Cut(rest, "\t")
+		if !ok1 || !ok2 {
 			continue
 		}
-		name := strings.TrimSpace(parts[0])
-		fullRef := strings.TrimSpace(parts[1])
-		timestampStr := strings.TrimSpace(parts[2])
+		timestampStr, _, _ := strings.Cut(rest, "\t")
+		name = strings.TrimSpace(name)
+		fullRef = strings.TrimSpace(fullRef)
+		timestampStr = strings.TrimSpace(timestampStr)
 		if name == "" || fullRef == "" {
 			continue
 		}
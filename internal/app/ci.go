@@ -2,6 +2,7 @@ package app
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -184,7 +185,8 @@ func (m *Model) showCICheckLog(check *models.CICheck) tea.Cmd {
 	return m.execProcess(c, func(err error) tea.Msg {
 		if err != nil {
 			// Ignore exit status 141 (SIGPIPE) which happens when the pager is closed early
-			if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() == 141 {
+			var exitErr *exec.ExitError
+			if errors.As(err, &exitErr) && exitErr.ExitCode() == 141 {
 				return refreshCompleteMsg{}
 			}
 			return errMsg{err: err}
@@ -250,7 +252,7 @@ func (m *Model) rerunCICheck(check *models.CICheck) tea.Cmd {
 
 		// gh run rerun produces no stdout on success, so we can't check output.
 		// RunGit with silent=false sends a notification on failure.
-		m.state.services.git.RunGit(ctx, append([]string{"gh"}, args...), wt.Path, []int{0}, true, false)
+		m.state.services.git.RunGit(ctx, append([]string{"gh"}, args...), wt.Path, nil, true, false)
 
 		// Construct the run URL
 		runURL := fmt.Sprintf("https://github.com/%s/actions/runs/%s", repo, runID)
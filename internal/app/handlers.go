@@ -23,27 +23,30 @@ func (m *Model) handleKeyMsg(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 		switch m.state.view.FilterTarget {
 		case filterTargetWorktrees:
 			if keyStr == keyEnter {
+				m.flushFilterUpdate()
 				m.state.view.ShowingFilter = false
 				m.state.ui.filterInput.Blur()
 				m.restoreFocusAfterFilter()
 				return m, nil
 			}
 			if isEscKey(keyStr) || keyStr == keyCtrlC {
+				m.flushFilterUpdate()
 				m.state.view.ShowingFilter = false
 				m.state.ui.filterInput.Blur()
 				m.state.ui.worktreeTable.Focus()
 				return m, nil
 			}
 			if keyStr == "alt+n" || keyStr == "alt+p" {
+				m.flushFilterUpdate()
 				return m.handleFilterNavigation(keyStr, true)
 			}
 			if keyStr == keyUp || keyStr == keyDown || keyStr == keyCtrlK || keyStr == keyCtrlJ {
+				m.flushFilterUpdate()
 				return m.handleFilterNavigation(keyStr, false)
 			}
 			m.state.ui.filterInput, cmd = m.state.ui.filterInput.Update(msg)
 			m.setFilterQuery(filterTargetWorktrees, m.state.ui.filterInput.Value())
-			m.updateTable()
-			return m, cmd
+			return m, tea.Batch(cmd, m.debouncedUpdateTable())
 		case filterTargetStatus:
 			if keyStr == keyEnter {
 				m.state.view.ShowingFilter = false
@@ -2,6 +2,7 @@ package handlers
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -659,7 +660,8 @@ func (r *DiffRouter) handlePagerExit(err error) tea.Msg {
 	if err == nil {
 		return r.refreshMsg()
 	}
-	if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() == 141 {
+	var exitErr *exec.ExitError
+	if errors.As(err, &exitErr) && exitErr.ExitCode() == 141 {
 		return r.refreshMsg()
 	}
 	return r.errorMsg(err)
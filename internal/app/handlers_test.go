@@ -4185,3 +4185,41 @@ func TestDisablePRTableRowsExcludesPRColumn(t *testing.T) {
 		t.Errorf("expected 3 columns when DisablePR is true, got %d", len(rows[0]))
 	}
 }
+
+func TestWorktreeFilterCoalescesKeystrokeBursts(t *testing.T) {
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+	m.state.data.worktrees = []*models.WorktreeInfo{
+		{Path: filepath.Join(cfg.WorktreeDir, "main"), Branch: "main", IsMain: true},
+		{Path: filepath.Join(cfg.WorktreeDir, "srv-api"), Branch: "feature/srv-api"},
+		{Path: filepath.Join(cfg.WorktreeDir, "frontend"), Branch: "feature/frontend"},
+	}
+	m.updateTable()
+	m.state.view.ShowingFilter = true
+	m.state.view.FilterTarget = filterTargetWorktrees
+	m.state.ui.filterInput.Focus()
+
+	// The first keystroke filters immediately.
+	_, _ = m.handleKeyMsg(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'s'}})
+	if len(m.state.data.filteredWts) != 1 {
+		t.Fatalf("expected first keystroke to filter immediately, got %d worktrees", len(m.state.data.filteredWts))
+	}
+
+	// Keystrokes in quick succession are deferred to a single update.
+	_, _ = m.handleKeyMsg(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'x'}})
+	if m.filterUpdateCancel == nil {
+		t.Fatal("expected a pending debounced filter update")
+	}
+	if len(m.state.data.filteredWts) != 1 {
+		t.Fatalf("expected table to wait for the burst to end, got %d worktrees", len(m.state.data.filteredWts))
+	}
+
+	// Leaving the filter applies the pending query.
+	_, _ = m.handleKeyMsg(tea.KeyMsg{Type: tea.KeyEnter})
+	if m.filterUpdateCancel != nil {
+		t.Fatal("expected pending update to be flushed")
+	}
+	if len(m.state.data.filteredWts) != 0 {
+		t.Fatalf("expected no worktree to match %q, got %d", m.state.services.filter.FilterQuery, len(m.state.data.filteredWts))
+	}
+}
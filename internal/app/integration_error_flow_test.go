@@ -48,7 +48,7 @@ func TestIntegrationCreateFromPRValidationErrors(t *testing.T) {
 	m.state.view.WindowWidth = 120
 	m.state.view.WindowHeight = 40
 	m.state.services.git.SetCommandRunner(func(_ context.Context, _ string, _ ...string) *exec.Cmd {
-		return exec.Command("bash", "-lc", "exit 1")
+		return exec.Command("false")
 	})
 
 	missingBranch := &models.PRInfo{Number: 1, Title: "Add feature"}
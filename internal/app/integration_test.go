@@ -5,7 +5,6 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
-	"time"
 
 	tea "github.com/charmbracelet/bubbletea"
 	"github.com/charmbracelet/x/exp/teatest"
@@ -17,9 +16,7 @@ import (
 // TestModelInitialization verifies the model initializes correctly
 func TestModelInitialization(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	if m == nil {
@@ -48,43 +45,27 @@ func TestModelInitialization(t *testing.T) {
 
 // TestKeyboardNavigation tests basic keyboard navigation
 func TestKeyboardNavigation(t *testing.T) {
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	// Wait for initial load
-	time.Sleep(20 * time.Millisecond)
+	t.Parallel()
+	tm := newLoadedTestModel(t, newTestConfig(t))
 
 	// Test tab navigation
 	tm.Send(tea.KeyMsg{Type: tea.KeyTab})
-	time.Sleep(10 * time.Millisecond)
+	waitForModel(t, tm, focusedPane(1))
 
 	// Test number keys for pane focus
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("1")})
-	time.Sleep(10 * time.Millisecond)
+	tm.Send(runeKey("1"))
+	waitForModel(t, tm, focusedPane(0))
 
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("2")})
-	time.Sleep(10 * time.Millisecond)
+	tm.Send(runeKey("2"))
+	waitForModel(t, tm, focusedPane(1))
 
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("3")})
-	time.Sleep(10 * time.Millisecond)
+	tm.Send(runeKey("3"))
+	waitForModel(t, tm, focusedPane(2))
 
 	// Quit
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("q")})
+	tm.Send(runeKey("q"))
 
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
-
-	// Get final model
-	fm := tm.FinalModel(t)
-	m, ok := fm.(*Model)
-	if !ok {
-		t.Fatal("Final model is not *Model type")
-	}
+	m := finalModel(t, tm)
 
 	if !m.quitting {
 		t.Error("Model should be marked as quitting after 'q' key")
@@ -93,9 +74,8 @@ func TestKeyboardNavigation(t *testing.T) {
 
 // TestFilterInput tests filter functionality
 func TestFilterInput(t *testing.T) {
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	t.Parallel()
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "test-filter")
 
 	if !m.state.view.ShowingFilter {
@@ -107,33 +87,33 @@ func TestFilterInput(t *testing.T) {
 	}
 
 	// Test filter toggle
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	time.Sleep(20 * time.Millisecond)
+	tm := newLoadedTestModel(t, cfg)
 
-	// Press 'f' to show filter
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("f")})
-	time.Sleep(10 * time.Millisecond)
-
-	// Type some filter text
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("m")})
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("a")})
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("i")})
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("n")})
-	time.Sleep(10 * time.Millisecond)
+	// Press 'f' to show the filter; it is shown and focused in the same
+	// update, so both are awaited with one probe.
+	tm.Send(runeKey("f"))
+	waitForModel(t, tm, func(m *Model) bool {
+		return m.state.view.ShowingFilter && m.state.ui.filterInput.Focused()
+	})
 
-	// Press enter to exit filter mode
-	tm.Send(tea.KeyMsg{Type: tea.KeyEnter})
-	time.Sleep(10 * time.Millisecond)
+	// Type the query in one burst and press enter to exit filter mode. The
+	// input takes each key as it is handled, so the query is complete once
+	// the burst has been processed.
+	sendKeys(tm,
+		runeKey("m"), runeKey("a"), runeKey("i"), runeKey("n"),
+		tea.KeyMsg{Type: tea.KeyEnter},
+	)
+	waitForModel(t, tm, func(m *Model) bool {
+		return !m.state.view.ShowingFilter && m.state.ui.worktreeTable.Focused()
+	})
 
-	// Quit
 	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlC})
 
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
+	final := finalModel(t, tm)
+
+	if query := final.state.services.filter.FilterQuery; query != "main" {
+		t.Errorf("Expected filterQuery to be 'main', got %q", query)
+	}
 }
 
 func TestSearchAutoSelectStartsFocused(t *testing.T) {
@@ -154,39 +134,18 @@ func TestSearchAutoSelectStartsFocused(t *testing.T) {
 
 // TestSortCycle tests the sort cycle functionality
 func TestSortCycle(t *testing.T) {
+	t.Parallel()
 	cfg := &config.AppConfig{
 		WorktreeDir: t.TempDir(),
 		SortMode:    "switched",
 	}
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	time.Sleep(20 * time.Millisecond)
+	tm := newLoadedTestModel(t, cfg)
 
 	// Press 's' three times to cycle through all modes and back to original
 	// switched (2) -> path (0) -> active (1) -> switched (2)
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("s")})
-	time.Sleep(10 * time.Millisecond)
-
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("s")})
-	time.Sleep(10 * time.Millisecond)
+	sendKeys(tm, runeKey("s"), runeKey("s"), runeKey("s"), tea.KeyMsg{Type: tea.KeyCtrlC})
 
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("s")})
-	time.Sleep(10 * time.Millisecond)
-
-	// Quit
-	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlC})
-
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
-
-	fm := tm.FinalModel(t)
-	m, ok := fm.(*Model)
-	if !ok {
-		t.Fatal("Final model is not *Model type")
-	}
+	m := finalModel(t, tm)
 
 	// Should be back to original state after three cycles
 	if m.sortMode != sortModeLastSwitched {
@@ -196,50 +155,23 @@ func TestSortCycle(t *testing.T) {
 
 // TestHelpScreen tests the help screen display
 func TestHelpScreen(t *testing.T) {
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	time.Sleep(20 * time.Millisecond)
+	t.Parallel()
+	tm := newLoadedTestModel(t, newTestConfig(t))
 
 	// Press '?' to show help
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("?")})
-	time.Sleep(10 * time.Millisecond)
-
-	// Verify output contains help text
-	teatest.WaitFor(
-		t, tm.Output(),
-		func(bts []byte) bool {
-			return bytes.Contains(bts, []byte("Help")) ||
-				bytes.Contains(bts, []byte("Worktree")) ||
-				bytes.Contains(bts, []byte("Tips & Shortcuts"))
-		},
-		teatest.WithCheckInterval(100*time.Millisecond),
-		teatest.WithDuration(2*time.Second),
-	)
+	tm.Send(runeKey("?"))
+	waitForModel(t, tm, screenShown(appscreen.TypeHelp))
 
 	// Press 'q' to close help
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("q")})
-	time.Sleep(10 * time.Millisecond)
+	tm.Send(runeKey("q"))
 
 	// Quit the app
 	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlC})
 
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
-
-	fm := tm.FinalModel(t)
-	m, ok := fm.(*Model)
-	if !ok {
-		t.Fatal("Final model is not *Model type")
-	}
+	m := finalModel(t, tm)
 
 	// Help screen should be closed (screen manager should be inactive)
-	if m.state.ui.screenManager.IsActive() && m.state.ui.screenManager.Type() == appscreen.TypeHelp {
+	if m.state.ui.screenManager.Type() == appscreen.TypeHelp {
 		t.Error("Help screen should be closed after pressing 'q'")
 	}
 }
@@ -247,9 +179,7 @@ func TestHelpScreen(t *testing.T) {
 // TestWindowResize tests window resize handling
 func TestWindowResize(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Send window size message
@@ -276,9 +206,7 @@ func TestWindowResize(t *testing.T) {
 // TestVerySmallTerminalSize tests handling of very small terminal sizes
 func TestVerySmallTerminalSize(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Send a very small window size message that previously caused a panic
@@ -312,41 +240,23 @@ func TestVerySmallTerminalSize(t *testing.T) {
 
 // TestCommandPalette tests command palette functionality
 func TestCommandPalette(t *testing.T) {
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	time.Sleep(20 * time.Millisecond)
+	t.Parallel()
+	tm := newLoadedTestModel(t, newTestConfig(t))
 
-	// Press 'ctrl+p' to show command palette
 	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlP})
-	time.Sleep(10 * time.Millisecond)
-
-	// First Esc exits filter mode (filter is active by default)
-	tm.Send(tea.KeyMsg{Type: tea.KeyEsc})
-	time.Sleep(10 * time.Millisecond)
-
-	// Second Esc closes the palette
-	tm.Send(tea.KeyMsg{Type: tea.KeyEsc})
-	time.Sleep(10 * time.Millisecond)
-
-	// Quit
-	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlC})
-
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
+	waitForModel(t, tm, screenShown(appscreen.TypePalette))
+
+	// The first Esc exits filter mode (the filter is active by default), the
+	// second closes the palette.
+	sendKeys(tm,
+		tea.KeyMsg{Type: tea.KeyEsc},
+		tea.KeyMsg{Type: tea.KeyEsc},
+		tea.KeyMsg{Type: tea.KeyCtrlC},
+	)
 
-	fm := tm.FinalModel(t)
-	m, ok := fm.(*Model)
-	if !ok {
-		t.Fatal("Final model is not *Model type")
-	}
+	m := finalModel(t, tm)
 
-	if m.state.ui.screenManager.IsActive() && m.state.ui.screenManager.Type() == appscreen.TypePalette {
+	if m.state.ui.screenManager.Type() == appscreen.TypePalette {
 		t.Error("Command palette should be closed after pressing escape twice")
 	}
 }
@@ -354,9 +264,7 @@ func TestCommandPalette(t *testing.T) {
 // TestViewRendering tests that the View method doesn't panic and produces output
 func TestViewRendering(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Set window size first (View needs this)
@@ -375,47 +283,23 @@ func TestViewRendering(t *testing.T) {
 
 // TestArrowKeyNavigation tests arrow key navigation in different panes
 func TestArrowKeyNavigation(t *testing.T) {
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
-	tm := teatest.NewTestModel(
-		t,
-		NewModel(cfg, ""),
-		teatest.WithInitialTermSize(120, 40),
-	)
-
-	time.Sleep(20 * time.Millisecond)
-
-	// Test down/up arrows in worktree table
-	tm.Send(tea.KeyMsg{Type: tea.KeyDown})
-	time.Sleep(10 * time.Millisecond)
-
-	tm.Send(tea.KeyMsg{Type: tea.KeyUp})
-	time.Sleep(10 * time.Millisecond)
-
-	// Switch to pane 2 (viewport)
-	tm.Send(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune("2")})
-	time.Sleep(10 * time.Millisecond)
-
-	// Test scrolling in viewport
-	tm.Send(tea.KeyMsg{Type: tea.KeyDown})
-	time.Sleep(10 * time.Millisecond)
+	t.Parallel()
+	tm := newLoadedTestModel(t, newTestConfig(t))
 
-	tm.Send(tea.KeyMsg{Type: tea.KeyUp})
-	time.Sleep(10 * time.Millisecond)
+	down := tea.KeyMsg{Type: tea.KeyDown}
+	up := tea.KeyMsg{Type: tea.KeyUp}
 
-	// Quit
-	tm.Send(tea.KeyMsg{Type: tea.KeyCtrlC})
+	// Move in the worktree table, then switch to pane 2 (viewport) and
+	// scroll it.
+	sendKeys(tm, down, up, runeKey("2"), down, up, tea.KeyMsg{Type: tea.KeyCtrlC})
 
-	tm.WaitFinished(t, teatest.WithFinalTimeout(2*time.Second))
+	tm.WaitFinished(t, teatest.WithFinalTimeout(probeTimeout))
 }
 
 // TestMouseEvents tests that mouse events don't cause panics
 func TestMouseEvents(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 	m.setWindowSize(120, 40)
 
@@ -453,9 +337,7 @@ func TestMouseEvents(t *testing.T) {
 // TestCleanup tests that the Close method properly cleans up resources
 func TestCleanup(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Should not panic
@@ -468,9 +350,7 @@ func TestCleanup(t *testing.T) {
 // TestCommitScreenEscapeKey tests that ESC key closes the commit screen
 func TestCommitScreenEscapeKey(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Set up the commit screen via screen manager
@@ -481,12 +361,13 @@ func TestCommitScreenEscapeKey(t *testing.T) {
 	escMsg := tea.KeyMsg{Type: tea.KeyEsc}
 
 	// Log what we're testing
-	t.Logf("ESC key string: %q", escMsg.String())
+	escKey := escMsg.String()
+	t.Logf("ESC key string: %q", escKey)
 	t.Logf("keyEsc constant: %q", keyEsc)
 
 	// Check if the key matches
-	if escMsg.String() != keyEsc {
-		t.Errorf("ESC key string %q doesn't match keyEsc %q", escMsg.String(), keyEsc)
+	if escKey != keyEsc {
+		t.Errorf("ESC key string %q doesn't match keyEsc %q", escKey, keyEsc)
 	}
 
 	// Call handleScreenKey
@@ -503,9 +384,7 @@ func TestCommitScreenEscapeKey(t *testing.T) {
 // Some terminals send ESC as a raw byte rather than the special tea.KeyEsc type
 func TestCommitScreenRawEscapeKey(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Set up the commit screen via screen manager
@@ -534,9 +413,7 @@ func TestWorktreeLoadingFlow(t *testing.T) {
 	t.Parallel()
 
 	t.Run("with git validation", func(t *testing.T) {
-		cfg := &config.AppConfig{
-			WorktreeDir: t.TempDir(),
-		}
+		cfg := newTestConfig(t)
 		m := NewModel(cfg, "")
 		mockGitWorktreeList(t, m, filepath.Join(cfg.WorktreeDir, "valid"))
 
@@ -572,9 +449,7 @@ func TestWorktreeLoadingFlow(t *testing.T) {
 	})
 
 	t.Run("without git service", func(t *testing.T) {
-		cfg := &config.AppConfig{
-			WorktreeDir: t.TempDir(),
-		}
+		cfg := newTestConfig(t)
 		m := NewModel(cfg, "")
 		m.state.services.git = nil
 		m.repoKey = "test-repo"
@@ -614,9 +489,7 @@ func TestWorktreeLoadingFlow(t *testing.T) {
 // TestPRFetchingFlow tests PR data loading flow
 func TestPRFetchingFlow(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 	m.state.data.worktrees = []*models.WorktreeInfo{
 		{Path: "/tmp/pr-123", Branch: "pr-123", PR: nil},
@@ -645,9 +518,7 @@ func TestPRFetchingFlow(t *testing.T) {
 // TestCIStatusCaching tests CI status loading and caching
 func TestCIStatusCaching(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Load CI status for a branch
@@ -685,16 +556,14 @@ func TestCIStatusCaching(t *testing.T) {
 // TestMultipleErrorHandling tests proper error handling across message types
 func TestMultipleErrorHandling(t *testing.T) {
 	t.Parallel()
-	cfg := &config.AppConfig{
-		WorktreeDir: t.TempDir(),
-	}
+	cfg := newTestConfig(t)
 	m := NewModel(cfg, "")
 
 	// Test worktrees load error
 	loadMsg := worktreesLoadedMsg{worktrees: nil, err: os.ErrPermission}
 	updated, _ := m.handleWorktreesLoaded(loadMsg)
 	m = updated.(*Model)
-	if !m.state.ui.screenManager.IsActive() || m.state.ui.screenManager.Type() != appscreen.TypeInfo {
+	if m.state.ui.screenManager.Type() != appscreen.TypeInfo {
 		t.Error("expected error to show info screen")
 	}
 
@@ -39,6 +39,13 @@ type layoutDims struct {
 	bottomRightInnerHeight int
 }
 
+// appliedLayoutKey captures everything applyLayout derives widget sizes from.
+type appliedLayoutKey struct {
+	layout       layoutDims
+	zoomedPane   int
+	showPRColumn bool
+}
+
 // setWindowSize updates the window dimensions and applies the layout.
 func (m *Model) setWindowSize(width, height int) {
 	m.state.view.WindowWidth = width
@@ -275,6 +282,18 @@ func (m *Model) computeTopLayoutDims(width, height, headerHeight, footerHeight,
 
 // applyLayout applies the computed layout dimensions to UI components.
 func (m *Model) applyLayout(layout layoutDims) {
+	// Resizing a table re-renders its viewport, and View applies the layout
+	// on every frame; only touch the widgets when the dimensions change.
+	key := appliedLayoutKey{
+		layout:       layout,
+		zoomedPane:   m.state.view.ZoomedPane,
+		showPRColumn: m.prDataLoaded && !m.config.DisablePR,
+	}
+	if m.appliedLayout != nil && *m.appliedLayout == key {
+		return
+	}
+	m.appliedLayout = &key
+
 	titleHeight := 1
 	tableHeaderHeight := 1 // bubbles table has its own header
 
@@ -191,3 +191,29 @@ func TestZoomModeIgnoresTopLayout(t *testing.T) {
 	assert.Equal(t, state.LayoutDefault, layout.layoutMode)
 	assert.Equal(t, 120, layout.leftWidth)
 }
+
+func TestApplyLayoutSkipsUnchangedDimensions(t *testing.T) {
+	t.Parallel()
+
+	cfg := &config.AppConfig{
+		WorktreeDir: t.TempDir(),
+	}
+	m := NewModel(cfg, "")
+	m.state.view.WindowWidth = 120
+	m.state.view.WindowHeight = 40
+
+	layout := m.computeLayout()
+	m.applyLayout(layout)
+	assert.Equal(t, layout.leftInnerWidth, m.state.ui.worktreeTable.Width())
+
+	// An unchanged layout leaves the widgets alone.
+	m.state.ui.worktreeTable.SetWidth(10)
+	m.applyLayout(m.computeLayout())
+	assert.Equal(t, 10, m.state.ui.worktreeTable.Width())
+
+	// A resize applies again.
+	m.state.view.WindowWidth = 100
+	layout = m.computeLayout()
+	m.applyLayout(layout)
+	assert.Equal(t, layout.leftInnerWidth, m.state.ui.worktreeTable.Width())
+}
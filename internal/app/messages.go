@@ -9,6 +9,7 @@ import (
 	"github.com/charmbracelet/bubbles/textinput"
 	tea "github.com/charmbracelet/bubbletea"
 	"github.com/chmouel/lazyworktree/internal/app/screen"
+	"github.com/chmouel/lazyworktree/internal/git"
 	log "github.com/chmouel/lazyworktree/internal/log"
 	"github.com/chmouel/lazyworktree/internal/models"
 	"github.com/chmouel/lazyworktree/internal/utils"
@@ -19,8 +20,12 @@ func (m *Model) handleWorktreeMessages(msg tea.Msg) (tea.Model, tea.Cmd) {
 	switch msg := msg.(type) {
 	case worktreesLoadedMsg:
 		return m.handleWorktreesLoaded(msg)
+	case worktreeProbedMsg:
+		return m.handleWorktreeProbed(msg)
 	case cachedWorktreesMsg:
 		return m.handleCachedWorktrees(msg)
+	case repoKeyResolvedMsg:
+		return m.handleRepoKeyResolved(msg)
 	case pruneResultMsg:
 		return m.handlePruneResult(msg)
 	case absorbMergeResultMsg:
@@ -33,6 +38,7 @@ func (m *Model) handleWorktreeMessages(msg tea.Msg) (tea.Model, tea.Cmd) {
 // handleWorktreesLoaded processes worktrees loaded message.
 func (m *Model) handleWorktreesLoaded(msg worktreesLoadedMsg) (tea.Model, tea.Cmd) {
 	m.worktreesLoaded = true
+	m.worktreesPartial = false
 	// Don't clear loading screen if we're in the middle of push/sync operations
 	if m.loadingOperation != "push" && m.loadingOperation != "sync" {
 		m.loading = false
@@ -66,11 +72,8 @@ func (m *Model) handleWorktreesLoaded(msg worktreesLoadedMsg) (tea.Model, tea.Cm
 	if m.pendingSelectWorktreePath != "" {
 		m.recordAccess(m.pendingSelectWorktreePath)
 		// Update the LastSwitchedTS for this worktree before sorting
-		for _, wt := range m.state.data.worktrees {
-			if wt.Path == m.pendingSelectWorktreePath {
-				wt.LastSwitchedTS = m.state.data.accessHistory[wt.Path]
-				break
-			}
+		if wt := m.worktreeByPath(m.pendingSelectWorktreePath); wt != nil {
+			wt.LastSwitchedTS = m.state.data.accessHistory[wt.Path]
 		}
 	}
 
@@ -120,15 +123,59 @@ func (m *Model) handleWorktreesLoaded(msg worktreesLoadedMsg) (tea.Model, tea.Cm
 	return m, tea.Batch(cmds...)
 }
 
+// handleWorktreeProbed shows a worktree from the initial listing as soon as
+// its status is known, unless cached or complete results are already shown.
+// Probes that arrived in the meantime are taken too, so a burst of them
+// rebuilds the table once.
+func (m *Model) handleWorktreeProbed(msg worktreeProbedMsg) (tea.Model, tea.Cmd) {
+	if m.worktreesLoaded || (len(m.state.data.worktrees) > 0 && !m.worktreesPartial) {
+		return m, waitForWorktreeUpdate(msg.next)
+	}
+	m.worktreesPartial = true
+
+	m.addProbedWorktree(msg.worktree)
+	next := m.takeProbedWorktrees(msg.next)
+	m.updateTable()
+	return m, next
+}
+
+// takeProbedWorktrees adds the probes already waiting on updates and returns
+// the command that continues the stream.
+func (m *Model) takeProbedWorktrees(updates <-chan tea.Msg) tea.Cmd {
+	for {
+		select {
+		case update, ok := <-updates:
+			if !ok {
+				return nil
+			}
+			probe, isProbe := update.(worktreeProbedMsg)
+			if !isProbe {
+				return func() tea.Msg { return update }
+			}
+			m.addProbedWorktree(probe.worktree)
+		default:
+			return waitForWorktreeUpdate(updates)
+		}
+	}
+}
+
+func (m *Model) addProbedWorktree(wt *models.WorktreeInfo) {
+	if ts, ok := m.state.data.accessHistory[wt.Path]; ok {
+		wt.LastSwitchedTS = ts
+	}
+	m.state.data.worktrees = append(m.state.data.worktrees, wt)
+}
+
 // handleCachedWorktrees processes cached worktrees message.
 func (m *Model) handleCachedWorktrees(msg cachedWorktreesMsg) (tea.Model, tea.Cmd) {
 	if m.worktreesLoaded || len(msg.worktrees) == 0 {
 		return m, nil
 	}
+	m.worktreesPartial = false
 
 	// Filter out stale entries that no longer exist in git
 	// If validPaths is nil, git service is unavailable - skip validation
-	validPaths := m.getValidWorktreePaths()
+	validPaths := m.getValidWorktreePaths(git.WorktreeListTTL)
 	var validated []*models.WorktreeInfo
 	if validPaths == nil {
 		validated = msg.worktrees
@@ -166,6 +213,35 @@ func (m *Model) handleCachedWorktrees(msg cachedWorktreesMsg) (tea.Model, tea.Cm
 	return m, nil
 }
 
+// handleRepoKeyResolved loads the per-repository state once the repo key is
+// known, then reads the worktree cache stored under it.
+func (m *Model) handleRepoKeyResolved(msg repoKeyResolvedMsg) (tea.Model, tea.Cmd) {
+	if m.repoKey == "" {
+		m.repoKey = msg.key
+	}
+	m.loadCommandHistory()
+	m.loadAccessHistory()
+	m.loadWorktreeNotes()
+	m.loadPaletteHistory()
+
+	// Worktrees may have been listed while the key was resolving.
+	if len(m.state.data.worktrees) > 0 {
+		for _, wt := range m.state.data.worktrees {
+			if ts, ok := m.state.data.accessHistory[wt.Path]; ok {
+				wt.LastSwitchedTS = ts
+			}
+		}
+		m.updateTable()
+	}
+	// A listing that finished first could not be cached without the key,
+	// and is fresher than anything the cache holds.
+	if m.worktreesLoaded {
+		m.saveCache()
+		return m, nil
+	}
+	return m, m.loadCache()
+}
+
 // handlePruneResult processes prune result message.
 func (m *Model) handlePruneResult(msg pruneResultMsg) (tea.Model, tea.Cmd) {
 	m.loading = false
@@ -291,14 +367,16 @@ func (m *Model) handlePRDataLoaded(msg prDataLoadedMsg) (tea.Model, tea.Cmd) {
 		// Update columns before rows to include the PR column
 		m.updateTableColumns(m.state.ui.worktreeTable.Width())
 		m.updateTable()
+		// Persist PR data now so the next start shows it before any fetch.
+		saveCmd := m.saveCacheCmd()
 
 		// If we were triggered from showPruneMerged, run the merged check now
 		if m.checkMergedAfterPRRefresh {
 			m.checkMergedAfterPRRefresh = false
-			return m, m.performMergedWorktreeCheck()
+			return m, tea.Batch(saveCmd, m.performMergedWorktreeCheck())
 		}
 
-		return m, m.updateDetailsView()
+		return m, tea.Batch(saveCmd, m.updateDetailsView())
 	}
 	// Even if PR fetch failed, run merged check if requested (will fall back to git-based detection)
 	if m.checkMergedAfterPRRefresh {
@@ -326,23 +404,20 @@ func (m *Model) handleCIStatusLoaded(msg ciStatusLoadedMsg) (tea.Model, tea.Cmd)
 // handleSinglePRLoaded processes PR data loaded for a single worktree.
 func (m *Model) handleSinglePRLoaded(msg singlePRLoadedMsg) (tea.Model, tea.Cmd) {
 	// Find the worktree and update its PR
-	for _, wt := range m.state.data.worktrees {
-		if wt.Path == msg.worktreePath {
-			switch {
-			case msg.err != nil:
-				wt.PRFetchError = msg.err.Error()
-				wt.PRFetchStatus = models.PRFetchStatusError
-				wt.PR = nil
-			case msg.pr != nil:
-				wt.PR = msg.pr
-				wt.PRFetchStatus = models.PRFetchStatusLoaded
-				wt.PRFetchError = ""
-			default:
-				wt.PR = nil
-				wt.PRFetchStatus = models.PRFetchStatusNoPR
-				wt.PRFetchError = ""
-			}
-			break
+	if wt := m.worktreeByPath(msg.worktreePath); wt != nil {
+		switch {
+		case msg.err != nil:
+			wt.PRFetchError = msg.err.Error()
+			wt.PRFetchStatus = models.PRFetchStatusError
+			wt.PR = nil
+		case msg.pr != nil:
+			wt.PR = msg.pr
+			wt.PRFetchStatus = models.PRFetchStatusLoaded
+			wt.PRFetchError = ""
+		default:
+			wt.PR = nil
+			wt.PRFetchStatus = models.PRFetchStatusNoPR
+			wt.PRFetchError = ""
 		}
 	}
 
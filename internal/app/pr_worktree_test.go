@@ -301,7 +301,7 @@ func TestHandleOpenPRsLoadedAttachedBranchSelectsWorktree(t *testing.T) {
 	m := NewModel(cfg, "")
 	m.setWindowSize(120, 40)
 	m.state.services.git.SetCommandRunner(func(_ context.Context, _ string, _ ...string) *exec.Cmd {
-		return exec.Command("bash", "-lc", "exit 1")
+		return exec.Command("false")
 	})
 
 	mainPath := filepath.Join(cfg.WorktreeDir, "main")
@@ -396,11 +396,11 @@ func TestHandleOpenPRsLoadedCreateNonAuthorUsesGeneratedBranch(t *testing.T) {
 		cmd := strings.Join(append([]string{name}, args...), " ")
 		switch cmd {
 		case "git remote get-url origin":
-			return exec.Command("bash", "-lc", "echo https://github.com/org/repo.git")
+			return exec.Command("echo", "https://github.com/org/repo.git")
 		case "gh api user --jq .login":
-			return exec.Command("bash", "-lc", "echo reviewer")
+			return exec.Command("echo", "reviewer")
 		default:
-			return exec.Command("bash", "-lc", "exit 1")
+			return exec.Command("false")
 		}
 	})
 
@@ -5,11 +5,13 @@ import (
 	"regexp"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/charmbracelet/lipgloss"
 	"github.com/chmouel/lazyworktree/internal/app/state"
 	"github.com/chmouel/lazyworktree/internal/models"
+	"github.com/chmouel/lazyworktree/internal/theme"
 )
 
 type annotationKeywordSpec struct {
@@ -82,14 +84,27 @@ var annotationKeywordSpecs = []annotationKeywordSpec{
 	},
 }
 
+// The note renderers' tables and patterns are built on first use rather
+// than at package init, so startups and CLI commands that never render a
+// note do not pay for compiling them.
 var (
-	annotationAliasMap     = buildAnnotationAliasMap()
-	annotationKeywordRegex = regexp.MustCompile(buildAnnotationKeywordPattern())
-	markdownInlineLinkRe   = regexp.MustCompile(`\[([^\]]+)\]\(([^)\s]+)\)`)
-	markdownStrongRe       = regexp.MustCompile(`\*\*([^*]+)\*\*|__([^_]+)__`)
-	markdownInlineCodeRe   = regexp.MustCompile("`([^`]+)`")
+	annotationAliasMap     = sync.OnceValue(buildAnnotationAliasMap)
+	annotationKeywordRegex = sync.OnceValue(func() *regexp.Regexp {
+		return regexp.MustCompile(buildAnnotationKeywordPattern())
+	})
+	markdownInlineLinkRe = lazyRegexp(`\[([^\]]+)\]\(([^)\s]+)\)`)
+	markdownStrongRe     = lazyRegexp(`\*\*([^*]+)\*\*|__([^_]+)__`)
+	markdownInlineCodeRe = lazyRegexp("`([^`]+)`")
 )
 
+// lazyRegexp returns a function that compiles expr the first time it is
+// called and returns the same *regexp.Regexp afterwards.
+func lazyRegexp(expr string) func() *regexp.Regexp {
+	return sync.OnceValue(func() *regexp.Regexp {
+		return regexp.MustCompile(expr)
+	})
+}
+
 func buildAnnotationAliasMap() map[string]annotationKeywordSpec {
 	aliases := make(map[string]annotationKeywordSpec, 32)
 	for _, spec := range annotationKeywordSpecs {
@@ -149,7 +164,7 @@ func (m *Model) annotationKeywordStyle(spec annotationKeywordSpec) lipgloss.Styl
 }
 
 func (m *Model) renderAnnotationKeywords(line string, valueStyle lipgloss.Style) string {
-	matches := annotationKeywordRegex.FindAllStringSubmatchIndex(line, -1)
+	matches := annotationKeywordRegex().FindAllStringSubmatchIndex(line, -1)
 	if len(matches) == 0 {
 		return valueStyle.Render(line)
 	}
@@ -178,7 +193,7 @@ func (m *Model) renderAnnotationKeywords(line string, valueStyle lipgloss.Style)
 		}
 
 		alias := line[kwStart:kwEnd]
-		spec, ok := annotationAliasMap[alias]
+		spec, ok := annotationAliasMap()[alias]
 		if !ok {
 			b.WriteString(valueStyle.Render(line[matchStart:matchEnd]))
 			last = matchEnd
@@ -333,16 +348,16 @@ func (m *Model) renderInlineMarkdown(line string) string {
 	codeStyle := lipgloss.NewStyle().Foreground(m.theme.Cyan)
 	strongStyle := lipgloss.NewStyle().Bold(true).Foreground(m.theme.TextFg)
 
-	line = markdownInlineCodeRe.ReplaceAllStringFunc(line, func(match string) string {
-		parts := markdownInlineCodeRe.FindStringSubmatch(match)
+	line = markdownInlineCodeRe().ReplaceAllStringFunc(line, func(match string) string {
+		parts := markdownInlineCodeRe().FindStringSubmatch(match)
 		if len(parts) != 2 {
 			return match
 		}
 		return codeStyle.Render(parts[1])
 	})
 
-	line = markdownStrongRe.ReplaceAllStringFunc(line, func(match string) string {
-		parts := markdownStrongRe.FindStringSubmatch(match)
+	line = markdownStrongRe().ReplaceAllStringFunc(line, func(match string) string {
+		parts := markdownStrongRe().FindStringSubmatch(match)
 		if len(parts) != 3 {
 			return match
 		}
@@ -354,8 +369,8 @@ func (m *Model) renderInlineMarkdown(line string) string {
 		return strongStyle.Render(content)
 	})
 
-	return markdownInlineLinkRe.ReplaceAllStringFunc(line, func(match string) string {
-		parts := markdownInlineLinkRe.FindStringSubmatch(match)
+	return markdownInlineLinkRe().ReplaceAllStringFunc(line, func(match string) string {
+		parts := markdownInlineLinkRe().FindStringSubmatch(match)
 		if len(parts) != 3 {
 			return match
 		}
@@ -369,6 +384,32 @@ func (m *Model) renderInlineMarkdown(line string) string {
 	})
 }
 
+// noteLinesKey identifies a rendered note: its text plus everything the
+// rendering reads from the model.
+type noteLinesKey struct {
+	text    string
+	theme   *theme.Theme
+	iconSet string
+}
+
+// noteLines renders a worktree note in the default text style. Notes are
+// redrawn on every info pane rebuild, including each step through CI
+// checks, so rendered notes are cached until their text or the theme
+// changes.
+func (m *Model) noteLines(noteText string) []string {
+	key := noteLinesKey{text: noteText, theme: m.theme, iconSet: m.config.IconSet}
+	if m.cache.noteLines != nil {
+		if lines, ok := m.cache.noteLines.Get(key); ok {
+			return lines
+		}
+	}
+	lines := m.renderMarkdownNoteLines(noteText, lipgloss.NewStyle().Foreground(m.theme.TextFg))
+	if m.cache.noteLines != nil {
+		m.cache.noteLines.Set(key, lines)
+	}
+	return lines
+}
+
 func (m *Model) renderMarkdownNoteLines(noteText string, valueStyle lipgloss.Style) []string {
 	normalized := strings.ReplaceAll(noteText, "\r\n", "\n")
 	lines := strings.Split(normalized, "\n")
@@ -751,7 +792,7 @@ func (m *Model) buildInfoContent(wt *models.WorktreeInfo) string {
 	if note, ok := m.getWorktreeNote(wt.Path); ok {
 		infoLines = append(infoLines, "")
 		infoLines = append(infoLines, sectionStyle.Render("Notes:"))
-		infoLines = append(infoLines, m.renderMarkdownNoteLines(note.Note, valueStyle)...)
+		infoLines = append(infoLines, m.noteLines(note.Note)...)
 	}
 	hidePRDetails := wt.PR != nil && wt.IsMain && (wt.PR.State == prStateMerged || wt.PR.State == prStateClosed)
 	if wt.PR != nil && !hidePRDetails && !m.config.DisablePR {
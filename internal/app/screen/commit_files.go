@@ -74,6 +74,13 @@ type CommitFilesScreen struct {
 
 // NewCommitFilesScreen creates a commit files tree screen.
 func NewCommitFilesScreen(sha, wtPath string, files []models.CommitFile, meta CommitMeta, maxWidth, maxHeight int, thm *theme.Theme, showIcons bool) *CommitFilesScreen {
+	return NewCommitFilesScreenWithTree(sha, wtPath, files, BuildCompressedCommitFileTree(files), meta, maxWidth, maxHeight, thm, showIcons)
+}
+
+// NewCommitFilesScreenWithTree creates a commit files tree screen from a tree
+// already built with BuildCompressedCommitFileTree. The tree is only read, so
+// callers may share it between screens showing the same commit.
+func NewCommitFilesScreenWithTree(sha, wtPath string, files []models.CommitFile, tree *CommitFileTreeNode, meta CommitMeta, maxWidth, maxHeight int, thm *theme.Theme, showIcons bool) *CommitFilesScreen {
 	width := int(float64(maxWidth) * 0.8)
 	height := int(float64(maxHeight) * 0.8)
 	if width < 60 {
@@ -105,16 +112,23 @@ func NewCommitFilesScreen(sha, wtPath string, files []models.CommitFile, meta Co
 		FilterInput:   ti,
 	}
 
-	screen.Tree = BuildCommitFileTree(files)
-	SortCommitFileTree(screen.Tree)
-	for _, child := range screen.Tree.Children {
-		CompressCommitFileTree(child)
-	}
+	screen.Tree = tree
 	screen.RebuildFlat()
 
 	return screen
 }
 
+// BuildCompressedCommitFileTree builds, sorts and compresses the tree shown
+// when a commit files screen opens.
+func BuildCompressedCommitFileTree(files []models.CommitFile) *CommitFileTreeNode {
+	tree := BuildCommitFileTree(files)
+	SortCommitFileTree(tree)
+	for _, child := range tree.Children {
+		CompressCommitFileTree(child)
+	}
+	return tree
+}
+
 // Type returns TypeCommitFiles to identify this screen.
 func (s *CommitFilesScreen) Type() Type {
 	return TypeCommitFiles
@@ -24,6 +24,12 @@ type HelpScreen struct {
 	SearchQuery string
 	Thm         *theme.Theme
 	ShowIcons   bool
+
+	// The styled text is cached per search query and theme, as View runs
+	// on every frame while the help text itself never changes.
+	content       string
+	renderedQuery string
+	renderedThm   *theme.Theme
 }
 
 const (
@@ -360,8 +366,24 @@ func (s *HelpScreen) SetSize(maxWidth, maxHeight int) {
 	s.Viewport.Height = maxInt(5, s.Height-4)
 }
 
-// renderContent applies styling and search filtering to help text.
+// contentCurrent reports whether the cached content matches the current
+// search query and theme.
+func (s *HelpScreen) contentCurrent() bool {
+	return s.renderedThm != nil && s.renderedThm == s.Thm && s.renderedQuery == s.SearchQuery
+}
+
+// renderContent applies styling and search filtering to help text, reusing
+// the previous result while the query and theme are unchanged.
 func (s *HelpScreen) renderContent() string {
+	if !s.contentCurrent() {
+		s.content = s.buildContent()
+		s.renderedQuery = s.SearchQuery
+		s.renderedThm = s.Thm
+	}
+	return s.content
+}
+
+func (s *HelpScreen) buildContent() string {
 	lines := s.FullText
 
 	// Apply styling to help content
@@ -443,13 +465,13 @@ func highlightMatches(line, lowerLine, lowerQuery string, style lipgloss.Style)
 
 // View renders the help content and search input inside the viewport.
 func (s *HelpScreen) View() string {
-	content := s.renderContent()
-
 	// Keep viewport sized to available area (minus header/search lines)
 	vHeight := maxInt(5, s.Height-4) // -4 for borders/header/footer
 	s.Viewport.Width = s.Width - 2   // -2 for borders
 	s.Viewport.Height = vHeight
-	s.Viewport.SetContent(content)
+	if !s.contentCurrent() {
+		s.Viewport.SetContent(s.renderContent())
+	}
 
 	// Enhanced help modal with rounded border
 	boxStyle := lipgloss.NewStyle().
@@ -0,0 +1,38 @@
+package screen
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/chmouel/lazyworktree/internal/theme"
+)
+
+func TestHelpScreenContentFollowsQueryAndTheme(t *testing.T) {
+	s := NewHelpScreen(120, 40, nil, theme.Dracula(), false)
+	full := s.renderContent()
+	if !strings.Contains(full, "Navigation") {
+		t.Fatalf("expected help content, got %q", full)
+	}
+	if s.View() != s.View() {
+		t.Fatal("expected repeated views to match")
+	}
+
+	s.SearchQuery = "quit application"
+	filtered := s.renderContent()
+	if filtered == full || !strings.Contains(strings.ToLower(filtered), "quit") {
+		t.Fatalf("expected content filtered by query, got %q", filtered)
+	}
+	if !strings.Contains(strings.ToLower(s.View()), "quit") {
+		t.Fatal("expected view to show the filtered content")
+	}
+
+	s.SearchQuery = ""
+	s.Thm = theme.TokyoNight()
+	if s.contentCurrent() {
+		t.Fatal("expected a theme change to invalidate the cached content")
+	}
+	s.View()
+	if !s.contentCurrent() {
+		t.Fatal("expected view to render content for the new theme")
+	}
+}
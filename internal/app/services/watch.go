@@ -220,7 +220,7 @@ func (w *GitWatchService) resolveGitCommonDir(ctx context.Context) string {
 	if w.git == nil {
 		return ""
 	}
-	commonDir := strings.TrimSpace(w.git.RunGit(ctx, []string{"git", "rev-parse", "--git-common-dir"}, "", []int{0}, true, false))
+	commonDir := strings.TrimSpace(w.git.RunGit(ctx, []string{"git", "rev-parse", "--git-common-dir"}, "", nil, true, false))
 	if commonDir == "" {
 		return ""
 	}
@@ -228,7 +228,7 @@ func (w *GitWatchService) resolveGitCommonDir(ctx context.Context) string {
 		return commonDir
 	}
 
-	repoRoot := strings.TrimSpace(w.git.RunGit(ctx, []string{"git", "rev-parse", "--show-toplevel"}, "", []int{0}, true, false))
+	repoRoot := strings.TrimSpace(w.git.RunGit(ctx, []string{"git", "rev-parse", "--show-toplevel"}, "", nil, true, false))
 	if repoRoot != "" {
 		return filepath.Join(repoRoot, commonDir)
 	}
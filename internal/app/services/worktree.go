@@ -73,6 +73,7 @@ type GitService interface {
 	GetMainBranch(ctx context.Context) string
 	GetMergedBranches(ctx context.Context, baseBranch string) []string
 	RenameWorktree(ctx context.Context, oldPath, newPath, oldBranch, newBranch string) bool
+	ReleaseWorktree(worktreePath string)
 	ExecuteCommands(ctx context.Context, cmdList []string, cwd string, env map[string]string) error
 	RunGitWithCombinedOutput(ctx context.Context, args []string, cwd string, env map[string]string) ([]byte, error)
 }
@@ -118,7 +119,7 @@ func (s *worktreeService) CreateFromChanges(ctx context.Context, opts CreateFrom
 	}
 
 	// Get the stash ref
-	stashRef := s.git.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", []int{0}, true, false)
+	stashRef := s.git.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", nil, true, false)
 	if stashRef == "" || !strings.HasPrefix(stashRef, "stash@{") {
 		// Try to restore stash if we can't get the ref
 		s.git.RunCommandChecked(ctx, []string{"git", "stash", "pop"}, opts.SourcePath, "Failed to restore stash")
@@ -158,6 +159,7 @@ func (s *worktreeService) CreateFromChanges(ctx context.Context, opts CreateFrom
 
 func (s *worktreeService) Delete(ctx context.Context, path, branch string, deleteBranch bool) error {
 	if path != "" {
+		s.git.ReleaseWorktree(path)
 		if !s.git.RunCommandChecked(ctx, []string{"git", "worktree", "remove", "--force", path}, "", fmt.Sprintf("Failed to remove worktree %s", path)) {
 			return fmt.Errorf("failed to remove worktree %s", path)
 		}
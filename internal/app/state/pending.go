@@ -8,6 +8,7 @@ import (
 // PendingState keeps deferred command and UI input state.
 type PendingState struct {
 	Commands         []string
+	CommandsParallel bool
 	CommandEnv       map[string]string
 	CommandCwd       string
 	After            func() tea.Msg
@@ -294,3 +294,24 @@ func TestBuildInfoContentNotesRenderMarkdown(t *testing.T) {
 		t.Fatalf("did not expect annotation keyword replacement inside fenced code, got %q", plain)
 	}
 }
+
+func TestNoteLinesAreCachedUntilInputsChange(t *testing.T) {
+	cfg := config.DefaultConfig()
+	cfg.WorktreeDir = t.TempDir()
+	m := NewModel(cfg, "")
+
+	first := m.noteLines("TODO later")
+	second := m.noteLines("TODO later")
+	if &first[0] != &second[0] {
+		t.Fatal("expected unchanged note to reuse the rendered lines")
+	}
+
+	m.config.IconSet = "text"
+	textIcons := m.noteLines("TODO later")
+	if &textIcons[0] == &first[0] {
+		t.Fatal("expected icon set change to render the note again")
+	}
+	if !strings.Contains(stripANSISequences(textIcons[0]), "[ ] TODO") {
+		t.Fatalf("expected text icon badge, got %q", textIcons[0])
+	}
+}
@@ -4,8 +4,15 @@ import (
 	"context"
 	"fmt"
 	"os/exec"
+	"slices"
 	"strings"
 	"testing"
+	"time"
+
+	tea "github.com/charmbracelet/bubbletea"
+	"github.com/charmbracelet/x/exp/teatest"
+	appscreen "github.com/chmouel/lazyworktree/internal/app/screen"
+	"github.com/chmouel/lazyworktree/internal/config"
 )
 
 func mockGitWorktreeList(t *testing.T, m *Model, paths ...string) {
@@ -14,14 +21,15 @@ func mockGitWorktreeList(t *testing.T, m *Model, paths ...string) {
 		t.Fatal("git service must be initialised for mock setup")
 	}
 
-	porcelain := gitWorktreeListPorcelain(paths...)
+	// The listing command and its output are built once, not on every call.
+	listArgs := []string{"worktree", "list", "--porcelain"}
+	listing := gitWorktreeListPorcelain(paths...)
 	m.state.services.git.SetCommandRunner(func(_ context.Context, name string, args ...string) *exec.Cmd {
-		cmd := strings.Join(append([]string{name}, args...), " ")
-		if cmd == "git worktree list --porcelain" {
+		if name == "git" && slices.Equal(args, listArgs) {
 			// #nosec G204 -- test helper with controlled command and fixture output.
-			return exec.Command("bash", "-lc", "cat <<'EOF'\n"+porcelain+"EOF")
+			return exec.Command("printf", "%s", listing)
 		}
-		return exec.Command("bash", "-lc", "exit 1")
+		return exec.Command("false")
 	})
 }
 
@@ -35,3 +43,119 @@ func gitWorktreeListPorcelain(paths ...string) string {
 	}
 	return builder.String()
 }
+
+// probedModel wraps a Model run under teatest so tests can wait for a state
+// rather than sleeping for a guessed duration. Conditions are evaluated on
+// the program goroutine, right after each update, and signal as soon as
+// they hold. They run after every message, so they should read each model
+// field once.
+type probedModel struct {
+	*Model
+	pending []modelProbe
+}
+
+type modelProbe struct {
+	cond func(*Model) bool
+	done chan struct{}
+}
+
+func newProbedTestModel(t *testing.T, m *Model) *teatest.TestModel {
+	t.Helper()
+	return teatest.NewTestModel(t, &probedModel{Model: m}, teatest.WithInitialTermSize(120, 40))
+}
+
+// newLoadedTestModel runs a model built from cfg under teatest and returns
+// once its first worktree load has completed.
+func newLoadedTestModel(t *testing.T, cfg *config.AppConfig) *teatest.TestModel {
+	t.Helper()
+	tm := newProbedTestModel(t, NewModel(cfg, ""))
+	waitForModel(t, tm, worktreesLoaded)
+	return tm
+}
+
+// newTestConfig returns the default configuration used by tests, with
+// worktrees kept in a per-test temporary directory.
+func newTestConfig(t *testing.T) *config.AppConfig {
+	t.Helper()
+	return &config.AppConfig{WorktreeDir: t.TempDir()}
+}
+
+func (p *probedModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
+	m := p.Model
+	if probe, ok := msg.(modelProbe); ok {
+		// A probe does not change the model, so only the new condition needs
+		// checking, and one that already holds is answered straight away.
+		if probe.cond(m) {
+			close(probe.done)
+		} else {
+			p.pending = append(p.pending, probe)
+		}
+		return p, nil
+	}
+	_, cmd := m.Update(msg)
+	p.pending = slices.DeleteFunc(p.pending, func(probe modelProbe) bool {
+		if !probe.cond(m) {
+			return false
+		}
+		close(probe.done)
+		return true
+	})
+	return p, cmd
+}
+
+// probeTimeout bounds how long teatest flows wait for a model state or for
+// the program to exit.
+const probeTimeout = 2 * time.Second
+
+// waitForModel blocks until cond holds for the model run by tm, failing the
+// test after probeTimeout.
+func waitForModel(t *testing.T, tm *teatest.TestModel, cond func(*Model) bool) {
+	t.Helper()
+	done := make(chan struct{})
+	tm.Send(modelProbe{cond: cond, done: done})
+	timeout := time.NewTimer(probeTimeout)
+	defer timeout.Stop()
+	select {
+	case <-done:
+	case <-timeout.C:
+		t.Fatal("timed out waiting for model state")
+	}
+}
+
+// sendKeys sends keys to the program run by tm in order. The program handles
+// them one after the other, so no pause is needed between them.
+func sendKeys(tm *teatest.TestModel, keys ...tea.KeyMsg) {
+	for _, key := range keys {
+		tm.Send(key)
+	}
+}
+
+func runeKey(s string) tea.KeyMsg {
+	return tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune(s)}
+}
+
+// finalModel waits for the program run by tm to exit and returns its model.
+func finalModel(t *testing.T, tm *teatest.TestModel) *Model {
+	t.Helper()
+	pm, ok := tm.FinalModel(t, teatest.WithFinalTimeout(probeTimeout)).(*probedModel)
+	if !ok {
+		t.Fatal("Final model is not *probedModel type")
+	}
+	return pm.Model
+}
+
+func worktreesLoaded(m *Model) bool {
+	return m.worktreesLoaded
+}
+
+func focusedPane(pane int) func(*Model) bool {
+	return func(m *Model) bool {
+		return m.state.view.FocusedPane == pane
+	}
+}
+
+func screenShown(typ appscreen.Type) func(*Model) bool {
+	return func(m *Model) bool {
+		return m.state.ui.screenManager.Type() == typ
+	}
+}
@@ -18,7 +18,7 @@ func (m *Model) worktreeNoteKey(path string) string {
 	if notesPath == "" {
 		return worktreeNoteKey(path)
 	}
-	return services.WorktreeNoteKey(m.getRepoKey(), m.getWorktreeDir(), notesPath, path)
+	return services.WorktreeNoteKey(m.repoKey, m.getWorktreeDir(), notesPath, path)
 }
 
 func (m *Model) getWorktreeNotesPath() string {
@@ -54,7 +54,10 @@ func (m *Model) loadWorktreeNotes() {
 }
 
 func (m *Model) saveWorktreeNotes() {
-	if err := services.SaveWorktreeNotes(m.getRepoKey(), m.getWorktreeDir(), m.getWorktreeNotesPath(), m.worktreeNotes); err != nil {
+	if m.repoKey == "" {
+		return
+	}
+	if err := services.SaveWorktreeNotes(m.repoKey, m.getWorktreeDir(), m.getWorktreeNotesPath(), m.worktreeNotes); err != nil {
 		m.debugf("failed to write worktree notes: %v", err)
 	}
 }
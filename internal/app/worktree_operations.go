@@ -31,11 +31,11 @@ func (m *Model) showCreateFromCurrent() tea.Cmd {
 		}
 
 		// Check for changes
-		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, []int{0}, true, false)
+		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, nil, true, false)
 		hasChanges := strings.TrimSpace(statusRaw) != ""
 
 		// Get current branch
-		currentBranch := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-parse", "--abbrev-ref", "HEAD"}, currentWt.Path, []int{0}, true, false)
+		currentBranch := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-parse", "--abbrev-ref", "HEAD"}, currentWt.Path, nil, true, false)
 		if currentBranch == "" {
 			return errMsg{err: fmt.Errorf("failed to get current branch")}
 		}
@@ -72,7 +72,7 @@ func (m *Model) getCurrentBranchForMenu() string {
 		m.ctx,
 		[]string{"git", "rev-parse", "--abbrev-ref", "HEAD"},
 		currentWt.Path,
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -119,13 +119,13 @@ func (m *Model) showCreateWorktreeFromChanges() tea.Cmd {
 
 	// Check for changes in the selected worktree asynchronously
 	return func() tea.Msg {
-		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, wt.Path, []int{0}, true, false)
+		statusRaw := m.state.services.git.RunGit(m.ctx, []string{"git", "status", "--porcelain"}, wt.Path, nil, true, false)
 		if strings.TrimSpace(statusRaw) == "" {
 			return errMsg{err: fmt.Errorf("no changes to move")}
 		}
 
 		// Get current branch name
-		currentBranch := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-parse", "--abbrev-ref", "HEAD"}, wt.Path, []int{0}, true, false)
+		currentBranch := m.state.services.git.RunGit(m.ctx, []string{"git", "rev-parse", "--abbrev-ref", "HEAD"}, wt.Path, nil, true, false)
 		if currentBranch == "" {
 			return errMsg{err: fmt.Errorf("failed to get current branch")}
 		}
@@ -166,8 +166,7 @@ func (m *Model) showCreateFromChangesInput(wt *models.WorktreeInfo, currentBranc
 		}
 
 		// Check if branch exists in git
-		branchRef := m.state.services.git.RunGit(m.ctx, []string{"git", "show-ref", fmt.Sprintf("refs/heads/%s", newBranch)}, "", []int{0, 1}, true, true)
-		if branchRef != "" {
+		if m.localBranchExists(newBranch) {
 			// Branch exists
 			inputScr.ErrorMsg = fmt.Sprintf("Branch %q already exists.", newBranch)
 			return nil
@@ -197,7 +196,7 @@ func (m *Model) showCreateFromChangesInput(wt *models.WorktreeInfo, currentBranc
 		}
 
 		// Get the stash ref
-		stashRef := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", []int{0}, true, false))
+		stashRef := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", nil, true, false))
 		if stashRef == "" || !strings.HasPrefix(stashRef, "stash@{") {
 			// Try to restore stash if we can't get the ref
 			m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "stash", "pop"}, wt.Path, "Failed to restore stash")
@@ -234,7 +233,6 @@ func (m *Model) showCreateFromChangesInput(wt *models.WorktreeInfo, currentBranc
 
 		// Run init commands and refresh
 		env := m.buildCommandEnv(newBranch, targetPath)
-		initCmds := m.collectInitCommands()
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{
@@ -242,7 +240,7 @@ func (m *Model) showCreateFromChangesInput(wt *models.WorktreeInfo, currentBranc
 				err:       err,
 			}
 		}
-		return m.runCommandsWithTrust(initCmds, targetPath, env, after)
+		return m.runInitCommandsWithTrust(targetPath, env, after)
 	}
 
 	inputScr.OnCancel = func() tea.Cmd {
@@ -344,8 +342,7 @@ func (m *Model) handleCreateFromCurrentReady(msg createFromCurrentReadyMsg) tea.
 		}
 
 		// Check if branch exists in git
-		branchRef := m.state.services.git.RunGit(m.ctx, []string{"git", "show-ref", fmt.Sprintf("refs/heads/%s", newBranch)}, "", []int{0, 1}, true, true)
-		if branchRef != "" {
+		if m.localBranchExists(newBranch) {
 			inputScr.ErrorMsg = fmt.Sprintf("Branch %q already exists.", newBranch)
 			return nil
 		}
@@ -400,7 +397,7 @@ func (m *Model) executeCreateWithChanges(wt *models.WorktreeInfo, currentBranch,
 		}
 
 		// Stash changes with descriptive message
-		prevStashHash := m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", []int{0}, true, false)
+		prevStashHash := m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", nil, true, false)
 		stashMessage := fmt.Sprintf("git-wt-create move-current: %s", newBranch)
 		if !m.state.services.git.RunCommandChecked(
 			m.ctx,
@@ -411,13 +408,13 @@ func (m *Model) executeCreateWithChanges(wt *models.WorktreeInfo, currentBranch,
 			return errMsg{err: fmt.Errorf("failed to create stash for moving changes")}
 		}
 
-		newStashHash := m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", []int{0}, true, false)
+		newStashHash := m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", nil, true, false)
 		if newStashHash == "" || newStashHash == prevStashHash {
 			return errMsg{err: fmt.Errorf("failed to create stash for moving changes: no new entry created")}
 		}
 
 		// Get the stash ref
-		stashRef := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", []int{0}, true, false))
+		stashRef := strings.TrimSpace(m.state.services.git.RunGit(m.ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", nil, true, false))
 		if stashRef == "" || !strings.HasPrefix(stashRef, "stash@{") {
 			// Try to restore stash if we can't get the ref
 			m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "stash", "pop"}, wt.Path, "Failed to restore stash")
@@ -454,7 +451,6 @@ func (m *Model) executeCreateWithChanges(wt *models.WorktreeInfo, currentBranch,
 
 		// Run init commands and refresh
 		env := m.buildCommandEnv(newBranch, targetPath)
-		initCmds := m.collectInitCommands()
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{
@@ -462,7 +458,7 @@ func (m *Model) executeCreateWithChanges(wt *models.WorktreeInfo, currentBranch,
 				err:       err,
 			}
 		}
-		return m.runCommandsWithTrust(initCmds, targetPath, env, after)()
+		return m.runInitCommandsWithTrust(targetPath, env, after)()
 	}
 }
 
@@ -479,7 +475,6 @@ func (m *Model) executeCreateWithoutChanges(currentBranch, newBranch, targetPath
 		}
 
 		env := m.buildCommandEnv(newBranch, targetPath)
-		initCmds := m.collectInitCommands()
 		after := func() tea.Msg {
 			worktrees, err := m.state.services.git.GetWorktrees(m.ctx)
 			return worktreesLoadedMsg{
@@ -487,7 +482,7 @@ func (m *Model) executeCreateWithoutChanges(currentBranch, newBranch, targetPath
 				err:       err,
 			}
 		}
-		return m.runCommandsWithTrust(initCmds, targetPath, env, after)()
+		return m.runInitCommandsWithTrust(targetPath, env, after)()
 	}
 }
 
@@ -590,8 +585,7 @@ func (m *Model) showAnnotateWorktree() tea.Cmd {
 }
 
 func (m *Model) showWorktreeNoteViewer(worktreePath, noteText string) tea.Cmd {
-	valueStyle := lipgloss.NewStyle().Foreground(m.theme.TextFg)
-	content := strings.Join(m.renderMarkdownNoteLines(noteText, valueStyle), "\n")
+	content := strings.Join(m.noteLines(noteText), "\n")
 	viewer := appscreen.NewNoteViewScreen(
 		"Worktree notes",
 		content,
@@ -835,13 +829,16 @@ func (m *Model) performMergedWorktreeCheck() tea.Cmd {
 		// Build the prune routine that runs terminate commands per-worktree
 		pruneRoutine := func() tea.Msg {
 			// First, run git worktree prune to clean up git's internal tracking
-			m.state.services.git.RunGit(m.ctx, []string{"git", "worktree", "prune"}, "", []int{0}, true, true)
+			m.state.services.git.ReleaseMissingWorktrees()
+			m.state.services.git.RunGit(m.ctx, []string{"git", "worktree", "prune"}, "", nil, true, true)
 
 			pruned := 0
 			failed := 0
 			orphansDeleted := 0
 
 			// Prune merged worktrees
+			branchArgs := []string{"git", "branch", "-D"}
+			removed := make([]*models.WorktreeInfo, 0, len(toPrune))
 			for _, wt := range toPrune {
 				// Run terminate commands for each worktree with its environment
 				if len(terminateCmds) > 0 {
@@ -849,18 +846,34 @@ func (m *Model) performMergedWorktreeCheck() tea.Cmd {
 					_ = m.state.services.git.ExecuteCommands(m.ctx, terminateCmds, wt.Path, env)
 				}
 
-				ok1 := m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "worktree", "remove", "--force", wt.Path}, "", fmt.Sprintf("Failed to remove worktree %s", wt.Path))
-				ok2 := m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "branch", "-D", wt.Branch}, "", fmt.Sprintf("Failed to delete branch %s", wt.Branch))
-				if ok1 && ok2 {
-					pruned++
-				} else {
+				m.state.services.git.ReleaseWorktree(wt.Path)
+				if !m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "worktree", "remove", "--force", wt.Path}, "", fmt.Sprintf("Failed to remove worktree %s", wt.Path)) {
 					failed++
+					continue
+				}
+				removed = append(removed, wt)
+				branchArgs = append(branchArgs, wt.Branch)
+			}
+
+			// Delete the branches of all removed worktrees with a single git
+			// branch call; on failure, count whichever branches survived.
+			if len(removed) > 0 {
+				if m.state.services.git.RunCommandChecked(m.ctx, branchArgs, "", "Failed to delete merged branches") {
+					pruned += len(removed)
+				} else {
+					for _, wt := range removed {
+						if m.localBranchExists(wt.Branch) {
+							failed++
+						} else {
+							pruned++
+						}
+					}
 				}
 			}
 
 			// Delete orphaned directories
 			// Re-fetch valid paths to ensure we have current state
-			validPaths := m.getValidWorktreePaths()
+			validPaths := m.getValidWorktreePaths(0)
 			repoDir := m.getRepoWorktreeDir()
 
 			for _, orphanPath := range orphansToDelete {
@@ -996,6 +1009,7 @@ func (m *Model) deleteWorktreeCmd(wt *models.WorktreeInfo) func() tea.Cmd {
 	env := m.buildCommandEnv(wt.Branch, wt.Path)
 	terminateCmds := m.collectTerminateCommands()
 	afterCmd := func() tea.Msg {
+		m.state.services.git.ReleaseWorktree(wt.Path)
 		m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "worktree", "remove", "--force", wt.Path}, "", fmt.Sprintf("Failed to remove worktree %s", wt.Path))
 		m.state.services.git.RunCommandChecked(m.ctx, []string{"git", "branch", "-D", wt.Branch}, "", fmt.Sprintf("Failed to delete branch %s", wt.Branch))
 
@@ -1018,6 +1032,7 @@ func (m *Model) deleteWorktreeOnlyCmd(wt *models.WorktreeInfo) func() tea.Cmd {
 
 	afterCmd := func() tea.Msg {
 		// Only remove worktree
+		m.state.services.git.ReleaseWorktree(wt.Path)
 		success := m.state.services.git.RunCommandChecked(
 			m.ctx,
 			[]string{"git", "worktree", "remove", "--force", wt.Path},
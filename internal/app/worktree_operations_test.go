@@ -1,6 +1,7 @@
 package app
 
 import (
+	"context"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -836,3 +837,54 @@ func TestCreateFromChangesTargetPathIncludesRepoKey(t *testing.T) {
 		t.Fatalf("target path should include repo key (org/repo layout), got %q", inputScr.ErrorMsg)
 	}
 }
+
+func TestPruneMergedDeletesBranchesInOneCall(t *testing.T) {
+	repo := initTestRepo(t)
+	withCwd(t, repo.dir)
+
+	cfg := &config.AppConfig{WorktreeDir: t.TempDir()}
+	m := NewModel(cfg, "")
+	m.state.data.worktrees = []*models.WorktreeInfo{{Path: repo.dir, Branch: repo.branch, IsMain: true}}
+	for _, branch := range []string{"merged-a", "merged-b"} {
+		path := filepath.Join(t.TempDir(), branch)
+		runGit(t, repo.dir, "worktree", "add", "-b", branch, path)
+		m.state.data.worktrees = append(m.state.data.worktrees, &models.WorktreeInfo{
+			Path:   path,
+			Branch: branch,
+			PR:     &models.PRInfo{State: "MERGED"},
+		})
+	}
+
+	var branchDeletes []string
+	m.state.services.git.SetCommandRunner(func(ctx context.Context, name string, args ...string) *exec.Cmd {
+		if len(args) > 0 && args[0] == "branch" {
+			branchDeletes = append(branchDeletes, strings.Join(args, " "))
+		}
+		return exec.CommandContext(ctx, name, args...)
+	})
+
+	m.performMergedWorktreeCheck()
+	checkScr, ok := m.state.ui.screenManager.Current().(*appscreen.ChecklistScreen)
+	if !ok {
+		t.Fatalf("expected checklist screen, got %T", m.state.ui.screenManager.Current())
+	}
+	cmd := checkScr.OnSubmit(checkScr.Items)
+	if cmd == nil {
+		t.Fatal("expected prune command")
+	}
+	result, ok := cmd().(pruneResultMsg)
+	if !ok {
+		t.Fatal("expected pruneResultMsg")
+	}
+	if result.pruned != 2 || result.failed != 0 {
+		t.Fatalf("expected 2 pruned and 0 failed, got %d and %d", result.pruned, result.failed)
+	}
+
+	deletes := strings.Count(strings.Join(branchDeletes, "\n"), "branch -D")
+	if deletes != 1 {
+		t.Fatalf("expected one branch -D call, got %q", branchDeletes)
+	}
+	if branches := runGit(t, repo.dir, "branch", "--list", "merged-*"); branches != "" {
+		t.Fatalf("expected merged branches to be deleted, got %q", branches)
+	}
+}
@@ -112,7 +112,7 @@ func (m *Model) isBehindBase(wt *models.WorktreeInfo) bool {
 	// Check if there are commits in base that aren't in HEAD
 	behindCount := m.state.services.git.RunGit(m.ctx, []string{
 		"git", "rev-list", "--count", fmt.Sprintf("HEAD..%s", wt.PR.BaseBranch),
-	}, wt.Path, []int{0}, true, false)
+	}, wt.Path, nil, true, false)
 
 	behind, _ := strconv.Atoi(strings.TrimSpace(behindCount))
 	return behind > 0
@@ -5,6 +5,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"slices"
 	"strings"
 	"testing"
 
@@ -253,18 +254,7 @@ func TestSyncWithUpstreamRunsPullThenPush(t *testing.T) {
 	}
 	m.state.data.selectedIndex = 0
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	_, cmd := m.handleBuiltInKey(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'S'}})
 	if cmd == nil {
@@ -285,20 +275,20 @@ func TestSyncWithUpstreamRunsPullThenPush(t *testing.T) {
 		t.Fatalf("unexpected sync error: %v", syncMsg.err)
 	}
 
-	if len(calls) != 2 {
-		t.Fatalf("expected 2 commands, got %d", len(calls))
+	if len(rec.calls) != 2 {
+		t.Fatalf("expected 2 commands, got %d", len(rec.calls))
 	}
-	if calls[0].name != testGitCmd || len(calls[0].args) < 3 || calls[0].args[0] != testGitPullArg {
-		t.Fatalf("expected git pull with upstream first, got %v %v", calls[0].name, calls[0].args)
+	if rec.calls[0].name != testGitCmd || len(rec.calls[0].args) < 3 || rec.calls[0].args[0] != testGitPullArg {
+		t.Fatalf("expected git pull with upstream first, got %v %v", rec.calls[0].name, rec.calls[0].args)
 	}
-	if calls[0].args[1] != testRemoteOrigin || calls[0].args[2] != featureBranch {
-		t.Fatalf("expected git pull origin %s, got %v", featureBranch, calls[0].args)
+	if rec.calls[0].args[1] != testRemoteOrigin || rec.calls[0].args[2] != featureBranch {
+		t.Fatalf("expected git pull origin %s, got %v", featureBranch, rec.calls[0].args)
 	}
-	if calls[1].name != testGitCmd || len(calls[1].args) < 1 || calls[1].args[0] != testGitPushArg {
-		t.Fatalf("expected git push second, got %v %v", calls[1].name, calls[1].args)
+	if rec.calls[1].name != testGitCmd || len(rec.calls[1].args) < 1 || rec.calls[1].args[0] != testGitPushArg {
+		t.Fatalf("expected git push second, got %v %v", rec.calls[1].name, rec.calls[1].args)
 	}
-	if len(calls[1].args) < 3 || calls[1].args[1] != testRemoteOrigin || calls[1].args[2] != "HEAD:"+featureBranch {
-		t.Fatalf("expected git push origin HEAD:%s, got %v", featureBranch, calls[1].args)
+	if len(rec.calls[1].args) < 3 || rec.calls[1].args[1] != testRemoteOrigin || rec.calls[1].args[2] != "HEAD:"+featureBranch {
+		t.Fatalf("expected git push origin HEAD:%s, got %v", featureBranch, rec.calls[1].args)
 	}
 }
 
@@ -331,18 +321,7 @@ func TestSyncWithUpstreamPromptsForUpstream(t *testing.T) {
 		t.Fatalf("expected default upstream %q, got %q", testUpstreamRef, got)
 	}
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	syncCmd := inputScr.OnSubmit(testUpstreamRef, false)
 	if syncCmd == nil {
@@ -363,20 +342,20 @@ func TestSyncWithUpstreamPromptsForUpstream(t *testing.T) {
 		t.Fatalf("unexpected sync error: %v", syncMsg.err)
 	}
 
-	if len(calls) != 2 {
-		t.Fatalf("expected 2 commands, got %d", len(calls))
+	if len(rec.calls) != 2 {
+		t.Fatalf("expected 2 commands, got %d", len(rec.calls))
 	}
-	if calls[0].name != testGitCmd || len(calls[0].args) < 3 || calls[0].args[0] != testGitPullArg {
-		t.Fatalf("expected git pull with upstream, got %v %v", calls[0].name, calls[0].args)
+	if rec.calls[0].name != testGitCmd || len(rec.calls[0].args) < 3 || rec.calls[0].args[0] != testGitPullArg {
+		t.Fatalf("expected git pull with upstream, got %v %v", rec.calls[0].name, rec.calls[0].args)
 	}
-	if calls[0].args[1] != testRemoteOrigin || calls[0].args[2] != featureBranch {
-		t.Fatalf("expected git pull origin feature, got %v", calls[0].args)
+	if rec.calls[0].args[1] != testRemoteOrigin || rec.calls[0].args[2] != featureBranch {
+		t.Fatalf("expected git pull origin feature, got %v", rec.calls[0].args)
 	}
-	if calls[1].name != testGitCmd || len(calls[1].args) < 4 || calls[1].args[0] != testGitPushArg {
-		t.Fatalf("expected git push with upstream, got %v %v", calls[1].name, calls[1].args)
+	if rec.calls[1].name != testGitCmd || len(rec.calls[1].args) < 4 || rec.calls[1].args[0] != testGitPushArg {
+		t.Fatalf("expected git push with upstream, got %v %v", rec.calls[1].name, rec.calls[1].args)
 	}
-	if calls[1].args[1] != "-u" || calls[1].args[2] != testRemoteOrigin || calls[1].args[3] != "HEAD:"+featureBranch {
-		t.Fatalf("expected git push -u origin HEAD:%s, got %v", featureBranch, calls[1].args)
+	if rec.calls[1].args[1] != "-u" || rec.calls[1].args[2] != testRemoteOrigin || rec.calls[1].args[3] != "HEAD:"+featureBranch {
+		t.Fatalf("expected git push -u origin HEAD:%s, got %v", featureBranch, rec.calls[1].args)
 	}
 }
 
@@ -457,18 +436,7 @@ func TestSyncWithUpstreamUsesRebasePull(t *testing.T) {
 	}
 	m.state.data.selectedIndex = 0
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	_, cmd := m.handleBuiltInKey(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'S'}})
 	if cmd == nil {
@@ -476,19 +444,19 @@ func TestSyncWithUpstreamUsesRebasePull(t *testing.T) {
 	}
 	_ = cmd()
 
-	if len(calls) < 1 {
+	if len(rec.calls) < 1 {
 		t.Fatal("expected at least one command")
 	}
 	// Check that pull has --rebase flag
 	foundRebase := false
-	for _, arg := range calls[0].args {
+	for _, arg := range rec.calls[0].args {
 		if arg == pullRebaseFlag {
 			foundRebase = true
 			break
 		}
 	}
 	if !foundRebase {
-		t.Fatalf("expected --rebase flag in pull args when MergeMethod is rebase, got %v", calls[0].args)
+		t.Fatalf("expected --rebase flag in pull args when MergeMethod is rebase, got %v", rec.calls[0].args)
 	}
 }
 
@@ -514,18 +482,7 @@ func TestSyncWithNoPRDoesNormalSync(t *testing.T) {
 	}
 	m.state.data.selectedIndex = 0
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	_, cmd := m.handleBuiltInKey(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'S'}})
 	if cmd == nil {
@@ -535,8 +492,8 @@ func TestSyncWithNoPRDoesNormalSync(t *testing.T) {
 	_ = cmd()
 
 	// Should do normal sync without checking if behind
-	if len(calls) != 2 {
-		t.Fatalf("expected 2 commands (pull+push), got %d", len(calls))
+	if len(rec.calls) != 2 {
+		t.Fatalf("expected 2 commands (pull+push), got %d", len(rec.calls))
 	}
 }
 
@@ -565,18 +522,7 @@ func TestSyncPREmptyBaseBranchDoesNormalSync(t *testing.T) {
 	}
 	m.state.data.selectedIndex = 0
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	_, cmd := m.handleBuiltInKey(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'S'}})
 	if cmd == nil {
@@ -586,8 +532,8 @@ func TestSyncPREmptyBaseBranchDoesNormalSync(t *testing.T) {
 	_ = cmd()
 
 	// Should do normal sync
-	if len(calls) != 2 {
-		t.Fatalf("expected 2 commands (pull+push), got %d", len(calls))
+	if len(rec.calls) != 2 {
+		t.Fatalf("expected 2 commands (pull+push), got %d", len(rec.calls))
 	}
 }
 
@@ -810,18 +756,7 @@ func TestConfirmNoDoesNormalSync(t *testing.T) {
 	// Set up confirm screen
 	_ = m.showSyncChoice(wt)
 
-	type call struct {
-		name string
-		args []string
-	}
-	var calls []call
-	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
-		if name == "git" && len(args) > 0 && args[0] == "worktree" {
-			return exec.Command("printf", "")
-		}
-		calls = append(calls, call{name: name, args: append([]string{}, args...)})
-		return exec.Command("printf", "")
-	}
+	rec := recordSyncCommands(m)
 
 	// Simulate user pressing NO (n key)
 	newModel, cmd := m.Update(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{'n'}})
@@ -833,13 +768,30 @@ func TestConfirmNoDoesNormalSync(t *testing.T) {
 	_ = cmd()
 
 	// Verify normal sync was performed (pull + push)
-	if len(calls) != 2 {
-		t.Fatalf("expected 2 commands (pull+push), got %d", len(calls))
+	if len(rec.calls) != 2 {
+		t.Fatalf("expected 2 commands (pull+push), got %d", len(rec.calls))
+	}
+	if rec.calls[0].name != testGitCmd || len(rec.calls[0].args) < 1 || rec.calls[0].args[0] != testGitPullArg {
+		t.Fatalf("expected git pull, got %v %v", rec.calls[0].name, rec.calls[0].args)
 	}
-	if calls[0].name != testGitCmd || len(calls[0].args) < 1 || calls[0].args[0] != testGitPullArg {
-		t.Fatalf("expected git pull, got %v %v", calls[0].name, calls[0].args)
+	if rec.calls[1].name != testGitCmd || len(rec.calls[1].args) < 1 || rec.calls[1].args[0] != testGitPushArg {
+		t.Fatalf("expected git push, got %v %v", rec.calls[1].name, rec.calls[1].args)
 	}
-	if calls[1].name != testGitCmd || len(calls[1].args) < 1 || calls[1].args[0] != testGitPushArg {
-		t.Fatalf("expected git push, got %v %v", calls[1].name, calls[1].args)
+}
+
+type syncCommandLog struct {
+	calls []recordedCommand
+}
+
+// recordSyncCommands replaces m's command runner with one that records every
+// command apart from worktree listings and runs a no-op in its place.
+func recordSyncCommands(m *Model) *syncCommandLog {
+	rec := &syncCommandLog{}
+	m.commandRunner = func(_ context.Context, name string, args ...string) *exec.Cmd {
+		if name != "git" || len(args) == 0 || args[0] != "worktree" {
+			rec.calls = append(rec.calls, recordedCommand{name: name, args: slices.Clone(args)})
+		}
+		return exec.Command("printf", "")
 	}
+	return rec
 }
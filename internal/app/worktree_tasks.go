@@ -3,7 +3,6 @@ package app
 import (
 	"fmt"
 	"path/filepath"
-	"regexp"
 	"sort"
 	"strings"
 
@@ -14,8 +13,8 @@ import (
 )
 
 var (
-	markdownTaskLineRE = regexp.MustCompile(`^(\s*[-*+]\s+\[)([ xX])(\]\s*)(.*)$`)
-	todoKeywordLineRE  = regexp.MustCompile(`^(\s*)(TODO|DONE)(:?\s*)(.*)$`)
+	markdownTaskLineRE = lazyRegexp(`^(\s*[-*+]\s+\[)([ xX])(\]\s*)(.*)$`)
+	todoKeywordLineRE  = lazyRegexp(`^(\s*)(TODO|DONE)(:?\s*)(.*)$`)
 )
 
 type worktreeTaskRef struct {
@@ -201,7 +200,7 @@ func extractTaskRefs(worktreePath, noteText string) []worktreeTaskRef {
 }
 
 func parseMarkdownTaskLine(line string) (checked bool, text string, ok bool) {
-	parts := markdownTaskLineRE.FindStringSubmatch(line)
+	parts := markdownTaskLineRE().FindStringSubmatch(line)
 	if len(parts) != 5 {
 		return false, "", false
 	}
@@ -253,7 +252,7 @@ func toggleMarkdownTaskLine(noteText string, lineIndex int) (string, bool) {
 	}
 
 	line := lines[lineIndex]
-	idx := markdownTaskLineRE.FindStringSubmatchIndex(line)
+	idx := markdownTaskLineRE().FindStringSubmatchIndex(line)
 	if len(idx) < 6 {
 		return noteText, false
 	}
@@ -273,7 +272,7 @@ func toggleMarkdownTaskLine(noteText string, lineIndex int) (string, bool) {
 }
 
 func parseTodoKeywordLine(line string) (checked bool, text string, ok bool) {
-	parts := todoKeywordLineRE.FindStringSubmatch(line)
+	parts := todoKeywordLineRE().FindStringSubmatch(line)
 	if len(parts) != 5 {
 		return false, "", false
 	}
@@ -293,7 +292,7 @@ func toggleTodoKeywordLine(noteText string, lineIndex int) (string, bool) {
 	}
 
 	line := lines[lineIndex]
-	idx := todoKeywordLineRE.FindStringSubmatchIndex(line)
+	idx := todoKeywordLineRE().FindStringSubmatchIndex(line)
 	if len(idx) < 6 {
 		return noteText, false
 	}
@@ -194,6 +194,10 @@ func (m *mockGitServiceForInteractive) ExecuteCommands(context.Context, []string
 	return nil
 }
 
+func (m *mockGitServiceForInteractive) ExecuteCommandsParallel(context.Context, []string, string, map[string]string) error {
+	return nil
+}
+
 func (m *mockGitServiceForInteractive) FetchAllOpenPRs(_ context.Context) ([]*models.PRInfo, error) {
 	return m.prs, m.prsErr
 }
@@ -231,6 +235,8 @@ func (m *mockGitServiceForInteractive) GetWorktrees(context.Context) ([]*models.
 	return nil, nil
 }
 
+func (m *mockGitServiceForInteractive) ReleaseWorktree(string) {}
+
 func (m *mockGitServiceForInteractive) RenameWorktree(context.Context, string, string, string, string) bool {
 	return true
 }
@@ -44,6 +44,7 @@ type gitService interface {
 	CheckoutPRBranch(ctx context.Context, prNumber int, remoteBranch string, localBranch string) bool
 	CreateWorktreeFromPR(ctx context.Context, prNumber int, branch string, worktreeName string, targetPath string) bool
 	ExecuteCommands(ctx context.Context, cmdList []string, cwd string, env map[string]string) error
+	ExecuteCommandsParallel(ctx context.Context, cmdList []string, cwd string, env map[string]string) error
 	FetchAllOpenIssues(ctx context.Context) ([]*models.IssueInfo, error)
 	FetchAllOpenPRs(ctx context.Context) ([]*models.PRInfo, error)
 	FetchIssue(ctx context.Context, issueNumber int) (*models.IssueInfo, error)
@@ -52,6 +53,7 @@ type gitService interface {
 	GetAuthenticatedUsername(ctx context.Context) string
 	GetMainWorktreePath(ctx context.Context) string
 	GetWorktrees(ctx context.Context) ([]*models.WorktreeInfo, error)
+	ReleaseWorktree(worktreePath string)
 	RenameWorktree(ctx context.Context, oldPath, newPath, oldBranch, newBranch string) bool
 	ResolveRepoName(ctx context.Context) string
 	RunCommandChecked(ctx context.Context, args []string, cwd string, errorMsg string) bool
@@ -552,6 +554,7 @@ func DeleteWorktree(ctx context.Context, gitSvc gitService, cfg *config.AppConfi
 	}
 
 	// Delete worktree
+	gitSvc.ReleaseWorktree(selectedWorktree.Path)
 	if !gitSvc.RunCommandChecked(
 		ctx,
 		[]string{"git", "worktree", "remove", "--force", selectedWorktree.Path},
@@ -725,7 +728,11 @@ func runInitCommands(ctx context.Context, gitSvc gitService, cfg *config.AppConf
 	if !silent {
 		fmt.Fprintf(os.Stderr, "Running init commands...\n")
 	}
-	if err := gitSvc.ExecuteCommands(ctx, commands, wtPath, env); err != nil {
+	execute := gitSvc.ExecuteCommands
+	if cfg.InitCommandsParallel {
+		execute = gitSvc.ExecuteCommandsParallel
+	}
+	if err := execute(ctx, commands, wtPath, env); err != nil {
 		return fmt.Errorf("init commands failed: %w", err)
 	}
 
@@ -849,7 +856,7 @@ func maybeCreateAutoWorktreeNote(
 // branchExists checks if a branch exists.
 func branchExists(ctx context.Context, gitSvc gitService, branch string) bool {
 	// Try to verify the branch exists
-	output := gitSvc.RunGit(ctx, []string{"git", "rev-parse", "--verify", branch}, "", []int{0}, true, true)
+	output := gitSvc.RunGit(ctx, []string{"git", "rev-parse", "--verify", branch}, "", nil, true, true)
 	return strings.TrimSpace(output) != ""
 }
 
@@ -879,7 +886,7 @@ func getCurrentWorktreeWithChangesFS(ctx context.Context, gitSvc gitService, fs
 	}
 
 	// Check for uncommitted changes
-	statusOutput := gitSvc.RunGit(ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, []int{0}, true, false)
+	statusOutput := gitSvc.RunGit(ctx, []string{"git", "status", "--porcelain"}, currentWt.Path, nil, true, false)
 	hasChanges := strings.TrimSpace(statusOutput) != ""
 
 	return currentWt, hasChanges, nil
@@ -892,7 +899,7 @@ func createWorktreeWithChanges(ctx context.Context, gitSvc gitService, cfg *conf
 	}
 
 	// Get previous stash hash to detect if stash creation succeeded
-	prevStashHash := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", []int{0}, true, false))
+	prevStashHash := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", nil, true, false))
 
 	// Stash changes with descriptive message
 	stashMessage := fmt.Sprintf("git-wt-create move-current: %s", newBranch)
@@ -906,13 +913,13 @@ func createWorktreeWithChanges(ctx context.Context, gitSvc gitService, cfg *conf
 	}
 
 	// Verify stash was created
-	newStashHash := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", []int{0}, true, false))
+	newStashHash := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%H"}, "", nil, true, false))
 	if newStashHash == "" || newStashHash == prevStashHash {
 		return fmt.Errorf("failed to create stash for moving changes: no new entry created")
 	}
 
 	// Get the stash reference (run from main repo context, not worktree path, since stashes are stored in main repo)
-	stashRef := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", []int{0}, true, false))
+	stashRef := strings.TrimSpace(gitSvc.RunGit(ctx, []string{"git", "stash", "list", "-1", "--format=%gd"}, "", nil, true, false))
 	if stashRef == "" || !strings.HasPrefix(stashRef, "stash@{") {
 		// Try to restore stash if we can't get the ref
 		gitSvc.RunCommandChecked(ctx, []string{"git", "stash", "pop"}, currentWt.Path, "Failed to restore stash")
@@ -69,6 +69,10 @@ func (f *fakeGitService) ExecuteCommands(_ context.Context, _ []string, _ string
 	return f.executedCommands
 }
 
+func (f *fakeGitService) ExecuteCommandsParallel(ctx context.Context, cmdList []string, cwd string, env map[string]string) error {
+	return f.ExecuteCommands(ctx, cmdList, cwd, env)
+}
+
 func (f *fakeGitService) FetchAllOpenIssues(_ context.Context) ([]*models.IssueInfo, error) {
 	return f.issues, f.issuesErr
 }
@@ -117,6 +121,8 @@ func (f *fakeGitService) GetWorktrees(_ context.Context) ([]*models.WorktreeInfo
 	return f.worktrees, f.worktreesErr
 }
 
+func (f *fakeGitService) ReleaseWorktree(string) {}
+
 func (f *fakeGitService) RenameWorktree(_ context.Context, oldPath, newPath, oldBranch, newBranch string) bool {
 	f.renameWorktreeCalled = true
 	f.lastRenameOldPath = oldPath
@@ -150,10 +156,14 @@ func (f *fakeGitService) RunCommandChecked(_ context.Context, args []string, _,
 }
 
 func (f *fakeGitService) RunGit(_ context.Context, args []string, _ string, _ []int, _, _ bool) string {
-	if f.runGitOutput == nil {
-		return ""
-	}
-	return f.runGitOutput[filepath.Join(args...)]
+	return f.runGitOutput[runGitKey(args...)]
+}
+
+// runGitKey is the runGitOutput key for a git command. Joining on a space
+// builds the key in one allocation; unlike filepath.Join it does not clean
+// the arguments as a path, which could make two commands share a key.
+func runGitKey(args ...string) string {
+	return strings.Join(args, " ")
 }
 
 func contains(s, substr string) bool {
@@ -251,7 +261,7 @@ func TestBranchExists(t *testing.T) {
 		t.Run(tt.name, func(t *testing.T) {
 			svc := &fakeGitService{
 				runGitOutput: map[string]string{
-					filepath.Join("git", "rev-parse", "--verify", "mybranch"): tt.output,
+					runGitKey("git", "rev-parse", "--verify", "mybranch"): tt.output,
 				},
 			}
 			got := branchExists(ctx, svc, "mybranch")
@@ -431,7 +441,7 @@ func TestGetCurrentWorktreeWithChanges(t *testing.T) {
 	svc := &fakeGitService{
 		worktrees: worktrees,
 		runGitOutput: map[string]string{
-			filepath.Join("git", "status", "--porcelain"): "M file.txt\n",
+			runGitKey("git", "status", "--porcelain"): "M file.txt\n",
 		},
 	}
 
@@ -457,7 +467,7 @@ func TestGetCurrentWorktreeWithChanges(t *testing.T) {
 	svc2 := &fakeGitService{
 		worktrees: worktrees,
 		runGitOutput: map[string]string{
-			filepath.Join("git", "status", "--porcelain"): "",
+			runGitKey("git", "status", "--porcelain"): "",
 		},
 	}
 
@@ -487,7 +497,7 @@ func TestCreateFromBranch(t *testing.T) {
 		svc := &fakeGitService{
 			resolveRepoName: testRepoName,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", "nonexistent"): "",
+				runGitKey("git", "rev-parse", "--verify", "nonexistent"): "",
 			},
 		}
 
@@ -511,7 +521,7 @@ func TestCreateFromBranch(t *testing.T) {
 		svc := &fakeGitService{
 			resolveRepoName: repoName,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", branchName): "abc123\n",
+				runGitKey("git", "rev-parse", "--verify", branchName): "abc123\n",
 			},
 		}
 
@@ -535,8 +545,8 @@ func TestCreateFromBranch(t *testing.T) {
 			mainWorktreePath:    mainPath,
 			runCommandCheckedOK: true,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", branchName):              "abc123\n",
-				filepath.Join("git", "show-ref", "--verify", "refs/heads/"+branchName): "abc123\n",
+				runGitKey("git", "rev-parse", "--verify", branchName):              "abc123\n",
+				runGitKey("git", "show-ref", "--verify", "refs/heads/"+branchName): "abc123\n",
 			},
 		}
 
@@ -563,8 +573,8 @@ func TestCreateFromBranch(t *testing.T) {
 			mainWorktreePath:    mainPath,
 			runCommandCheckedOK: true,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", sourceBranch):              "abc123\n",
-				filepath.Join("git", "show-ref", "--verify", "refs/heads/"+sourceBranch): "abc123\n",
+				runGitKey("git", "rev-parse", "--verify", sourceBranch):              "abc123\n",
+				runGitKey("git", "show-ref", "--verify", "refs/heads/"+sourceBranch): "abc123\n",
 			},
 		}
 
@@ -597,8 +607,8 @@ func TestCreateFromBranch(t *testing.T) {
 			mainWorktreePath:    mainPath,
 			runCommandCheckedOK: true,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", sourceBranch):              "abc123\n",
-				filepath.Join("git", "show-ref", "--verify", "refs/heads/"+sourceBranch): "abc123\n",
+				runGitKey("git", "rev-parse", "--verify", sourceBranch):              "abc123\n",
+				runGitKey("git", "show-ref", "--verify", "refs/heads/"+sourceBranch): "abc123\n",
 			},
 		}
 
@@ -625,7 +635,7 @@ func TestCreateFromBranch(t *testing.T) {
 		svc := &fakeGitService{
 			resolveRepoName: repoName,
 			runGitOutput: map[string]string{
-				filepath.Join("git", "rev-parse", "--verify", sourceBranch): "abc123\n",
+				runGitKey("git", "rev-parse", "--verify", sourceBranch): "abc123\n",
 			},
 		}
 
@@ -0,0 +1,98 @@
+package commands
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"sync"
+
+	"github.com/chmouel/lazyworktree/internal/utils"
+)
+
+// runDirenvAllow runs `direnv allow` in dir. It is a variable so tests can
+// observe the spawn without direnv installed.
+var runDirenvAllow = func(ctx context.Context, dir string) error {
+	cmd := exec.CommandContext(ctx, "direnv", "allow")
+	cmd.Dir = dir
+	return cmd.Run()
+}
+
+// direnvAllowedMu serialises updates to the allowed-envrc cache file.
+var direnvAllowedMu sync.Mutex
+
+func getDirenvAllowedPath() string {
+	if xdgCacheHome := os.Getenv("XDG_CACHE_HOME"); xdgCacheHome != "" {
+		return filepath.Join(xdgCacheHome, "lazyworktree", "direnv_allowed.json")
+	}
+	home, _ := os.UserHomeDir()
+	return filepath.Join(home, ".cache", "lazyworktree", "direnv_allowed.json")
+}
+
+// allowDirenv runs `direnv allow` for the .envrc in worktreePath, unless the
+// same file with the same content was already allowed by a previous run.
+// Allowed files are recorded by absolute path and content hash, mirroring
+// how direnv itself keys its allow list: a new worktree needs its own allow
+// even when its .envrc matches one allowed elsewhere. Entries whose file no
+// longer exists, such as those of removed worktrees, are dropped whenever
+// the record is written. Failures are ignored (best-effort).
+func allowDirenv(ctx context.Context, worktreePath string) {
+	envrcPath, err := filepath.Abs(filepath.Join(worktreePath, ".envrc"))
+	if err != nil {
+		return
+	}
+	// #nosec G304 -- envrcPath is the .envrc at the root of a managed worktree
+	content, err := os.ReadFile(envrcPath)
+	if err != nil {
+		return
+	}
+	sum := sha256.Sum256(content)
+	hash := hex.EncodeToString(sum[:])
+
+	direnvAllowedMu.Lock()
+	defer direnvAllowedMu.Unlock()
+
+	dbPath := getDirenvAllowedPath()
+	allowed := loadDirenvAllowed(dbPath)
+	if allowed[envrcPath] == hash {
+		return
+	}
+	if err := runDirenvAllow(ctx, worktreePath); err != nil {
+		return
+	}
+	allowed[envrcPath] = hash
+	for path := range allowed {
+		if _, err := os.Stat(path); err != nil {
+			delete(allowed, path)
+		}
+	}
+	saveDirenvAllowed(dbPath, allowed)
+}
+
+func loadDirenvAllowed(dbPath string) map[string]string {
+	allowed := make(map[string]string)
+	// #nosec G304 -- dbPath is the lazyworktree cache file
+	data, err := os.ReadFile(dbPath)
+	if err != nil {
+		return allowed
+	}
+	if err := json.Unmarshal(data, &allowed); err != nil || allowed == nil {
+		// A corrupt cache only costs extra direnv runs, so start fresh.
+		return make(map[string]string)
+	}
+	return allowed
+}
+
+func saveDirenvAllowed(dbPath string, allowed map[string]string) {
+	data, err := json.MarshalIndent(allowed, "", "  ")
+	if err != nil {
+		return
+	}
+	if err := os.MkdirAll(filepath.Dir(dbPath), utils.DefaultDirPerms); err != nil {
+		return
+	}
+	_ = os.WriteFile(dbPath, data, 0o600)
+}
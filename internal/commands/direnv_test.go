@@ -0,0 +1,83 @@
+package commands
+
+import (
+	"context"
+	"errors"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func stubDirenvAllow(t *testing.T, err error) *[]string {
+	t.Helper()
+	var calls []string
+	orig := runDirenvAllow
+	runDirenvAllow = func(_ context.Context, dir string) error {
+		calls = append(calls, dir)
+		return err
+	}
+	t.Cleanup(func() { runDirenvAllow = orig })
+	return &calls
+}
+
+func TestAllowDirenv(t *testing.T) {
+	t.Run("skips unchanged envrc", func(t *testing.T) {
+		t.Setenv("XDG_CACHE_HOME", t.TempDir())
+		calls := stubDirenvAllow(t, nil)
+
+		worktreeDir := t.TempDir()
+		envrcPath := filepath.Join(worktreeDir, ".envrc")
+		require.NoError(t, os.WriteFile(envrcPath, []byte("export TEST=1"), 0o600))
+
+		allowDirenv(context.Background(), worktreeDir)
+		allowDirenv(context.Background(), worktreeDir)
+		assert.Equal(t, []string{worktreeDir}, *calls)
+
+		require.NoError(t, os.WriteFile(envrcPath, []byte("export TEST=2"), 0o600))
+		allowDirenv(context.Background(), worktreeDir)
+		assert.Len(t, *calls, 2)
+	})
+
+	t.Run("retries after direnv failure", func(t *testing.T) {
+		t.Setenv("XDG_CACHE_HOME", t.TempDir())
+		calls := stubDirenvAllow(t, errors.New("direnv: command not found"))
+
+		worktreeDir := t.TempDir()
+		require.NoError(t, os.WriteFile(filepath.Join(worktreeDir, ".envrc"), []byte("export TEST=1"), 0o600))
+
+		allowDirenv(context.Background(), worktreeDir)
+		allowDirenv(context.Background(), worktreeDir)
+		assert.Len(t, *calls, 2)
+		_, err := os.Stat(getDirenvAllowedPath())
+		assert.True(t, os.IsNotExist(err))
+	})
+
+	t.Run("forgets removed worktrees", func(t *testing.T) {
+		t.Setenv("XDG_CACHE_HOME", t.TempDir())
+		stubDirenvAllow(t, nil)
+
+		removed := t.TempDir()
+		kept := t.TempDir()
+		for _, dir := range []string{removed, kept} {
+			require.NoError(t, os.WriteFile(filepath.Join(dir, ".envrc"), []byte("export TEST=1"), 0o600))
+		}
+		allowDirenv(context.Background(), removed)
+		require.NoError(t, os.RemoveAll(removed))
+		allowDirenv(context.Background(), kept)
+
+		allowed := loadDirenvAllowed(getDirenvAllowedPath())
+		assert.Len(t, allowed, 1)
+		assert.Contains(t, allowed, filepath.Join(kept, ".envrc"))
+	})
+
+	t.Run("no envrc", func(t *testing.T) {
+		t.Setenv("XDG_CACHE_HOME", t.TempDir())
+		calls := stubDirenvAllow(t, nil)
+
+		allowDirenv(context.Background(), t.TempDir())
+		assert.Empty(t, *calls)
+	})
+}
@@ -3,11 +3,13 @@ package commands
 
 import (
 	"context"
+	"errors"
 	"fmt"
+	"io"
 	"os"
-	"os/exec"
 	"path/filepath"
 	"strings"
+	"sync"
 )
 
 // LinkTopSymlinks creates symlinks for untracked/ignored files and editor configs from main to target worktree.
@@ -15,19 +17,25 @@ import (
 // - Symlinks all untracked and ignored files from the root of the main worktree (excluding subdirectories)
 // - Symlinks non-empty editor configurations (.vscode, .idea, .cursor, .claude/settings.local.json)
 // - Ensures a tmp/ directory exists in the new worktree
-// - Automatically runs direnv allow if a .envrc file is present
+// - Automatically runs direnv allow if a .envrc file is present and was not already allowed
 // statusFunc is used to get git status for detecting untracked/ignored files.
 func LinkTopSymlinks(ctx context.Context, mainPath, worktreePath string, statusFunc func(context.Context, string) string) error {
 	if mainPath == "" || worktreePath == "" {
 		return fmt.Errorf("missing paths for link_topsymlinks")
 	}
 
+	// Both roots are listed once up front so each candidate is a map lookup
+	// rather than a stat on either side.
+	mainEntries := dirEntries(mainPath)
+	worktreeEntries := dirEntries(worktreePath)
+
+	var links []symlinkPair
 	status := statusFunc(ctx, mainPath)
-	for _, line := range strings.Split(status, "\n") {
+	for line := range strings.SplitSeq(status, "\n") {
 		if len(line) < 4 {
 			continue
 		}
-		if !strings.HasPrefix(line, "?? ") && !strings.HasPrefix(line, "!! ") {
+		if prefix := line[:3]; prefix != "?? " && prefix != "!! " {
 			continue
 		}
 		rel := strings.TrimSpace(line[3:])
@@ -38,8 +46,29 @@ func LinkTopSymlinks(ctx context.Context, mainPath, worktreePath string, statusF
 		if strings.Contains(rel, "/") {
 			continue
 		}
-		if err := symlinkPath(mainPath, worktreePath, rel); err != nil {
-			return fmt.Errorf("failed to symlink %s: %w", rel, err)
+		entry, ok := mainEntries[rel]
+		if !ok {
+			continue
+		}
+		if _, exists := worktreeEntries[rel]; exists {
+			continue
+		}
+		src := filepath.Join(mainPath, rel)
+		if entry.Type()&os.ModeSymlink != 0 {
+			// Dangling links in the main worktree are not propagated.
+			if _, err := os.Stat(src); err != nil {
+				continue
+			}
+		}
+		worktreeEntries[rel] = entry
+		links = append(links, symlinkPair{rel: rel, src: src, dst: filepath.Join(worktreePath, rel)})
+	}
+	if len(links) > 0 {
+		if err := os.MkdirAll(worktreePath, 0o750); err != nil {
+			return fmt.Errorf("failed to symlink %s: %w", links[0].rel, err)
+		}
+		if err := createSymlinks(links); err != nil {
+			return err
 		}
 	}
 
@@ -81,16 +110,53 @@ func LinkTopSymlinks(ctx context.Context, mainPath, worktreePath string, statusF
 		return fmt.Errorf("failed to create tmp directory: %w", err)
 	}
 
-	envrcPath := filepath.Join(worktreePath, ".envrc")
-	if _, err := os.Stat(envrcPath); err == nil {
-		cmd := exec.CommandContext(ctx, "direnv", "allow")
-		cmd.Dir = worktreePath
-		_ = cmd.Run() // best-effort
-	}
+	allowDirenv(ctx, worktreePath)
 
 	return nil
 }
 
+// symlinkWorkers bounds the goroutines creating top-level symlinks.
+const symlinkWorkers = 8
+
+type symlinkPair struct {
+	rel, src, dst string
+}
+
+// createSymlinks creates the collected links, spreading large batches over
+// a few goroutines so slow filesystems are not walked one syscall at a time.
+// The first failing link, in input order, is reported.
+func createSymlinks(links []symlinkPair) error {
+	errs := make([]error, len(links))
+	if len(links) <= symlinkWorkers {
+		for i, link := range links {
+			errs[i] = os.Symlink(link.src, link.dst)
+		}
+	} else {
+		var wg sync.WaitGroup
+		next := make(chan int)
+		for range symlinkWorkers {
+			wg.Add(1)
+			go func() {
+				defer wg.Done()
+				for i := range next {
+					errs[i] = os.Symlink(links[i].src, links[i].dst)
+				}
+			}()
+		}
+		for i := range links {
+			next <- i
+		}
+		close(next)
+		wg.Wait()
+	}
+	for i, err := range errs {
+		if err != nil {
+			return fmt.Errorf("failed to symlink %s: %w", links[i].rel, err)
+		}
+	}
+	return nil
+}
+
 func symlinkPath(mainPath, worktreePath, rel string) error {
 	src := filepath.Join(mainPath, rel)
 	if _, err := os.Stat(src); err != nil {
@@ -135,10 +201,35 @@ func createClaudeDirectory(mainPath, worktreePath string) error {
 	return nil
 }
 
-func isEmptyDir(path string) (bool, error) {
+// dirEntries lists the entries directly under path by name. The entry types
+// come from the directory listing itself, so no per-entry stat is needed.
+// An unreadable directory yields an empty map.
+func dirEntries(path string) map[string]os.DirEntry {
 	entries, err := os.ReadDir(path)
 	if err != nil {
+		return map[string]os.DirEntry{}
+	}
+	byName := make(map[string]os.DirEntry, len(entries))
+	for _, entry := range entries {
+		byName[entry.Name()] = entry
+	}
+	return byName
+}
+
+func isEmptyDir(path string) (bool, error) {
+	// #nosec G304 -- path is an editor directory inside the main worktree
+	dir, err := os.Open(path)
+	if err != nil {
+		return false, err
+	}
+	defer dir.Close()
+
+	// Reading a single name is enough to tell whether the directory is empty.
+	if _, err := dir.Readdirnames(1); err != nil {
+		if errors.Is(err, io.EOF) {
+			return true, nil
+		}
 		return false, err
 	}
-	return len(entries) == 0, nil
+	return false, nil
 }
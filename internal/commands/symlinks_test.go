@@ -2,8 +2,10 @@ package commands
 
 import (
 	"context"
+	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -184,6 +186,76 @@ func TestLinkTopSymlinks(t *testing.T) {
 		assert.Equal(t, ignoredFile, target)
 	})
 
+	t.Run("many untracked files", func(t *testing.T) {
+		mainDir := t.TempDir()
+		worktreeDir := t.TempDir()
+
+		var status strings.Builder
+		for i := range 3 * symlinkWorkers {
+			name := fmt.Sprintf("file-%02d.txt", i)
+			require.NoError(t, os.WriteFile(filepath.Join(mainDir, name), []byte(name), 0o600))
+			fmt.Fprintf(&status, "?? %s\n", name)
+		}
+		statusFunc := func(_ context.Context, _ string) string {
+			return status.String()
+		}
+
+		err := LinkTopSymlinks(context.Background(), mainDir, worktreeDir, statusFunc)
+		require.NoError(t, err)
+
+		for i := range 3 * symlinkWorkers {
+			name := fmt.Sprintf("file-%02d.txt", i)
+			target, err := os.Readlink(filepath.Join(worktreeDir, name))
+			require.NoError(t, err)
+			assert.Equal(t, filepath.Join(mainDir, name), target)
+		}
+	})
+
+	t.Run("report the first failing symlink", func(t *testing.T) {
+		dir := t.TempDir()
+		links := make([]symlinkPair, 2*symlinkWorkers)
+		for i := range links {
+			rel := fmt.Sprintf("link-%02d", i)
+			links[i] = symlinkPair{rel: rel, src: "target", dst: filepath.Join(dir, rel)}
+		}
+		links[5].dst = filepath.Join(dir, "missing", "link-05")
+		links[9].dst = filepath.Join(dir, "missing", "link-09")
+
+		err := createSymlinks(links)
+		require.Error(t, err)
+		assert.Contains(t, err.Error(), "failed to symlink link-05")
+	})
+
+	t.Run("skip missing, dangling and existing entries", func(t *testing.T) {
+		mainDir := t.TempDir()
+		worktreeDir := t.TempDir()
+
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, "existing.env"), []byte("main"), 0o600))
+		require.NoError(t, os.WriteFile(filepath.Join(worktreeDir, "existing.env"), []byte("worktree"), 0o600))
+		require.NoError(t, os.Symlink(filepath.Join(mainDir, "nowhere"), filepath.Join(mainDir, "dangling")))
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, "linked.env"), []byte("main"), 0o600))
+
+		statusFunc := func(_ context.Context, _ string) string {
+			return "?? existing.env\n?? dangling\n?? vanished.txt\n!! linked.env\n!! linked.env"
+		}
+
+		err := LinkTopSymlinks(context.Background(), mainDir, worktreeDir, statusFunc)
+		require.NoError(t, err)
+
+		content, err := os.ReadFile(filepath.Join(worktreeDir, "existing.env"))
+		require.NoError(t, err)
+		assert.Equal(t, "worktree", string(content))
+
+		_, err = os.Lstat(filepath.Join(worktreeDir, "dangling"))
+		require.Error(t, err)
+		_, err = os.Lstat(filepath.Join(worktreeDir, "vanished.txt"))
+		require.Error(t, err)
+
+		target, err := os.Readlink(filepath.Join(worktreeDir, "linked.env"))
+		require.NoError(t, err)
+		assert.Equal(t, filepath.Join(mainDir, "linked.env"), target)
+	})
+
 	t.Run("symlink editor configs", func(t *testing.T) {
 		mainDir := t.TempDir()
 		worktreeDir := t.TempDir()
@@ -336,6 +408,7 @@ func TestLinkTopSymlinks(t *testing.T) {
 	})
 
 	t.Run("direnv allow with .envrc", func(t *testing.T) {
+		t.Setenv("XDG_CACHE_HOME", t.TempDir())
 		mainDir := t.TempDir()
 		worktreeDir := t.TempDir()
 
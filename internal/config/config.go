@@ -73,6 +73,7 @@ type CustomTheme struct {
 type AppConfig struct {
 	WorktreeDir             string
 	InitCommands            []string
+	InitCommandsParallel    bool // Run init commands concurrently instead of in order
 	TerminateCommands       []string
 	SortMode                string // Sort mode: "path", "active" (commit date), "switched" (last accessed)
 	AutoFetchPRs            bool
@@ -80,6 +81,7 @@ type AppConfig struct {
 	SearchAutoSelect        bool // Start with filter focused and select first match on Enter.
 	MaxUntrackedDiffs       int
 	MaxDiffChars            int
+	FetchJobs               int // Remotes fetched in parallel by "Fetch remotes" (0 picks min(8, CPUs))
 	MaxNameLength           int // Maximum length for worktree names in table display (0 disables truncation)
 	GitPagerArgs            []string
 	GitPagerArgsSet         bool `yaml:"-"`
@@ -222,6 +224,7 @@ func parseConfig(data map[string]any) (*AppConfig, error) {
 	}
 
 	cfg.InitCommands = normalizeCommandList(data["init_commands"])
+	cfg.InitCommandsParallel = coerceBool(data["init_commands_parallel"], false)
 	cfg.TerminateCommands = normalizeCommandList(data["terminate_commands"])
 
 	// Handle sort_mode with backwards compatibility for sort_by_active
@@ -266,6 +269,7 @@ func parseConfig(data map[string]any) (*AppConfig, error) {
 
 	cfg.MaxUntrackedDiffs = coerceInt(data["max_untracked_diffs"], 10)
 	cfg.MaxDiffChars = coerceInt(data["max_diff_chars"], 200000)
+	cfg.FetchJobs = coerceInt(data["fetch_jobs"], 0)
 	cfg.MaxNameLength = coerceInt(data["max_name_length"], 95)
 	// Diff formatter/pager configuration (new keys: git_pager, git_pager_args)
 	if _, ok := data["git_pager_args"]; ok {
@@ -378,6 +382,9 @@ func parseConfig(data map[string]any) (*AppConfig, error) {
 	if cfg.MaxDiffChars < 0 {
 		cfg.MaxDiffChars = 0
 	}
+	if cfg.FetchJobs < 0 {
+		cfg.FetchJobs = 0
+	}
 	if cfg.MaxNameLength < 0 {
 		cfg.MaxNameLength = 0
 	}
@@ -685,28 +692,26 @@ func validateThemeInheritance(name string, custom *CustomTheme, themes map[strin
 }
 
 func normalizeCommandList(val any) []string {
-	if val == nil {
-		return []string{}
-	}
-	if s, ok := val.(string); ok {
-		s = strings.TrimSpace(s)
-		if s == "" {
+	switch v := val.(type) {
+	case string:
+		v = strings.TrimSpace(v)
+		if v == "" {
 			return []string{}
 		}
-		return []string{s}
-	}
-	res := []string{}
-	if l, ok := val.([]any); ok {
-		for _, v := range l {
-			if s, ok := v.(string); ok {
-				s = strings.TrimSpace(s)
-				if s != "" {
+		return []string{v}
+	case []any:
+		res := make([]string, 0, len(v))
+		for _, item := range v {
+			if s, ok := item.(string); ok {
+				if s = strings.TrimSpace(s); s != "" {
 					res = append(res, s)
 				}
 			}
 		}
+		return res
+	default:
+		return []string{}
 	}
-	return res
 }
 
 func normalizeArgsList(val any) []string {
@@ -859,6 +864,9 @@ func (cfg *AppConfig) ApplyCLIOverrides(overrides []string) error {
 	if _, ok := overrideData["auto_fetch_prs"]; ok {
 		cfg.AutoFetchPRs = overrideCfg.AutoFetchPRs
 	}
+	if _, ok := overrideData["init_commands_parallel"]; ok {
+		cfg.InitCommandsParallel = overrideCfg.InitCommandsParallel
+	}
 	if _, ok := overrideData["disable_pr"]; ok {
 		cfg.DisablePR = overrideCfg.DisablePR
 	}
@@ -893,6 +901,9 @@ func (cfg *AppConfig) ApplyCLIOverrides(overrides []string) error {
 	if _, ok := overrideData["max_diff_chars"]; ok {
 		cfg.MaxDiffChars = overrideCfg.MaxDiffChars
 	}
+	if _, ok := overrideData["fetch_jobs"]; ok {
+		cfg.FetchJobs = overrideCfg.FetchJobs
+	}
 	if _, ok := overrideData["refresh_interval_seconds"]; ok {
 		cfg.RefreshIntervalSeconds = overrideCfg.RefreshIntervalSeconds
 	}
@@ -949,19 +960,15 @@ func LoadConfig(configPath string) (*AppConfig, error) {
 		mergeMaps(mergedData, gitGlobalData)
 	}
 
-	// 3. Determine repo path from merged data so far
+	// 3. Determine the worktree dir from merged data so far
 	var worktreeDir string
 	if wd, ok := mergedData["worktree_dir"].(string); ok {
 		worktreeDir = wd
 	}
 
 	// 4. Load and merge git local config (overrides git global)
-	repoPath := determineRepoPath(worktreeDir)
-	if repoPath != "" {
-		gitLocalData, err := loadGitConfig(false, repoPath)
-		if err == nil && len(gitLocalData) > 0 {
-			mergeMaps(mergedData, gitLocalData)
-		}
+	if gitLocalData := loadLocalGitConfig(worktreeDir); len(gitLocalData) > 0 {
+		mergeMaps(mergedData, gitLocalData)
 	}
 
 	// 5. Parse the merged data into AppConfig
@@ -211,6 +211,11 @@ func TestNormalizeCommandList(t *testing.T) {
 			input:    []interface{}{"  echo hello  ", "  pwd  "},
 			expected: []string{"echo hello", "pwd"},
 		},
+		{
+			name:     "unsupported value type",
+			input:    map[string]interface{}{"cmd": "echo hello"},
+			expected: []string{},
+		},
 	}
 
 	for _, tt := range tests {
@@ -501,6 +506,15 @@ func TestParseConfig(t *testing.T) {
 				assert.True(t, cfg.AutoFetchPRs)
 			},
 		},
+		{
+			name: "init_commands_parallel true",
+			data: map[string]interface{}{
+				"init_commands_parallel": true,
+			},
+			validate: func(t *testing.T, cfg *AppConfig) {
+				assert.True(t, cfg.InitCommandsParallel)
+			},
+		},
 		{
 			name: "disable_pr true",
 			data: map[string]interface{}{
@@ -597,6 +611,15 @@ func TestParseConfig(t *testing.T) {
 				assert.Equal(t, 100000, cfg.MaxDiffChars)
 			},
 		},
+		{
+			name: "fetch_jobs",
+			data: map[string]interface{}{
+				"fetch_jobs": 4,
+			},
+			validate: func(t *testing.T, cfg *AppConfig) {
+				assert.Equal(t, 4, cfg.FetchJobs)
+			},
+		},
 		{
 			name: "git_pager_args string",
 			data: map[string]interface{}{
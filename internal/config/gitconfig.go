@@ -1,6 +1,7 @@
 package config
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -24,7 +25,8 @@ func runGitConfig(args []string, repoPath string) (string, error) {
 	output, err := cmd.Output()
 	if err != nil {
 		// git config returns exit code 1 when key not found (not an error)
-		if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() == 1 {
+		var exitErr *exec.ExitError
+		if errors.As(err, &exitErr) && exitErr.ExitCode() == 1 {
 			return "", nil
 		}
 		return "", err
@@ -118,29 +120,24 @@ func loadGitConfig(globalOnly bool, repoPath string) (map[string]any, error) {
 	return convertGitConfigToParseConfig(gitCfg), nil
 }
 
-// isInGitRepo checks if path is in a git repository.
-func isInGitRepo(path string) bool {
-	if path == "" {
-		return false
+// loadLocalGitConfig reads lw.* keys from the local git config of the first
+// candidate inside a git repository: worktreeDir, then the current directory.
+// `git config --local` fails outside a repository, so no separate rev-parse
+// probe is spawned to find the repository first.
+func loadLocalGitConfig(worktreeDir string) map[string]any {
+	candidates := make([]string, 0, 2)
+	if worktreeDir != "" {
+		candidates = append(candidates, worktreeDir)
 	}
-	cmd := exec.Command("git", "rev-parse", "--git-dir")
-	cmd.Dir = path
-	return cmd.Run() == nil
-}
-
-// determineRepoPath returns repo path for local git config lookup.
-func determineRepoPath(worktreeDir string) string {
-	// Try worktreeDir if specified.
-	if worktreeDir != "" && isInGitRepo(worktreeDir) {
-		return worktreeDir
+	if wd, err := os.Getwd(); err == nil && wd != worktreeDir {
+		candidates = append(candidates, wd)
 	}
-
-	// Fall back to current directory.
-	if wd, err := os.Getwd(); err == nil && isInGitRepo(wd) {
-		return wd
+	for _, dir := range candidates {
+		if data, err := loadGitConfig(false, dir); err == nil {
+			return data
+		}
 	}
-
-	return ""
+	return nil
 }
 
 // parseCLIConfigOverrides parses --config=lw.key=value format.
@@ -2,6 +2,7 @@ package config
 
 import (
 	"fmt"
+	"os"
 	"strings"
 	"testing"
 
@@ -137,37 +138,6 @@ func TestConvertGitConfigToParseConfig(t *testing.T) {
 	}
 }
 
-func TestIsInGitRepo(t *testing.T) {
-	tests := []struct {
-		name     string
-		path     string
-		expected bool
-	}{
-		{
-			name:     "empty path",
-			path:     "",
-			expected: false,
-		},
-		{
-			name:     "current directory (likely a git repo in CI)",
-			path:     ".",
-			expected: true, // This test file is in a git repo
-		},
-		{
-			name:     "non-existent path",
-			path:     "/non/existent/path/12345",
-			expected: false,
-		},
-	}
-
-	for _, tt := range tests {
-		t.Run(tt.name, func(t *testing.T) {
-			result := isInGitRepo(tt.path)
-			assert.Equal(t, tt.expected, result)
-		})
-	}
-}
-
 func TestParseCLIConfigOverrides(t *testing.T) {
 	tests := []struct {
 		name      string
@@ -351,39 +321,65 @@ func TestLoadGitConfig(t *testing.T) {
 	}
 }
 
-func TestDetermineRepoPath(t *testing.T) {
+func TestLoadLocalGitConfig(t *testing.T) {
+	defer func() { gitConfigMock = nil }()
+
+	wd, err := os.Getwd()
+	require.NoError(t, err)
+	repoDir := t.TempDir()
+
+	var tried []string
+	gitConfigMock = func(args []string, repoPath string) (string, error) {
+		assert.Contains(t, args, "--local")
+		tried = append(tried, repoPath)
+		if repoPath == repoDir || repoPath == wd {
+			return "lw.theme nord\n", nil
+		}
+		return "", fmt.Errorf("exit status 128")
+	}
+
 	tests := []struct {
 		name        string
 		worktreeDir string
-		expectEmpty bool
+		tried       []string
 	}{
 		{
-			name:        "empty worktree dir, current dir is git repo",
+			name:        "empty worktree dir uses current dir",
 			worktreeDir: "",
-			expectEmpty: false, // Test runs in git repo
+			tried:       []string{wd},
 		},
 		{
-			name:        "valid worktree dir that is git repo",
-			worktreeDir: ".",
-			expectEmpty: false,
+			name:        "worktree dir inside a git repo",
+			worktreeDir: repoDir,
+			tried:       []string{repoDir},
 		},
 		{
-			name:        "non-existent worktree dir falls back to current dir",
+			name:        "worktree dir outside a git repo falls back to current dir",
 			worktreeDir: "/non/existent/path",
-			expectEmpty: false, // Falls back to current dir which is a git repo
+			tried:       []string{"/non/existent/path", wd},
+		},
+		{
+			name:        "worktree dir is the current dir",
+			worktreeDir: wd,
+			tried:       []string{wd},
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result := determineRepoPath(tt.worktreeDir)
-			if tt.expectEmpty {
-				assert.Empty(t, result)
-			} else {
-				assert.NotEmpty(t, result)
-			}
+			tried = nil
+			result := loadLocalGitConfig(tt.worktreeDir)
+			assert.Equal(t, map[string]any{"theme": "nord"}, result)
+			assert.Equal(t, tt.tried, tried)
 		})
 	}
+
+	t.Run("no candidate inside a git repo", func(t *testing.T) {
+		gitConfigMock = func(_ []string, _ string) (string, error) {
+			return "", fmt.Errorf("exit status 128")
+		}
+		assert.Nil(t, loadLocalGitConfig("/non/existent/path"))
+	})
 }
 
 func TestRunGitConfig(t *testing.T) {
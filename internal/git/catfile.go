@@ -0,0 +1,326 @@
+package git
+
+import (
+	"bufio"
+	"context"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/chmouel/lazyworktree/internal/utils"
+)
+
+// maxCatFileProcesses bounds the persistent cat-file processes kept alive;
+// the least recently used one is stopped when another worktree needs one.
+const maxCatFileProcesses = 16
+
+// errObjectNotFound reports a revision cat-file could not resolve.
+var errObjectNotFound = errors.New("object not found")
+
+// catFileObject is an object read through a `git cat-file --batch` process.
+type catFileObject struct {
+	oid     string
+	objType string
+	content []byte
+}
+
+// catFileProcess is a long-running `git cat-file --batch` bound to a worktree.
+// Requests are newline separated revisions; responses are framed by the
+// "<oid> <type> <size>" header git writes before each object.
+type catFileProcess struct {
+	mu        sync.Mutex
+	cmd       *exec.Cmd
+	stdin     io.WriteCloser
+	stdout    *bufio.Reader
+	closeOnce sync.Once
+}
+
+func (s *Service) startCatFile(worktreePath string) (*catFileProcess, error) {
+	// The process outlives the request that spawned it, so it is bound to a
+	// background context and torn down by Close.
+	cmd, err := s.prepareAllowedCommand(context.Background(), []string{"git", "cat-file", "--batch"})
+	if err != nil {
+		return nil, err
+	}
+	cmd.Dir = worktreePath
+	stdin, err := cmd.StdinPipe()
+	if err != nil {
+		return nil, err
+	}
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return nil, err
+	}
+	if err := cmd.Start(); err != nil {
+		return nil, err
+	}
+	return &catFileProcess{cmd: cmd, stdin: stdin, stdout: bufio.NewReader(stdout)}, nil
+}
+
+// read looks rev up. A lookup can block, for instance on a lazy fetch in a
+// partial clone, so the process is killed when ctx is done; the caller then
+// discards it like any other broken process.
+func (p *catFileProcess) read(ctx context.Context, rev string) (*catFileObject, error) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	stop := context.AfterFunc(ctx, func() { _ = p.cmd.Process.Kill() })
+	obj, err := p.readLocked(rev)
+	if !stop() {
+		return nil, ctx.Err()
+	}
+	return obj, err
+}
+
+func (p *catFileProcess) readLocked(rev string) (*catFileObject, error) {
+	if _, err := io.WriteString(p.stdin, rev+"\n"); err != nil {
+		return nil, err
+	}
+	header, err := p.stdout.ReadString('\n')
+	if err != nil {
+		return nil, err
+	}
+	fields := strings.Fields(header)
+	if len(fields) != 3 {
+		// "<rev> missing" or "<rev> ambiguous"
+		return nil, fmt.Errorf("%s: %w", strings.TrimSpace(header), errObjectNotFound)
+	}
+	size, err := strconv.Atoi(fields[2])
+	if err != nil {
+		return nil, fmt.Errorf("cat-file %s: invalid size %q", rev, fields[2])
+	}
+	// Content is followed by a single newline terminator.
+	content := make([]byte, size+1)
+	if _, err := io.ReadFull(p.stdout, content); err != nil {
+		return nil, err
+	}
+	return &catFileObject{oid: fields[0], objType: fields[1], content: content[:size]}, nil
+}
+
+// close stops the process. It may be called more than once, for instance
+// when a process evicted from the pool is still answering a request.
+func (p *catFileProcess) close() {
+	p.closeOnce.Do(func() {
+		_ = p.stdin.Close()
+		_ = p.cmd.Wait()
+	})
+}
+
+// readObject reads rev through the worktree's persistent cat-file process,
+// spawning it on first use. A process that fails, or whose lookup outlives
+// ctx, is discarded so the next request starts a fresh one.
+func (s *Service) readObject(ctx context.Context, worktreePath, rev string) (*catFileObject, error) {
+	if rev == "" || strings.ContainsAny(rev, "\n\r") {
+		return nil, fmt.Errorf("invalid revision %q", rev)
+	}
+	if worktreePath == "" {
+		// Key the process by the directory git would actually run in.
+		cwd, err := os.Getwd()
+		if err != nil {
+			return nil, err
+		}
+		worktreePath = cwd
+	}
+	worktreePath = filepath.Clean(worktreePath)
+
+	s.catFileMu.Lock()
+	if s.catFiles == nil {
+		s.catFiles = utils.NewLRUCache[string, *catFileProcess](maxCatFileProcesses)
+	}
+	proc, ok := s.catFiles.Get(worktreePath)
+	s.catFileMu.Unlock()
+	if !ok {
+		// Spawn without the lock so a slow start does not hold up lookups
+		// in other worktrees.
+		started, err := s.startCatFile(worktreePath)
+		if err != nil {
+			return nil, err
+		}
+		var unused *catFileProcess
+		s.catFileMu.Lock()
+		if proc, ok = s.catFiles.Get(worktreePath); ok {
+			// Another lookup started one first.
+			unused = started
+		} else {
+			proc = started
+			unused, _ = s.catFiles.Set(worktreePath, proc)
+		}
+		s.catFileMu.Unlock()
+		if unused != nil {
+			unused.close()
+		}
+	}
+
+	obj, err := proc.read(ctx, rev)
+	if err != nil && !errors.Is(err, errObjectNotFound) {
+		s.catFileMu.Lock()
+		if current, ok := s.catFiles.Get(worktreePath); ok && current == proc {
+			s.catFiles.DeleteFunc(func(path string) bool { return path == worktreePath })
+		}
+		s.catFileMu.Unlock()
+		proc.close()
+	}
+	return obj, err
+}
+
+// closeCatFiles stops the cat-file processes whose worktree matches fn.
+func (s *Service) closeCatFiles(fn func(worktreePath string) bool) {
+	s.catFileMu.Lock()
+	var procs []*catFileProcess
+	if s.catFiles != nil {
+		procs = s.catFiles.DeleteFunc(fn)
+	}
+	s.catFileMu.Unlock()
+
+	for _, proc := range procs {
+		proc.close()
+	}
+}
+
+// closeCatFile stops the cat-file process running in worktreePath, if any.
+func (s *Service) closeCatFile(worktreePath string) {
+	worktreePath = filepath.Clean(worktreePath)
+	s.closeCatFiles(func(path string) bool { return path == worktreePath })
+}
+
+// ReleaseWorktree stops the helper processes running in worktreePath. A
+// helper keeps its working directory inside the worktree, so callers
+// release it before removing or moving the worktree.
+func (s *Service) ReleaseWorktree(worktreePath string) {
+	s.closeCatFile(worktreePath)
+}
+
+// ReleaseMissingWorktrees stops the helper processes whose worktree
+// directory no longer exists, for callers pruning stale worktrees.
+func (s *Service) ReleaseMissingWorktrees() {
+	s.closeCatFiles(func(path string) bool {
+		_, err := os.Stat(path)
+		return err != nil
+	})
+}
+
+// ResolveRevision returns the object id rev points to in worktreePath, or an
+// empty string when it cannot be resolved. Lookups reuse a persistent
+// `git cat-file --batch` process per worktree instead of spawning git.
+func (s *Service) ResolveRevision(ctx context.Context, worktreePath, rev string) string {
+	obj, err := s.readObject(ctx, worktreePath, rev)
+	if err != nil {
+		s.debugf("resolve %s in %s: %v", rev, worktreePath, err)
+		return ""
+	}
+	return obj.oid
+}
+
+// RevisionExists reports whether rev resolves to an object in worktreePath.
+// The lookup goes through the persistent cat-file process; `git rev-parse
+// --verify` is only spawned when that process cannot be used.
+func (s *Service) RevisionExists(ctx context.Context, worktreePath, rev string) bool {
+	_, err := s.readObject(ctx, worktreePath, rev)
+	if err == nil {
+		return true
+	}
+	if errors.Is(err, errObjectNotFound) {
+		return false
+	}
+	s.debugf("cat-file lookup of %s in %s failed: %v", rev, worktreePath, err)
+	out := s.RunGit(ctx, []string{"git", "rev-parse", "--verify", "--quiet", rev}, worktreePath, []int{0, 1}, true, true)
+	return out != ""
+}
+
+// Close stops the persistent git helper processes started by the service.
+func (s *Service) Close() {
+	s.closeCatFiles(func(string) bool { return true })
+}
+
+// CommitObject is a commit read from the object database.
+type CommitObject struct {
+	SHA         string
+	Parents     []string
+	AuthorName  string
+	AuthorEmail string
+	AuthorDate  time.Time
+	Subject     string
+	Body        string
+}
+
+// ReadCommit reads commit rev in worktreePath through the persistent
+// cat-file process, avoiding a `git log`/`git show` spawn per lookup.
+func (s *Service) ReadCommit(ctx context.Context, worktreePath, rev string) (*CommitObject, error) {
+	obj, err := s.readObject(ctx, worktreePath, rev)
+	if err != nil {
+		return nil, err
+	}
+	if obj.objType != "commit" {
+		return nil, fmt.Errorf("%s is a %s, not a commit", rev, obj.objType)
+	}
+	return parseCommitObject(obj.oid, obj.content), nil
+}
+
+// parseCommitObject parses raw commit content. Subject and body follow
+// git's %s/%b: the first paragraph joined on one line, then the rest.
+func parseCommitObject(oid string, content []byte) *CommitObject {
+	commit := &CommitObject{SHA: oid}
+	header, message, _ := strings.Cut(string(content), "\n\n")
+	for line := range strings.SplitSeq(header, "\n") {
+		key, value, _ := strings.Cut(line, " ")
+		switch key {
+		case "parent":
+			commit.Parents = append(commit.Parents, value)
+		case "author":
+			commit.AuthorName, commit.AuthorEmail, commit.AuthorDate = parseSignature(value)
+		}
+	}
+
+	lines := strings.Split(message, "\n")
+	i := 0
+	for i < len(lines) && strings.TrimSpace(lines[i]) == "" {
+		i++
+	}
+	var subject []string
+	for ; i < len(lines) && strings.TrimSpace(lines[i]) != ""; i++ {
+		subject = append(subject, strings.TrimRight(lines[i], " \t\r"))
+	}
+	commit.Subject = strings.Join(subject, " ")
+	commit.Body = strings.TrimSpace(strings.Join(lines[i:], "\n"))
+	return commit
+}
+
+// parseSignature parses "Name <email> 1700000000 +0100".
+func parseSignature(sig string) (name, email string, when time.Time) {
+	open := strings.IndexByte(sig, '<')
+	closing := strings.LastIndexByte(sig, '>')
+	if open < 0 || closing < open {
+		return strings.TrimSpace(sig), "", time.Time{}
+	}
+	name = strings.TrimSpace(sig[:open])
+	email = sig[open+1 : closing]
+
+	fields := strings.Fields(sig[closing+1:])
+	if len(fields) != 2 {
+		return name, email, time.Time{}
+	}
+	ts, err := strconv.ParseInt(fields[0], 10, 64)
+	if err != nil {
+		return name, email, time.Time{}
+	}
+	loc := time.UTC
+	if tz := fields[1]; len(tz) == 5 {
+		hours, errH := strconv.Atoi(tz[1:3])
+		minutes, errM := strconv.Atoi(tz[3:5])
+		if errH == nil && errM == nil {
+			offset := hours*3600 + minutes*60
+			if tz[0] == '-' {
+				offset = -offset
+			}
+			loc = time.FixedZone(tz, offset)
+		}
+	}
+	return name, email, time.Unix(ts, 0).In(loc)
+}
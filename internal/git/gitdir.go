@@ -0,0 +1,86 @@
+package git
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+)
+
+// findGitCommonDir locates the common git directory for dir by walking up to
+// the nearest .git entry, following the "gitdir:" file of linked worktrees
+// and their commondir pointer. It returns "" when the layout is not the plain
+// one git creates by default (GIT_DIR overrides, bare repositories), in which
+// case callers should ask git instead.
+func findGitCommonDir(dir string) string {
+	if os.Getenv("GIT_DIR") != "" || os.Getenv("GIT_COMMON_DIR") != "" {
+		return ""
+	}
+	abs, err := filepath.Abs(dir)
+	if err != nil {
+		return ""
+	}
+	for {
+		dotGit := filepath.Join(abs, ".git")
+		if info, err := os.Stat(dotGit); err == nil {
+			if info.IsDir() {
+				return dotGit
+			}
+			return commonDirFromGitFile(abs, dotGit)
+		}
+		parent := filepath.Dir(abs)
+		if parent == abs {
+			return ""
+		}
+		abs = parent
+	}
+}
+
+// commonDirFromGitFile resolves a linked worktree's ".git" file to the
+// repository's common directory.
+func commonDirFromGitFile(worktreeRoot, dotGit string) string {
+	// #nosec G304 -- dotGit is the .git file of the enclosing worktree
+	data, err := os.ReadFile(dotGit)
+	if err != nil {
+		return ""
+	}
+	gitDir, ok := strings.CutPrefix(strings.TrimSpace(string(data)), "gitdir: ")
+	if !ok {
+		return ""
+	}
+	if !filepath.IsAbs(gitDir) {
+		gitDir = filepath.Join(worktreeRoot, gitDir)
+	}
+	// #nosec G304 -- commondir lives inside the worktree's git directory
+	common, err := os.ReadFile(filepath.Join(gitDir, "commondir"))
+	if err != nil {
+		return gitDir
+	}
+	commonDir := strings.TrimSpace(string(common))
+	if !filepath.IsAbs(commonDir) {
+		commonDir = filepath.Join(gitDir, commonDir)
+	}
+	return filepath.Clean(commonDir)
+}
+
+// originHeadFromFiles reads refs/remotes/origin/HEAD straight from the
+// repository enclosing dir and returns its target in the short form
+// `git symbolic-ref --short` prints ("origin/main"). Symbolic refs are always
+// loose files in the files ref backend, so this replaces a git spawn with a
+// single read; "" means git has to be asked (other ref backends, no
+// origin/HEAD, unusual layouts).
+func originHeadFromFiles(dir string) string {
+	commonDir := findGitCommonDir(dir)
+	if commonDir == "" {
+		return ""
+	}
+	// #nosec G304 -- path is inside the repository's git directory
+	data, err := os.ReadFile(filepath.Join(commonDir, filepath.FromSlash(originHeadRef)))
+	if err != nil {
+		return ""
+	}
+	target, ok := strings.CutPrefix(strings.TrimSpace(string(data)), "ref: refs/remotes/")
+	if !ok {
+		return ""
+	}
+	return target
+}
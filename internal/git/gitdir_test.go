@@ -0,0 +1,33 @@
+package git
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestOriginHeadFromFiles(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	assert.Empty(t, originHeadFromFiles(repo), "no origin/HEAD yet")
+
+	runGit(t, repo, "update-ref", "refs/remotes/origin/trunk", "HEAD")
+	runGit(t, repo, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/trunk")
+	want := runGit(t, repo, "symbolic-ref", "--short", originHeadRef)
+	require.Equal(t, "origin/trunk", want)
+
+	subdir := filepath.Join(repo, "nested", "dir")
+	require.NoError(t, os.MkdirAll(subdir, 0o750))
+	worktree := filepath.Join(t.TempDir(), "linked")
+	runGit(t, repo, "worktree", "add", "-b", "linked", worktree)
+
+	for _, dir := range []string{repo, subdir, worktree} {
+		assert.Equal(t, want, originHeadFromFiles(dir), dir)
+	}
+	assert.Empty(t, originHeadFromFiles(t.TempDir()), "outside a repository")
+}
@@ -2,10 +2,15 @@
 package git
 
 import (
+	"bufio"
+	"bytes"
+	"cmp"
 	"context"
 	"crypto/sha256"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -21,6 +26,7 @@ import (
 	"github.com/chmouel/lazyworktree/internal/config"
 	log "github.com/chmouel/lazyworktree/internal/log"
 	"github.com/chmouel/lazyworktree/internal/models"
+	"github.com/chmouel/lazyworktree/internal/utils"
 )
 
 const (
@@ -37,6 +43,16 @@ const (
 
 	// PR state constants
 	prStateOpen = "OPEN"
+
+	originHeadRef = "refs/remotes/origin/HEAD"
+)
+
+// Remote URL patterns, compiled once rather than on every lookup.
+var (
+	remoteHostRe = regexp.MustCompile(`(?:git@|https?://|ssh://|git://)(?:[^@]+@)?([^/:]+)`)
+	githubRepoRe = regexp.MustCompile(`github\.com[:/](.+)(?:\.git)?$`)
+	gitlabRepoRe = regexp.MustCompile(`gitlab\.com[:/](.+)(?:\.git)?$`)
+	repoPathRe   = regexp.MustCompile(`[:/]([^/]+?/[^/]+?)(?:\.git)?$`)
 )
 
 // LookupPath is used to find executables in PATH. It's exposed as a package variable
@@ -49,6 +65,21 @@ type NotifyFn func(message string, severity string)
 // NotifyOnceFn reports deduplicated notification messages.
 type NotifyOnceFn func(key string, message string, severity string)
 
+// WorktreeListTTL is how long a worktree listing answers lookups that
+// follow a refresh, such as resolving the main worktree or checking which
+// worktrees still exist, when passed to RecentWorktreeList.
+const WorktreeListTTL = 2 * time.Second
+
+// maxConcurrentCommands caps the git, gh and glab processes the service
+// runs at once; each holds a pipe pair and a few descriptors.
+const maxConcurrentCommands = 32
+
+// commandWaitDelay bounds how long Wait keeps draining a command's output
+// pipes once the command has exited, whether it finished or was cancelled.
+// It starts on every exit, so a successful command whose helpers held the
+// pipes past it is not a failure; see commandError.
+const commandWaitDelay = 2 * time.Second
+
 // Service orchestrates git and helper commands for the UI.
 type Service struct {
 	notify        NotifyFn
@@ -61,21 +92,29 @@ type Service struct {
 	gitPagerArgs  []string
 	gitPager      string
 	commandRunner func(ctx context.Context, name string, args ...string) *exec.Cmd
+	catFileMu     sync.Mutex
+	catFiles      *utils.LRUCache[string, *catFileProcess]
+
+	mainWorktreeMu   sync.Mutex
+	mainWorktreePath string
+
+	statusMu     sync.Mutex
+	recentStatus map[string]statusSnapshot
+	worktreeList statusSnapshot
+
+	repoNameMu        sync.Mutex
+	repoName          string
+	repoNameCacheFile string
 }
 
 // NewService constructs a Service and sets up concurrency limits.
 func NewService(notify NotifyFn, notifyOnce NotifyOnceFn) *Service {
-	limit := runtime.NumCPU() * 2
-	if limit < 4 {
-		limit = 4
-	}
-	if limit > 32 {
-		limit = 32
-	}
+	limit := min(runtime.NumCPU()*4, maxConcurrentCommands)
 
 	// Initialize counting semaphore: channel starts full with 'limit' tokens.
 	// acquireSemaphore() takes a token (blocks if none available), releaseSemaphore() returns it.
-	// This limits concurrent git operations to 'limit' goroutines.
+	// Every git, gh and glab process the service runs holds a token, so this
+	// caps the processes (and their pipes) alive at once across the service.
 	semaphore := make(chan struct{}, limit)
 	for i := 0; i < limit; i++ {
 		semaphore <- struct{}{}
@@ -107,12 +146,32 @@ func (s *Service) prepareAllowedCommand(ctx context.Context, args []string) (*ex
 
 	switch args[0] {
 	case "git", "glab", "gh":
-		return s.commandRunner(ctx, args[0], args[1:]...), nil
+		cmd := s.commandRunner(ctx, args[0], args[1:]...)
+		// Stdin is left nil so children read /dev/null, and Go marks every
+		// other descriptor close-on-exec. What remains is helpers git
+		// starts itself (ssh ControlPersist, credential daemons, fsmonitor,
+		// hooks): they can keep the output pipes open long after git exits,
+		// so bound how long Wait holds on to them.
+		if cmd.WaitDelay == 0 {
+			cmd.WaitDelay = commandWaitDelay
+		}
+		return cmd, nil
 	default:
 		return nil, fmt.Errorf("unsupported command %q", args[0])
 	}
 }
 
+// commandError returns the error from running cmd, dropping the
+// exec.ErrWaitDelay Wait reports when the command succeeded but a helper it
+// started kept the output pipes open past WaitDelay: the command's own output
+// was complete when it exited.
+func commandError(cmd *exec.Cmd, err error) error {
+	if errors.Is(err, exec.ErrWaitDelay) && cmd.ProcessState != nil && cmd.ProcessState.Success() {
+		return nil
+	}
+	return err
+}
+
 // SetGitPagerArgs sets additional arguments used when formatting diffs.
 func (s *Service) SetGitPagerArgs(args []string) {
 	if len(args) == 0 {
@@ -137,9 +196,24 @@ func (s *Service) isGitPagerAvailable() bool {
 }
 
 func (s *Service) debugf(format string, args ...any) {
+	if !log.Enabled() {
+		return
+	}
 	log.Printf(format, args...)
 }
 
+// commandLine formats a command's arguments for messages. The arguments are
+// only joined when the value is printed, so debug messages that are
+// discarded and commands that succeed never build the string.
+type commandLine []string
+
+func (c commandLine) String() string {
+	if len(c) == 0 {
+		return "<empty>"
+	}
+	return strings.Join(c, " ")
+}
+
 func (s *Service) detectGitPager() {
 	s.useGitPager = s.isGitPagerAvailable()
 }
@@ -176,36 +250,65 @@ func (s *Service) UseGitPager() bool {
 // ExecuteCommands runs provided shell commands sequentially inside the given working directory.
 func (s *Service) ExecuteCommands(ctx context.Context, cmdList []string, cwd string, env map[string]string) error {
 	for _, cmdStr := range cmdList {
-		if strings.TrimSpace(cmdStr) == "" {
-			continue
+		if err := s.executeCommand(ctx, cmdStr, cwd, env); err != nil {
+			return err
 		}
+	}
+	return nil
+}
 
-		s.debugf("exec: %s (cwd=%s)", cmdStr, cwd)
-		if cmdStr == "link_topsymlinks" {
-			mainPath := env["MAIN_WORKTREE_PATH"]
-			wtPath := env["WORKTREE_PATH"]
-			statusFunc := func(ctx context.Context, path string) string {
-				return s.RunGit(ctx, []string{"git", "status", "--porcelain", "--ignored"}, path, []int{0}, true, false)
-			}
-			if err := commands.LinkTopSymlinks(ctx, mainPath, wtPath, statusFunc); err != nil {
-				return err
-			}
-			continue
-		}
-		// #nosec G204 -- commands are defined in the local config and executed through bash intentionally
-		command := exec.CommandContext(ctx, "bash", "-lc", cmdStr)
-		if cwd != "" {
-			command.Dir = cwd
+// parallelCommandLimit caps the commands ExecuteCommandsParallel runs at once.
+const parallelCommandLimit = 4
+
+// ExecuteCommandsParallel runs provided shell commands concurrently inside the
+// given working directory, at most parallelCommandLimit at a time. Every
+// command runs even when another fails; the failures are joined.
+func (s *Service) ExecuteCommandsParallel(ctx context.Context, cmdList []string, cwd string, env map[string]string) error {
+	errs := make([]error, len(cmdList))
+	slots := make(chan struct{}, parallelCommandLimit)
+	var wg sync.WaitGroup
+	for i, cmdStr := range cmdList {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			slots <- struct{}{}
+			defer func() { <-slots }()
+			errs[i] = s.executeCommand(ctx, cmdStr, cwd, env)
+		}()
+	}
+	wg.Wait()
+	return errors.Join(errs...)
+}
+
+func (s *Service) executeCommand(ctx context.Context, cmdStr, cwd string, env map[string]string) error {
+	if strings.TrimSpace(cmdStr) == "" {
+		return nil
+	}
+
+	s.debugf("exec: %s (cwd=%s)", cmdStr, cwd)
+	if cmdStr == "link_topsymlinks" {
+		mainPath := env["MAIN_WORKTREE_PATH"]
+		wtPath := env["WORKTREE_PATH"]
+		statusFunc := func(ctx context.Context, path string) string {
+			// Only root entries are linked; the glob pathspec (where * does
+			// not match "/") keeps git from listing anything nested.
+			return s.RunGit(ctx, []string{"git", "status", "--porcelain", "--ignored", "--", ":(glob)*"}, path, nil, true, false)
 		}
-		command.Env = append(os.Environ(), formatEnv(env)...)
-		out, err := command.CombinedOutput()
-		if err != nil {
-			detail := strings.TrimSpace(string(out))
-			if detail != "" {
-				return fmt.Errorf("%s: %s", cmdStr, detail)
-			}
-			return fmt.Errorf("%s: %w", cmdStr, err)
+		return commands.LinkTopSymlinks(ctx, mainPath, wtPath, statusFunc)
+	}
+	// #nosec G204 -- commands are defined in the local config and executed through bash intentionally
+	command := exec.CommandContext(ctx, "bash", "-lc", cmdStr)
+	if cwd != "" {
+		command.Dir = cwd
+	}
+	command.Env = append(os.Environ(), formatEnv(env)...)
+	out, err := command.CombinedOutput()
+	if err != nil {
+		detail := strings.TrimSpace(string(out))
+		if detail != "" {
+			return fmt.Errorf("%s: %s", cmdStr, detail)
 		}
+		return fmt.Errorf("%s: %w", cmdStr, err)
 	}
 	return nil
 }
@@ -229,76 +332,223 @@ func (s *Service) releaseSemaphore() {
 	s.semaphore <- struct{}{}
 }
 
+// gated runs fn, which starts and waits for a child process, while holding a
+// semaphore token. fn must not start other gated commands itself.
+func (s *Service) gated(fn func() error) error {
+	s.acquireSemaphore()
+	defer s.releaseSemaphore()
+	return fn()
+}
+
 // RunGit executes a git command and optionally trims its output.
+// okReturncodes lists the non-zero exit codes to accept as success; exit 0
+// always is, so most callers pass nil and no slice is built per call.
 func (s *Service) RunGit(ctx context.Context, args []string, cwd string, okReturncodes []int, strip, silent bool) string {
-	command := strings.Join(args, " ")
-	if command == "" {
-		command = "<empty>"
-	}
-	s.debugf("run: %s (cwd=%s)", command, cwd)
+	s.debugf("run: %s (cwd=%s)", commandLine(args), cwd)
 
 	cmd, err := s.prepareAllowedCommand(ctx, args)
 	if err != nil {
-		key := fmt.Sprintf("unsupported_cmd:%s", command)
-		s.notifyOnce(key, fmt.Sprintf("Unsupported command: %s", command), "error")
-		s.debugf("error: %s (unsupported command)", command)
+		s.reportUnsupportedCommand(args)
 		return ""
 	}
 	if cwd != "" {
 		cmd.Dir = cwd
 	}
 
-	output, err := cmd.Output()
-	if err != nil {
-		if exitError, ok := err.(*exec.ExitError); ok {
-			returnCode := exitError.ExitCode()
-			allowed := slices.Contains(okReturncodes, returnCode)
-			if !allowed {
-				if silent {
-					s.debugf("error: %s (exit %d, silenced)", command, returnCode)
-					return ""
-				}
-				stderr := string(exitError.Stderr)
-				suffix := ""
-				if stderr != "" {
-					suffix = ": " + strings.TrimSpace(stderr)
-				} else {
-					suffix = fmt.Sprintf(" (exit %d)", returnCode)
-				}
-				key := fmt.Sprintf("git_fail:%s:%s", cwd, command)
-				s.notifyOnce(key, fmt.Sprintf("Command failed: %s%s", command, suffix), "error")
-				s.debugf("error: %s%s", command, suffix)
-				return ""
-			}
-		} else {
-			if !silent {
-				command := "<unknown>"
-				if len(args) > 0 {
-					command = args[0]
-				}
-				key := fmt.Sprintf("cmd_missing:%s", command)
-				s.notifyOnce(key, fmt.Sprintf("Command not found: %s", command), "error")
-				s.debugf("error: command not found: %s", command)
-			}
-			return ""
-		}
+	// Output is collected straight into a strings.Builder, whose String
+	// does not copy, instead of a []byte that would be copied again into
+	// the returned string. Stderr is only turned into a string on failure.
+	var stdout strings.Builder
+	var stderrBuf stderrBuffer
+	cmd.Stdout = &stdout
+	cmd.Stderr = &stderrBuf
+	err = s.gated(func() error {
+		return commandError(cmd, cmd.Run())
+	})
+	if s.reportCommandError(args, err, &stderrBuf, okReturncodes, silent) {
+		return ""
 	}
 
-	out := string(output)
+	out := stdout.String()
 	if strip {
 		out = strings.TrimSpace(out)
 	}
-	s.debugf("ok: %s", command)
+	s.debugf("ok: %s", commandLine(args))
 	return out
 }
 
+// reportUnsupportedCommand reports a command that is not allowed to run.
+func (s *Service) reportUnsupportedCommand(args []string) {
+	command := commandLine(args).String()
+	key := fmt.Sprintf("unsupported_cmd:%s", command)
+	s.notifyOnce(key, fmt.Sprintf("Unsupported command: %s", command), "error")
+	s.debugf("error: %s (unsupported command)", command)
+}
+
+// reportCommandError reports err from running args and returns true when
+// the command failed. Exit codes in okReturncodes count as success; silent
+// keeps failures out of the notifications.
+func (s *Service) reportCommandError(args []string, err error, stderrBuf *stderrBuffer, okReturncodes []int, silent bool) bool {
+	if err == nil {
+		return false
+	}
+	var exitError *exec.ExitError
+	if !errors.As(err, &exitError) {
+		if !silent {
+			command := "<unknown>"
+			if len(args) > 0 {
+				command = args[0]
+			}
+			key := fmt.Sprintf("cmd_missing:%s", command)
+			s.notifyOnce(key, fmt.Sprintf("Command not found: %s", command), "error")
+			s.debugf("error: command not found: %s", command)
+		}
+		return true
+	}
+	returnCode := exitError.ExitCode()
+	if slices.Contains(okReturncodes, returnCode) {
+		return false
+	}
+	if silent {
+		s.debugf("error: %s (exit %d, silenced)", commandLine(args), returnCode)
+		return true
+	}
+	command := commandLine(args).String()
+	stderr := stderrBuf.String()
+	suffix := ""
+	if stderr != "" {
+		suffix = ": " + strings.TrimSpace(stderr)
+	} else {
+		suffix = fmt.Sprintf(" (exit %d)", returnCode)
+	}
+	// Keyed without cwd so a command failing in every worktree is
+	// reported once.
+	key := fmt.Sprintf("git_fail:%s", command)
+	s.notifyOnce(key, fmt.Sprintf("Command failed: %s%s", command, suffix), "error")
+	s.debugf("error: %s%s", command, suffix)
+	return true
+}
+
+// stderrBufferLimit caps the stderr kept for failure messages, like the
+// capture exec.Cmd.Output does.
+const stderrBufferLimit = 32 << 10
+
+// stderrBuffer keeps the first stderrBufferLimit bytes written to it and
+// discards the rest.
+type stderrBuffer struct {
+	buf bytes.Buffer
+}
+
+func (b *stderrBuffer) Write(p []byte) (int, error) {
+	if room := stderrBufferLimit - b.buf.Len(); room > 0 {
+		b.buf.Write(p[:min(len(p), room)])
+	}
+	return len(p), nil
+}
+
+func (b *stderrBuffer) String() string {
+	return b.buf.String()
+}
+
+// runGitLimited returns at most limit bytes of a git command's output,
+// stopping the command once the limit is reached rather than reading output
+// that would be thrown away. A limit of 0 reads everything. Failures are
+// reported like RunGit does.
+func (s *Service) runGitLimited(ctx context.Context, args []string, cwd string, limit int) string {
+	if limit <= 0 {
+		return s.RunGit(ctx, args, cwd, nil, false, false)
+	}
+
+	s.debugf("run: %s (cwd=%s, limit=%d)", commandLine(args), cwd, limit)
+	runCtx, cancel := context.WithCancel(ctx)
+	defer cancel()
+	cmd, err := s.prepareAllowedCommand(runCtx, args)
+	if err != nil {
+		s.reportUnsupportedCommand(args)
+		return ""
+	}
+	if cwd != "" {
+		cmd.Dir = cwd
+	}
+	var stderrBuf stderrBuffer
+	cmd.Stderr = &stderrBuf
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		s.reportCommandError(args, err, &stderrBuf, nil, false)
+		return ""
+	}
+
+	var output []byte
+	truncated := false
+	err = s.gated(func() error {
+		if err := cmd.Start(); err != nil {
+			return err
+		}
+		var readErr error
+		output, readErr = io.ReadAll(io.LimitReader(stdout, int64(limit)))
+		truncated = readErr == nil && len(output) == limit
+		if truncated {
+			// Stop git instead of letting it produce the rest of the output.
+			cancel()
+		}
+		return errors.Join(readErr, commandError(cmd, cmd.Wait()))
+	})
+	if !truncated && s.reportCommandError(args, err, &stderrBuf, nil, false) {
+		return ""
+	}
+	s.debugf("ok: %s (read %d bytes)", commandLine(args), len(output))
+	return string(output)
+}
+
+// runGitLines hands each line of a git command's output to fn as it is
+// read, so callers that keep only part of a large output never hold all of
+// it. fn runs while the command holds a semaphore token, so it must not run
+// git itself. It returns false when the command fails, after reporting the
+// failure like RunGit does; anything fn collected should then be discarded.
+func (s *Service) runGitLines(ctx context.Context, args []string, cwd string, silent bool, fn func(line string)) bool {
+	s.debugf("run: %s (cwd=%s, streamed)", commandLine(args), cwd)
+	cmd, err := s.prepareAllowedCommand(ctx, args)
+	if err != nil {
+		s.reportUnsupportedCommand(args)
+		return false
+	}
+	if cwd != "" {
+		cmd.Dir = cwd
+	}
+	var stderrBuf stderrBuffer
+	cmd.Stderr = &stderrBuf
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		s.reportCommandError(args, err, &stderrBuf, nil, silent)
+		return false
+	}
+
+	err = s.gated(func() error {
+		if err := cmd.Start(); err != nil {
+			return err
+		}
+		scanner := bufio.NewScanner(stdout)
+		scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
+		for scanner.Scan() {
+			fn(scanner.Text())
+		}
+		scanErr := scanner.Err()
+		if scanErr != nil {
+			// Drain the rest so git is not left blocked on a full pipe.
+			_, _ = io.Copy(io.Discard, stdout)
+		}
+		return errors.Join(scanErr, commandError(cmd, cmd.Wait()))
+	})
+	if s.reportCommandError(args, err, &stderrBuf, nil, silent) {
+		return false
+	}
+	s.debugf("ok: %s", commandLine(args))
+	return true
+}
+
 // RunCommandChecked runs the provided git command and reports failures via notify callbacks.
 func (s *Service) RunCommandChecked(ctx context.Context, args []string, cwd, errorPrefix string) bool {
-	command := strings.Join(args, " ")
-	if command == "" {
-		command = "<empty>"
-	}
-	s.debugf("run: %s (cwd=%s)", command, cwd)
+	s.debugf("run: %s (cwd=%s)", commandLine(args), cwd)
 
 	cmd, err := s.prepareAllowedCommand(ctx, args)
 	if err != nil {
@@ -314,7 +564,11 @@ func (s *Service) RunCommandChecked(ctx context.Context, args []string, cwd, err
 		cmd.Dir = cwd
 	}
 
-	output, err := cmd.CombinedOutput()
+	var output []byte
+	err = s.gated(func() (err error) {
+		output, err = cmd.CombinedOutput()
+		return commandError(cmd, err)
+	})
 	if err != nil {
 		detail := strings.TrimSpace(string(output))
 		if detail != "" {
@@ -327,14 +581,13 @@ func (s *Service) RunCommandChecked(ctx context.Context, args []string, cwd, err
 		return false
 	}
 
-	s.debugf("ok: %s", command)
+	s.debugf("ok: %s", commandLine(args))
 	return true
 }
 
 // RunGitWithCombinedOutput executes a git command with environment variables and returns its combined output and error.
 func (s *Service) RunGitWithCombinedOutput(ctx context.Context, args []string, cwd string, env map[string]string) ([]byte, error) {
-	command := strings.Join(args, " ")
-	s.debugf("run: %s (cwd=%s)", command, cwd)
+	s.debugf("run: %s (cwd=%s)", commandLine(args), cwd)
 
 	cmd, err := s.prepareAllowedCommand(ctx, args)
 	if err != nil {
@@ -347,7 +600,12 @@ func (s *Service) RunGitWithCombinedOutput(ctx context.Context, args []string, c
 		cmd.Env = append(os.Environ(), formatEnv(env)...)
 	}
 
-	return cmd.CombinedOutput()
+	var output []byte
+	err = s.gated(func() (err error) {
+		output, err = cmd.CombinedOutput()
+		return commandError(cmd, err)
+	})
+	return output, err
 }
 
 // GetMainBranch returns the main branch name for the current repository.
@@ -356,19 +614,27 @@ func (s *Service) GetMainBranch(ctx context.Context) string {
 		return s.mainBranch
 	}
 
-	out := s.RunGit(ctx, []string{"git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"}, "", []int{0}, true, false)
-	if out != "" {
-		parts := strings.Split(out, "/")
-		if len(parts) > 0 {
-			s.mainBranch = parts[len(parts)-1]
-		}
+	// origin/HEAD is normally a loose symref file, read without spawning git.
+	out := originHeadFromFiles(".")
+	if out == "" {
+		out = s.RunGit(ctx, []string{"git", "symbolic-ref", "--short", originHeadRef}, "", nil, true, false)
 	}
+	s.mainBranch = mainBranchFromSymref(out)
 	if s.mainBranch == "" {
 		s.mainBranch = "main"
 	}
 	return s.mainBranch
 }
 
+// mainBranchFromSymref extracts the branch name from a short origin/HEAD target.
+func mainBranchFromSymref(target string) string {
+	if target == "" {
+		return ""
+	}
+	parts := strings.Split(target, "/")
+	return parts[len(parts)-1]
+}
+
 // GetCurrentBranch returns the current branch name from the current working directory.
 // Returns an error if not in a git repository or if HEAD is detached.
 func (s *Service) GetCurrentBranch(ctx context.Context) (string, error) {
@@ -382,7 +648,7 @@ func (s *Service) GetCurrentBranch(ctx context.Context) (string, error) {
 		ctx,
 		[]string{"git", "rev-parse", "--abbrev-ref", "HEAD"},
 		cwd,
-		[]int{0},
+		nil,
 		true,
 		false,
 	)
@@ -398,12 +664,15 @@ func (s *Service) GetCurrentBranch(ctx context.Context) (string, error) {
 
 // GetHeadSHA returns the HEAD commit SHA for a worktree path.
 func (s *Service) GetHeadSHA(ctx context.Context, worktreePath string) string {
-	return s.RunGit(ctx, []string{"git", "rev-parse", "HEAD"}, worktreePath, []int{0}, true, true)
+	if sha := s.ResolveRevision(ctx, worktreePath, "HEAD"); sha != "" {
+		return sha
+	}
+	return s.RunGit(ctx, []string{"git", "rev-parse", "HEAD"}, worktreePath, nil, true, true)
 }
 
 // GetMergedBranches returns local branches that have been merged into the specified base branch.
 func (s *Service) GetMergedBranches(ctx context.Context, baseBranch string) []string {
-	output := s.RunGit(ctx, []string{"git", "branch", "--merged", baseBranch}, "", []int{0}, true, false)
+	output := s.RunGit(ctx, []string{"git", "branch", "--merged", baseBranch}, "", nil, true, false)
 	if output == "" {
 		return nil
 	}
@@ -428,7 +697,31 @@ func (s *Service) GetMergedBranches(ctx context.Context, baseBranch string) []st
 // This method concurrently fetches status information for each worktree to improve performance.
 // The first worktree in the list is marked as the main worktree.
 func (s *Service) GetWorktrees(ctx context.Context) ([]*models.WorktreeInfo, error) {
-	rawWts := s.RunGit(ctx, []string{"git", "worktree", "list", "--porcelain"}, "", []int{0}, true, false)
+	return s.GetWorktreesWithProgress(ctx, nil)
+}
+
+// GetWorktreesWithProgress is GetWorktrees, additionally passing a copy of
+// each worktree to onProbe as soon as its status is known, before unpushed
+// counts and the final ordering are settled. onProbe may be called
+// concurrently from several goroutines, including the caller's.
+func (s *Service) GetWorktreesWithProgress(ctx context.Context, onProbe func(models.WorktreeInfo)) ([]*models.WorktreeInfo, error) {
+	// The branch listing does not depend on the worktree listing, so both
+	// git processes run at once. origin/HEAD rides along with the branches
+	// so the main branch is known without a separate symbolic-ref call.
+	// Fields are tab separated, as refnames cannot contain control
+	// characters, and git sorts the branches by most recent commit so
+	// results can keep that order. The channel is buffered so the goroutine
+	// does not block when the listing comes back empty and nobody reads it.
+	branchListing := make(chan string, 1)
+	go func() {
+		branchListing <- s.RunGit(ctx, []string{
+			"git", "for-each-ref", "--sort=-committerdate",
+			"--format=%(refname)%09%(committerdate:relative)%09%(committerdate:unix)%09%(symref:short)",
+			"refs/heads", originHeadRef,
+		}, "", nil, false, false) // unstripped: the last field may be empty
+	}()
+
+	rawWts := s.RecentWorktreeList(ctx, 0)
 	if rawWts == "" {
 		return []*models.WorktreeInfo{}, nil
 	}
@@ -439,176 +732,326 @@ func (s *Service) GetWorktrees(ctx context.Context) ([]*models.WorktreeInfo, err
 		isMain bool
 	}
 
-	var wts []wtData
-	var currentWt *wtData
-
-	lines := strings.SplitSeq(rawWts, "\n")
-	for line := range lines {
-		if strings.HasPrefix(line, "worktree ") {
-			if currentWt != nil {
-				wts = append(wts, *currentWt)
-			}
-			path := strings.TrimPrefix(line, "worktree ")
-			currentWt = &wtData{path: path}
-		} else if strings.HasPrefix(line, "branch ") {
-			if currentWt != nil {
-				branch := strings.TrimPrefix(line, "branch ")
-				branch = strings.TrimPrefix(branch, "refs/heads/")
-				currentWt.branch = branch
-			}
+	// Entries are filled in place in a slice sized from the listing, the
+	// first one being the main worktree, instead of being built through a
+	// pointer and copied in once complete.
+	wts := make([]wtData, 0, strings.Count(rawWts, "worktree "))
+	for line := range strings.SplitSeq(rawWts, "\n") {
+		if path, ok := strings.CutPrefix(line, "worktree "); ok {
+			wts = append(wts, wtData{path: path, isMain: len(wts) == 0})
+		} else if branch, ok := strings.CutPrefix(line, "branch "); ok && len(wts) > 0 {
+			wts[len(wts)-1].branch = strings.TrimPrefix(branch, "refs/heads/")
 		}
 	}
-	if currentWt != nil {
-		wts = append(wts, *currentWt)
-	}
-
-	// Mark first as main
-	for i := range wts {
-		wts[i].isMain = (i == 0)
+	if len(wts) > 0 {
+		s.setMainWorktreePath(wts[0].path)
 	}
 
-	branchRaw := s.RunGit(ctx, []string{
-		"git", "for-each-ref",
-		"--format=%(refname:short)|%(committerdate:relative)|%(committerdate:unix)",
-		"refs/heads",
-	}, "", []int{0}, true, false)
+	branchRaw := <-branchListing
 
-	branchInfo := make(map[string]struct {
+	type branchActivity struct {
 		lastActive   string
 		lastActiveTS int64
-	})
+		rank         int
+	}
+	branchInfo := make(map[string]branchActivity, strings.Count(branchRaw, "\n"))
 
+	// Lines are cut field by field rather than split into a slice, which
+	// keeps the per-branch work allocation free on repositories with
+	// hundreds of branches.
 	for line := range strings.SplitSeq(branchRaw, "\n") {
-		if strings.Contains(line, "|") {
-			parts := strings.Split(line, "|")
-			if len(parts) == 3 {
-				branch := parts[0]
-				lastActive := parts[1]
-				lastActiveTS, _ := strconv.ParseInt(parts[2], 10, 64)
-				branchInfo[branch] = struct {
-					lastActive   string
-					lastActiveTS int64
-				}{lastActive: lastActive, lastActiveTS: lastActiveTS}
+		refname, rest, ok1 := strings.Cut(line, "\t")
+		lastActive, rest, ok2 := strings.Cut(rest, "\t")
+		unixTS, symref, ok3 := strings.Cut(rest, "\t")
+		if !ok1 || !ok2 || !ok3 {
+			continue
+		}
+		if refname == originHeadRef {
+			if s.mainBranch == "" {
+				s.mainBranch = mainBranchFromSymref(symref)
 			}
+			continue
+		}
+		branch, ok := strings.CutPrefix(refname, "refs/heads/")
+		if !ok {
+			continue
 		}
+		lastActiveTS, _ := strconv.ParseInt(unixTS, 10, 64)
+		branchInfo[branch] = branchActivity{lastActive: lastActive, lastActiveTS: lastActiveTS, rank: len(branchInfo)}
 	}
 
 	// Get worktree info concurrently
 	type result struct {
-		wt  *models.WorktreeInfo
-		err error
+		wt      *models.WorktreeInfo
+		headOID string
+		err     error
 	}
 
 	results := make(chan result, len(wts))
 	var wg sync.WaitGroup
 
+	// A fixed set of workers drains the worktree list rather than parking
+	// one goroutine per worktree on the semaphore, which adds up on setups
+	// with dozens of worktrees.
+	jobs := make(chan wtData, len(wts))
 	for _, wt := range wts {
+		jobs <- wt
+	}
+	close(jobs)
+
+	probe := func(wtData wtData) result {
+		path := wtData.path
+		branch := wtData.branch
+		if branch == "" {
+			branch = "(detached)"
+		}
+
+		// --no-optional-locks keeps status from refreshing the index, so
+		// concurrent probes never contend on index.lock with each other or
+		// with the user's own git commands.
+		statusRaw := s.RunGit(ctx, []string{"git", "--no-optional-locks", "status", "--porcelain=v2", "--branch"}, path, nil, true, false)
+		s.rememberStatus(path, statusRaw)
+		st := parseWorktreeStatus(statusRaw)
+
+		// Unpushed commits for branches without upstream are counted
+		// once for all worktrees after the fan-out completes.
+		headOID := st.headOID
+		if st.hasUpstream || headOID == "(initial)" {
+			headOID = ""
+		}
+
+		info, exists := branchInfo[branch]
+		lastActive := ""
+		lastActiveTS := int64(0)
+		if exists {
+			lastActive = info.lastActive
+			lastActiveTS = info.lastActiveTS
+		}
+
+		wt := &models.WorktreeInfo{
+			Path:           path,
+			Branch:         branch,
+			IsMain:         wtData.isMain,
+			Dirty:          (st.untracked + st.modified + st.staged) > 0,
+			Ahead:          st.ahead,
+			Behind:         st.behind,
+			HasUpstream:    st.hasUpstream,
+			UpstreamBranch: st.upstreamBranch,
+			LastActive:     lastActive,
+			LastActiveTS:   lastActiveTS,
+			Untracked:      st.untracked,
+			Modified:       st.modified,
+			Staged:         st.staged,
+		}
+
+		return result{wt: wt, headOID: headOID, err: nil}
+	}
+
+	worker := func() {
+		for wt := range jobs {
+			r := probe(wt)
+			if onProbe != nil && r.err == nil {
+				onProbe(*r.wt)
+			}
+			results <- r
+		}
+	}
+	// The calling goroutine works through the list too, so a repository
+	// with a single worktree is probed without starting any goroutine.
+	for range min(len(wts), cap(s.semaphore)) - 1 {
 		wg.Add(1)
-		go func(wtData wtData) {
+		go func() {
 			defer wg.Done()
-			s.acquireSemaphore()
-			defer s.releaseSemaphore()
+			worker()
+		}()
+	}
+	worker()
 
-			path := wtData.path
-			branch := wtData.branch
-			if branch == "" {
-				branch = "(detached)"
-			}
+	wg.Wait()
+	close(results)
 
-			statusRaw := s.RunGit(ctx, []string{"git", "status", "--porcelain=v2", "--branch"}, path, []int{0}, true, false)
-
-			ahead := 0
-			behind := 0
-			hasUpstream := false
-			upstreamBranch := ""
-			untracked := 0
-			modified := 0
-			staged := 0
-
-			for _, line := range strings.Split(statusRaw, "\n") {
-				switch {
-				case strings.HasPrefix(line, "# branch.upstream "):
-					hasUpstream = true
-					upstreamBranch = strings.TrimPrefix(line, "# branch.upstream ")
-				case strings.HasPrefix(line, "# branch.ab "):
-					// branch.ab only appears when upstream is set per Git porcelain v2 spec
-					hasUpstream = true
-					parts := strings.Fields(line)
-					if len(parts) >= 4 {
-						aheadStr := strings.TrimPrefix(parts[2], "+")
-						behindStr := strings.TrimPrefix(parts[3], "-")
-						ahead, _ = strconv.Atoi(aheadStr)
-						behind, _ = strconv.Atoi(behindStr)
-					}
-				case strings.HasPrefix(line, "?"):
-					untracked++
-				case strings.HasPrefix(line, "1 "), strings.HasPrefix(line, "2 "):
-					parts := strings.Fields(line)
-					if len(parts) > 1 {
-						xy := parts[1]
-						if len(xy) >= 2 {
-							if xy[0] != '.' {
-								staged++
-							}
-							if xy[1] != '.' {
-								modified++
-							}
-						}
-					}
+	worktrees := make([]*models.WorktreeInfo, 0, len(wts))
+	headOIDs := make(map[*models.WorktreeInfo]string)
+	var tips []string
+	for r := range results {
+		if r.err == nil {
+			worktrees = append(worktrees, r.wt)
+			if r.headOID != "" {
+				headOIDs[r.wt] = r.headOID
+				if !slices.Contains(tips, r.headOID) {
+					tips = append(tips, r.headOID)
 				}
 			}
+		}
+	}
+
+	if len(tips) > 0 {
+		counts := s.countUnpushedCommits(ctx, tips, unpushedScanLimit)
+		for wt, oid := range headOIDs {
+			wt.Unpushed = counts[oid]
+		}
+	}
+
+	// Return worktrees most recently active first, following git's branch
+	// order; detached worktrees go last.
+	rank := func(wt *models.WorktreeInfo) int {
+		if info, ok := branchInfo[wt.Branch]; ok {
+			return info.rank
+		}
+		return len(branchInfo)
+	}
+	slices.SortStableFunc(worktrees, func(a, b *models.WorktreeInfo) int {
+		if c := cmp.Compare(rank(a), rank(b)); c != 0 {
+			return c
+		}
+		return strings.Compare(a.Path, b.Path)
+	})
+
+	return worktrees, nil
+}
 
-			// Calculate unpushed commits for branches without upstream
-			unpushed := 0
-			if !hasUpstream {
-				unpushedRaw := s.RunGit(ctx, []string{"git", "rev-list", "-100", "HEAD", "--not", "--remotes"}, path, []int{0}, true, true)
-				for _, line := range strings.Split(unpushedRaw, "\n") {
-					if strings.TrimSpace(line) != "" {
-						unpushed++
-					}
+// worktreeStatus summarises `git status --porcelain=v2 --branch` output.
+type worktreeStatus struct {
+	headOID        string
+	hasUpstream    bool
+	upstreamBranch string
+	ahead          int
+	behind         int
+	untracked      int
+	modified       int
+	staged         int
+}
+
+// parseWorktreeStatus tallies porcelain v2 status output in a single pass.
+// Lines are dispatched on their first byte, and entry lines are read at
+// fixed offsets ("1 XY ...", "2 XY ...") rather than split into fields,
+// which matters on trees with many changed files.
+func parseWorktreeStatus(raw string) worktreeStatus {
+	var st worktreeStatus
+	for line := range strings.SplitSeq(raw, "\n") {
+		if line == "" {
+			continue
+		}
+		switch line[0] {
+		case '#':
+			header, ok := strings.CutPrefix(line, "# branch.")
+			if !ok {
+				continue
+			}
+			if oid, ok := strings.CutPrefix(header, "oid "); ok {
+				st.headOID = oid
+			} else if upstream, ok := strings.CutPrefix(header, "upstream "); ok {
+				st.hasUpstream = true
+				st.upstreamBranch = upstream
+			} else if ab, ok := strings.CutPrefix(header, "ab "); ok {
+				// branch.ab only appears when upstream is set per Git porcelain v2 spec
+				st.hasUpstream = true
+				if aheadStr, behindStr, ok := strings.Cut(ab, " "); ok {
+					st.ahead, _ = strconv.Atoi(strings.TrimPrefix(aheadStr, "+"))
+					st.behind, _ = strconv.Atoi(strings.TrimPrefix(behindStr, "-"))
 				}
 			}
-
-			info, exists := branchInfo[branch]
-			lastActive := ""
-			lastActiveTS := int64(0)
-			if exists {
-				lastActive = info.lastActive
-				lastActiveTS = info.lastActiveTS
+		case '?':
+			st.untracked++
+		case '1', '2':
+			if len(line) < 4 || line[1] != ' ' {
+				continue
 			}
-
-			wt := &models.WorktreeInfo{
-				Path:           path,
-				Branch:         branch,
-				IsMain:         wtData.isMain,
-				Dirty:          (untracked + modified + staged) > 0,
-				Ahead:          ahead,
-				Behind:         behind,
-				Unpushed:       unpushed,
-				HasUpstream:    hasUpstream,
-				UpstreamBranch: upstreamBranch,
-				LastActive:     lastActive,
-				LastActiveTS:   lastActiveTS,
-				Untracked:      untracked,
-				Modified:       modified,
-				Staged:         staged,
+			if line[2] != '.' {
+				st.staged++
 			}
+			if line[3] != '.' {
+				st.modified++
+			}
+		}
+	}
+	return st
+}
+
+// unpushedScanLimit caps how many unpushed commits are counted per worktree.
+const unpushedScanLimit = 100
 
-			results <- result{wt: wt, err: nil}
-		}(wt)
+// countUnpushedCommits counts, for each tip, the commits not reachable from any
+// remote, up to limit. A single rev-list walk covers every tip and the per-tip
+// counts are derived from the returned parent graph, instead of spawning one
+// rev-list per worktree. The walk shares a window of limit commits per tip and
+// spends it newest first, so when the window fills up a tip with older history
+// may be missing from it or cut short; those tips are recounted on their own.
+func (s *Service) countUnpushedCommits(ctx context.Context, tips []string, limit int) map[string]int {
+	window := limit * len(tips)
+	args := make([]string, 0, len(tips)+6)
+	args = append(args, "git", "rev-list", "--parents", fmt.Sprintf("--max-count=%d", window))
+	args = append(args, tips...)
+	args = append(args, "--not", "--remotes")
+	graph := parseRevListParents(s.RunGit(ctx, args, "", nil, true, true))
+	counts := countReachableCommits(graph, tips, limit)
+	if len(graph) < window {
+		return counts
 	}
 
+	var recount []string
+	for _, tip := range tips {
+		if counts[tip] < limit {
+			recount = append(recount, tip)
+		}
+	}
+	recounted := make([]int, len(recount))
+	var wg sync.WaitGroup
+	for i, tip := range recount {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			raw := s.RunGit(ctx, []string{"git", "rev-list", "--count", fmt.Sprintf("--max-count=%d", limit), tip, "--not", "--remotes"}, "", nil, true, true)
+			recounted[i], _ = strconv.Atoi(raw)
+		}()
+	}
 	wg.Wait()
-	close(results)
+	for i, tip := range recount {
+		counts[tip] = recounted[i]
+	}
+	return counts
+}
 
-	worktrees := make([]*models.WorktreeInfo, 0, len(wts))
-	for r := range results {
-		if r.err == nil {
-			worktrees = append(worktrees, r.wt)
+// parseRevListParents parses `git rev-list --parents` output into a commit to
+// parents map.
+func parseRevListParents(raw string) map[string][]string {
+	graph := make(map[string][]string)
+	for line := range strings.SplitSeq(raw, "\n") {
+		fields := strings.Fields(line)
+		if len(fields) == 0 {
+			continue
 		}
+		graph[fields[0]] = fields[1:]
 	}
+	return graph
+}
 
-	return worktrees, nil
+// countReachableCommits counts the commits of graph reachable from each tip,
+// stopping at limit. Parents missing from graph are reachable from a remote and
+// are not walked.
+func countReachableCommits(graph map[string][]string, tips []string, limit int) map[string]int {
+	counts := make(map[string]int, len(tips))
+	for _, tip := range tips {
+		if _, ok := graph[tip]; !ok {
+			counts[tip] = 0
+			continue
+		}
+		seen := map[string]bool{tip: true}
+		queue := []string{tip}
+		for len(queue) > 0 && len(seen) < limit {
+			commit := queue[0]
+			queue = queue[1:]
+			for _, parent := range graph[commit] {
+				if _, ok := graph[parent]; !ok || seen[parent] {
+					continue
+				}
+				seen[parent] = true
+				queue = append(queue, parent)
+			}
+		}
+		counts[tip] = min(len(seen), limit)
+	}
+	return counts
 }
 
 // DetectHost detects the git host (github, gitlab, or unknown)
@@ -617,10 +1060,9 @@ func (s *Service) DetectHost(ctx context.Context) string {
 		return s.gitHost
 	}
 
-	remoteURL := s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", []int{0}, true, true)
+	remoteURL := s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", nil, true, true)
 	if remoteURL != "" {
-		re := regexp.MustCompile(`(?:git@|https?://|ssh://|git://)(?:[^@]+@)?([^/:]+)`)
-		matches := re.FindStringSubmatch(remoteURL)
+		matches := remoteHostRe.FindStringSubmatch(remoteURL)
 		if len(matches) > 1 {
 			hostname := strings.ToLower(matches[1])
 			if strings.Contains(hostname, gitHostGitLab) {
@@ -655,10 +1097,10 @@ func (s *Service) GetAuthenticatedUsername(ctx context.Context) string {
 	host := s.DetectHost(ctx)
 	switch host {
 	case gitHostGithub:
-		username := s.RunGit(ctx, []string{"gh", "api", "user", "--jq", ".login"}, "", []int{0}, true, true)
+		username := s.RunGit(ctx, []string{"gh", "api", "user", "--jq", ".login"}, "", nil, true, true)
 		return strings.TrimSpace(username)
 	case gitHostGitLab:
-		raw := s.RunGit(ctx, []string{"glab", "api", "user"}, "", []int{0}, true, true)
+		raw := s.RunGit(ctx, []string{"glab", "api", "user"}, "", nil, true, true)
 		if raw == "" {
 			return ""
 		}
@@ -700,6 +1142,59 @@ func extractAuthor(data map[string]any, keys authorKeys) (author, authorName str
 	return
 }
 
+// prListAuthor is the author object shared by gh and glab PR list payloads.
+type prListAuthor struct {
+	Login    string `json:"login"`
+	Username string `json:"username"`
+	Name     string `json:"name"`
+	IsBot    bool   `json:"is_bot"`
+	Bot      bool   `json:"bot"`
+}
+
+// githubPRListItem holds the fields read from each `gh pr list --json` entry.
+type githubPRListItem struct {
+	HeadRefName string        `json:"headRefName"`
+	State       string        `json:"state"`
+	Number      int           `json:"number"`
+	Title       string        `json:"title"`
+	Body        string        `json:"body"`
+	URL         string        `json:"url"`
+	Author      *prListAuthor `json:"author"`
+}
+
+// gitlabMRListItem holds the fields read from each GitLab merge_requests entry.
+type gitlabMRListItem struct {
+	IID          int           `json:"iid"`
+	State        string        `json:"state"`
+	Title        string        `json:"title"`
+	Description  string        `json:"description"`
+	WebURL       string        `json:"web_url"`
+	SourceBranch string        `json:"source_branch"`
+	Author       *prListAuthor `json:"author"`
+}
+
+// decodeJSONArray streams the elements of a JSON array into fn one at a time,
+// so large PR lists are never materialised as a generic object graph.
+func decodeJSONArray[T any](raw string, fn func(*T)) error {
+	dec := json.NewDecoder(strings.NewReader(raw))
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != '[' {
+		return fmt.Errorf("expected JSON array, got %v", tok)
+	}
+	for dec.More() {
+		var item T
+		if err := dec.Decode(&item); err != nil {
+			return err
+		}
+		fn(&item)
+	}
+	_, err = dec.Token()
+	return err
+}
+
 // normalizeGitLabState normalises GitLab state strings to the canonical uppercase form.
 // "opened" -> "OPEN", others are uppercased as-is.
 func normalizeGitLabState(state string) string {
@@ -711,45 +1206,35 @@ func normalizeGitLabState(state string) string {
 }
 
 func (s *Service) fetchGitLabPRs(ctx context.Context) (map[string]*models.PRInfo, error) {
-	prRaw := s.RunGit(ctx, []string{"glab", "api", "merge_requests?state=all&per_page=100"}, "", []int{0}, false, false)
+	prRaw := s.RunGit(ctx, []string{"glab", "api", "merge_requests?state=all&per_page=100"}, "", nil, false, false)
 	if prRaw == "" {
 		return make(map[string]*models.PRInfo), nil
 	}
 
-	var prs []map[string]any
-	if err := json.Unmarshal([]byte(prRaw), &prs); err != nil {
+	prMap := make(map[string]*models.PRInfo)
+	err := decodeJSONArray(prRaw, func(p *gitlabMRListItem) {
+		if p.SourceBranch == "" {
+			return
+		}
+		pr := &models.PRInfo{
+			Number: p.IID,
+			State:  normalizeGitLabState(p.State),
+			Title:  p.Title,
+			Body:   p.Description,
+			URL:    p.WebURL,
+			Branch: p.SourceBranch,
+		}
+		if p.Author != nil {
+			pr.Author, pr.AuthorName, pr.AuthorIsBot = p.Author.Username, p.Author.Name, p.Author.Bot
+		}
+		prMap[p.SourceBranch] = pr
+	})
+	if err != nil {
 		key := "pr_json_decode_glab"
 		s.notifyOnce(key, fmt.Sprintf("Failed to parse GLAB PR data: %v", err), "error")
 		return nil, err
 	}
 
-	prMap := make(map[string]*models.PRInfo)
-	for _, p := range prs {
-		state, _ := p["state"].(string)
-		state = normalizeGitLabState(state)
-
-		iid, _ := p["iid"].(float64)
-		title, _ := p["title"].(string)
-		description, _ := p["description"].(string)
-		webURL, _ := p["web_url"].(string)
-		sourceBranch, _ := p["source_branch"].(string)
-		author, authorName, authorIsBot := extractAuthor(p, gitlabAuthorKeys)
-
-		if sourceBranch != "" {
-			prMap[sourceBranch] = &models.PRInfo{
-				Number:      int(iid),
-				State:       state,
-				Title:       title,
-				Body:        description,
-				URL:         webURL,
-				Branch:      sourceBranch,
-				Author:      author,
-				AuthorName:  authorName,
-				AuthorIsBot: authorIsBot,
-			}
-		}
-	}
-
 	return prMap, nil
 }
 
@@ -774,44 +1259,36 @@ func (s *Service) FetchPRMap(ctx context.Context) (map[string]*models.PRInfo, er
 		"--state", "all",
 		"--json", "headRefName,state,number,title,body,url,author",
 		"--limit", "100",
-	}, "", []int{0}, false, host == gitHostUnknown)
+	}, "", nil, false, host == gitHostUnknown)
 
 	if prRaw == "" {
 		return make(map[string]*models.PRInfo), nil
 	}
 
-	var prs []map[string]any
-	if err := json.Unmarshal([]byte(prRaw), &prs); err != nil {
+	prMap := make(map[string]*models.PRInfo)
+	err := decodeJSONArray(prRaw, func(p *githubPRListItem) {
+		if p.HeadRefName == "" {
+			return
+		}
+		pr := &models.PRInfo{
+			Number: p.Number,
+			State:  p.State,
+			Title:  p.Title,
+			Body:   p.Body,
+			URL:    p.URL,
+			Branch: p.HeadRefName,
+		}
+		if p.Author != nil {
+			pr.Author, pr.AuthorName, pr.AuthorIsBot = p.Author.Login, p.Author.Name, p.Author.IsBot
+		}
+		prMap[p.HeadRefName] = pr
+	})
+	if err != nil {
 		key := "pr_json_decode"
 		s.notifyOnce(key, fmt.Sprintf("Failed to parse PR data: %v", err), "error")
 		return nil, err
 	}
 
-	prMap := make(map[string]*models.PRInfo)
-	for _, p := range prs {
-		headRefName, _ := p["headRefName"].(string)
-		state, _ := p["state"].(string)
-		number, _ := p["number"].(float64)
-		title, _ := p["title"].(string)
-		body, _ := p["body"].(string)
-		url, _ := p["url"].(string)
-		author, authorName, authorIsBot := extractAuthor(p, githubAuthorKeys)
-
-		if headRefName != "" {
-			prMap[headRefName] = &models.PRInfo{
-				Number:      int(number),
-				State:       state,
-				Title:       title,
-				Body:        body,
-				URL:         url,
-				Branch:      headRefName,
-				Author:      author,
-				AuthorName:  authorName,
-				AuthorIsBot: authorIsBot,
-			}
-		}
-	}
-
 	return prMap, nil
 }
 
@@ -919,6 +1396,47 @@ func (s *Service) FetchPRForWorktree(ctx context.Context, worktreePath string) *
 	return pr
 }
 
+// FetchPRsForWorktrees runs FetchPRForWorktreeWithError for every path
+// concurrently, bounded by the service semaphore. Each lookup spawns gh or
+// glab, whose start-up and API round trip dominate, so overlapping them
+// turns a refresh that waited on every worktree in turn into roughly one
+// lookup's worth of latency. Results and errors are keyed by path.
+func (s *Service) FetchPRsForWorktrees(ctx context.Context, worktreePaths []string) (map[string]*models.PRInfo, map[string]error) {
+	type result struct {
+		path string
+		pr   *models.PRInfo
+		err  error
+	}
+
+	// Resolve the host once up front; the lookups below all read it.
+	s.DetectHost(ctx)
+
+	results := make(chan result, len(worktreePaths))
+	var wg sync.WaitGroup
+	for _, path := range worktreePaths {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			pr, err := s.FetchPRForWorktreeWithError(ctx, path)
+			results <- result{path: path, pr: pr, err: err}
+		}()
+	}
+	wg.Wait()
+	close(results)
+
+	prs := make(map[string]*models.PRInfo)
+	errs := make(map[string]error)
+	for res := range results {
+		if res.pr != nil {
+			prs[res.path] = res.pr
+		}
+		if res.err != nil {
+			errs[res.path] = res.err
+		}
+	}
+	return prs, errs
+}
+
 // FetchAllOpenPRs fetches all open PRs/MRs and returns them as a slice.
 func (s *Service) FetchAllOpenPRs(ctx context.Context) ([]*models.PRInfo, error) {
 	host := s.DetectHost(ctx)
@@ -932,7 +1450,7 @@ func (s *Service) FetchAllOpenPRs(ctx context.Context) ([]*models.PRInfo, error)
 		"--state", "open",
 		"--json", "headRefName,state,number,title,body,url,author,isDraft,statusCheckRollup",
 		"--limit", "100",
-	}, "", []int{0}, false, host == gitHostUnknown)
+	}, "", nil, false, host == gitHostUnknown)
 
 	if prRaw == "" {
 		return []*models.PRInfo{}, nil
@@ -979,7 +1497,7 @@ func (s *Service) FetchAllOpenPRs(ctx context.Context) ([]*models.PRInfo, error)
 }
 
 func (s *Service) fetchGitLabOpenPRs(ctx context.Context) ([]*models.PRInfo, error) {
-	prRaw := s.RunGit(ctx, []string{"glab", "api", "merge_requests?state=opened&per_page=100"}, "", []int{0}, false, false)
+	prRaw := s.RunGit(ctx, []string{"glab", "api", "merge_requests?state=opened&per_page=100"}, "", nil, false, false)
 	if prRaw == "" {
 		return []*models.PRInfo{}, nil
 	}
@@ -1040,7 +1558,7 @@ func (s *Service) FetchPR(ctx context.Context, prNumber int) (*models.PRInfo, er
 	prRaw := s.RunGit(ctx, []string{
 		"gh", "pr", "view", strconv.Itoa(prNumber),
 		"--json", "headRefName,baseRefName,state,number,title,body,url,author,isDraft,statusCheckRollup",
-	}, "", []int{0}, false, host == gitHostUnknown)
+	}, "", nil, false, host == gitHostUnknown)
 
 	if prRaw == "" {
 		return nil, fmt.Errorf("PR #%d not found", prNumber)
@@ -1086,7 +1604,7 @@ func (s *Service) FetchPR(ctx context.Context, prNumber int) (*models.PRInfo, er
 
 // fetchGitLabPR fetches a single PR (merge request) by number from GitLab.
 func (s *Service) fetchGitLabPR(ctx context.Context, prNumber int) (*models.PRInfo, error) {
-	prRaw := s.RunGit(ctx, []string{"glab", "api", fmt.Sprintf("merge_requests/%d", prNumber)}, "", []int{0}, false, false)
+	prRaw := s.RunGit(ctx, []string{"glab", "api", fmt.Sprintf("merge_requests/%d", prNumber)}, "", nil, false, false)
 	if prRaw == "" {
 		return nil, fmt.Errorf("PR #%d not found", prNumber)
 	}
@@ -1142,7 +1660,7 @@ func (s *Service) FetchAllOpenIssues(ctx context.Context) ([]*models.IssueInfo,
 		"--state", "open",
 		"--json", "number,state,title,body,url,author",
 		"--limit", "100",
-	}, "", []int{0}, false, host == gitHostUnknown)
+	}, "", nil, false, host == gitHostUnknown)
 
 	if issueRaw == "" {
 		return []*models.IssueInfo{}, nil
@@ -1183,7 +1701,7 @@ func (s *Service) FetchAllOpenIssues(ctx context.Context) ([]*models.IssueInfo,
 }
 
 func (s *Service) fetchGitLabOpenIssues(ctx context.Context) ([]*models.IssueInfo, error) {
-	issueRaw := s.RunGit(ctx, []string{"glab", "api", "issues?state=opened&per_page=100"}, "", []int{0}, false, false)
+	issueRaw := s.RunGit(ctx, []string{"glab", "api", "issues?state=opened&per_page=100"}, "", nil, false, false)
 	if issueRaw == "" {
 		return []*models.IssueInfo{}, nil
 	}
@@ -1235,7 +1753,7 @@ func (s *Service) FetchIssue(ctx context.Context, issueNumber int) (*models.Issu
 	issueRaw := s.RunGit(ctx, []string{
 		"gh", "issue", "view", strconv.Itoa(issueNumber),
 		"--json", "number,state,title,body,url,author",
-	}, "", []int{0}, false, host == gitHostUnknown)
+	}, "", nil, false, host == gitHostUnknown)
 
 	if issueRaw == "" {
 		return nil, fmt.Errorf("issue #%d not found", issueNumber)
@@ -1273,7 +1791,7 @@ func (s *Service) FetchIssue(ctx context.Context, issueNumber int) (*models.Issu
 
 // fetchGitLabIssue fetches a single issue by number from GitLab.
 func (s *Service) fetchGitLabIssue(ctx context.Context, issueNumber int) (*models.IssueInfo, error) {
-	issueRaw := s.RunGit(ctx, []string{"glab", "api", fmt.Sprintf("issues/%d", issueNumber)}, "", []int{0}, false, false)
+	issueRaw := s.RunGit(ctx, []string{"glab", "api", fmt.Sprintf("issues/%d", issueNumber)}, "", nil, false, false)
 	if issueRaw == "" {
 		return nil, fmt.Errorf("issue #%d not found", issueNumber)
 	}
@@ -1575,22 +2093,105 @@ func (s *Service) gitlabStatusToConclusion(status string) string {
 	}
 }
 
-// GetMainWorktreePath returns the path of the main worktree.
+// GetMainWorktreePath returns the path of the main worktree. The path cannot
+// change while the repository is open, so it is resolved once and cached.
 func (s *Service) GetMainWorktreePath(ctx context.Context) string {
-	rawWts := s.RunGit(ctx, []string{"git", "worktree", "list", "--porcelain"}, "", []int{0}, true, false)
-	for _, line := range strings.Split(rawWts, "\n") {
-		if strings.HasPrefix(line, "worktree ") {
-			return strings.TrimPrefix(line, "worktree ")
+	s.mainWorktreeMu.Lock()
+	defer s.mainWorktreeMu.Unlock()
+	if s.mainWorktreePath != "" {
+		return s.mainWorktreePath
+	}
+
+	// Usually answered by the listing the last refresh just made.
+	rawWts := s.RecentWorktreeList(ctx, WorktreeListTTL)
+	for line := range strings.SplitSeq(rawWts, "\n") {
+		if path, ok := strings.CutPrefix(line, "worktree "); ok {
+			s.mainWorktreePath = path
+			return path
 		}
 	}
+	// Not cached: the working directory is only a best-effort fallback.
 	cwd, _ := os.Getwd()
 	return cwd
 }
 
+func (s *Service) setMainWorktreePath(path string) {
+	s.mainWorktreeMu.Lock()
+	defer s.mainWorktreeMu.Unlock()
+	if s.mainWorktreePath == "" {
+		s.mainWorktreePath = path
+	}
+}
+
+// statusSnapshot is git output captured while listing worktrees: a
+// worktree's `git status --porcelain=v2 --branch`, or the worktree list.
+type statusSnapshot struct {
+	raw string
+	at  time.Time
+}
+
+func (s *Service) rememberStatus(path, raw string) {
+	if raw == "" {
+		return
+	}
+	s.statusMu.Lock()
+	defer s.statusMu.Unlock()
+	if s.recentStatus == nil {
+		s.recentStatus = make(map[string]statusSnapshot)
+	}
+	s.recentStatus[path] = statusSnapshot{raw: raw, at: time.Now()}
+}
+
+// RecentWorktreeList returns `git worktree list --porcelain` output,
+// reusing the output of a listing younger than maxAge instead of running git
+// again. A maxAge of 0 always runs git. Every successful listing, including
+// the one GetWorktrees makes, is remembered for the next caller.
+func (s *Service) RecentWorktreeList(ctx context.Context, maxAge time.Duration) string {
+	if maxAge > 0 {
+		s.statusMu.Lock()
+		snap := s.worktreeList
+		s.statusMu.Unlock()
+		if snap.raw != "" && time.Since(snap.at) < maxAge {
+			return snap.raw
+		}
+	}
+
+	raw := s.RunGit(ctx, []string{"git", "worktree", "list", "--porcelain"}, "", nil, true, false)
+	if raw != "" {
+		s.statusMu.Lock()
+		s.worktreeList = statusSnapshot{raw: raw, at: time.Now()}
+		s.statusMu.Unlock()
+	}
+	return raw
+}
+
+// RecentStatus returns the porcelain v2 status GetWorktrees collected for
+// path, if it is younger than maxAge. Callers that show status right after a
+// refresh can use it instead of running git status again. The output
+// includes the "# branch" header lines.
+func (s *Service) RecentStatus(path string, maxAge time.Duration) (string, bool) {
+	s.statusMu.Lock()
+	defer s.statusMu.Unlock()
+	snap, ok := s.recentStatus[path]
+	if !ok || time.Since(snap.at) >= maxAge {
+		return "", false
+	}
+	return snap.raw, true
+}
+
+// ForgetStatus drops the status remembered for path, for callers that know
+// the worktree changed since it was listed.
+func (s *Service) ForgetStatus(path string) {
+	s.statusMu.Lock()
+	defer s.statusMu.Unlock()
+	delete(s.recentStatus, path)
+}
+
 // RenameWorktree moves a worktree and renames its branch only when the
 // worktree directory name matches the old branch name.
 func (s *Service) RenameWorktree(ctx context.Context, oldPath, newPath, oldBranch, newBranch string) bool {
 	// 1. Move the worktree directory
+	s.closeCatFile(oldPath)
 	if !s.RunCommandChecked(ctx, []string{"git", "worktree", "move", oldPath, newPath}, "", fmt.Sprintf("Failed to move worktree from %s to %s", oldPath, newPath)) {
 		return false
 	}
@@ -1621,7 +2222,7 @@ func (s *Service) fetchPRRefInfo(ctx context.Context, prNumber int, remoteBranch
 		prRaw := s.RunGit(ctx, []string{
 			"gh", "pr", "view", fmt.Sprintf("%d", prNumber),
 			"--json", "headRefOid,headRepository",
-		}, "", []int{0}, true, true)
+		}, "", nil, true, true)
 		if prRaw == "" {
 			s.notify(fmt.Sprintf("Failed to get PR #%d info", prNumber), "error")
 			return nil, false
@@ -1641,7 +2242,7 @@ func (s *Service) fetchPRRefInfo(ctx context.Context, prNumber int, remoteBranch
 			repoURL, _ = headRepo["url"].(string)
 		}
 		if repoURL == "" {
-			repoURL = strings.TrimSpace(s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", []int{0}, true, true))
+			repoURL = strings.TrimSpace(s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", nil, true, true))
 		}
 		mergeRef := fmt.Sprintf("refs/pull/%d/head", prNumber)
 		if !s.RunCommandChecked(ctx, []string{"git", "fetch", "origin", fmt.Sprintf("pull/%d/head", prNumber)}, "", fmt.Sprintf("Failed to fetch PR #%d", prNumber)) {
@@ -1653,7 +2254,7 @@ func (s *Service) fetchPRRefInfo(ctx context.Context, prNumber int, remoteBranch
 		mrRaw := s.RunGit(ctx, []string{
 			"glab", "mr", "view", fmt.Sprintf("%d", prNumber),
 			"--output", "json",
-		}, "", []int{0}, true, true)
+		}, "", nil, true, true)
 		if mrRaw == "" {
 			s.notify(fmt.Sprintf("Failed to get MR #%d info", prNumber), "error")
 			return nil, false
@@ -1672,7 +2273,7 @@ func (s *Service) fetchPRRefInfo(ctx context.Context, prNumber int, remoteBranch
 		if sourceBranch == "" {
 			sourceBranch = remoteBranch
 		}
-		repoURL := strings.TrimSpace(s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", []int{0}, true, true))
+		repoURL := strings.TrimSpace(s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", nil, true, true))
 		mergeRef := fmt.Sprintf("refs/heads/%s", sourceBranch)
 		if !s.RunCommandChecked(ctx, []string{"git", "fetch", "origin", fmt.Sprintf("refs/heads/%s", sourceBranch)}, "", fmt.Sprintf("Failed to fetch MR #%d", prNumber)) {
 			return nil, false
@@ -1688,15 +2289,15 @@ func (s *Service) configureBranchTracking(ctx context.Context, localBranch, cwd
 		return
 	}
 	host := s.DetectHost(ctx)
-	s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.remote", localBranch), ref.repoURL}, cwd, []int{0}, true, true)
+	s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.remote", localBranch), ref.repoURL}, cwd, nil, true, true)
 	if host == gitHostGithub {
-		s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.pushRemote", localBranch), ref.repoURL}, cwd, []int{0}, true, true)
+		s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.pushRemote", localBranch), ref.repoURL}, cwd, nil, true, true)
 	}
-	s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.merge", localBranch), ref.mergeRef}, cwd, []int{0}, true, true)
+	s.RunGit(ctx, []string{"git", "config", fmt.Sprintf("branch.%s.merge", localBranch), ref.mergeRef}, cwd, nil, true, true)
 }
 
 func (s *Service) findWorktreePathForBranch(ctx context.Context, branch string) (string, bool) {
-	rawWts := s.RunGit(ctx, []string{"git", "worktree", "list", "--porcelain"}, "", []int{0}, true, true)
+	rawWts := s.RunGit(ctx, []string{"git", "worktree", "list", "--porcelain"}, "", nil, true, true)
 	if rawWts == "" {
 		return "", false
 	}
@@ -1719,15 +2320,7 @@ func (s *Service) findWorktreePathForBranch(ctx context.Context, branch string)
 }
 
 func (s *Service) localBranchExists(ctx context.Context, branch string) bool {
-	ref := s.RunGit(
-		ctx,
-		[]string{"git", "show-ref", "--verify", fmt.Sprintf("refs/heads/%s", branch)},
-		"",
-		[]int{0, 1},
-		true,
-		true,
-	)
-	return strings.TrimSpace(ref) != ""
+	return s.RevisionExists(ctx, "", fmt.Sprintf("refs/heads/%s", branch))
 }
 
 func (s *Service) syncPRLocalBranch(ctx context.Context, localBranch, targetRef string) bool {
@@ -1821,7 +2414,7 @@ func (s *Service) CheckoutPRBranch(ctx context.Context, prNumber int, remoteBran
 // Returns true on success, false on failure (including conflicts).
 func (s *Service) CherryPickCommit(ctx context.Context, commitSHA, targetPath string) (bool, error) {
 	// Check if there are uncommitted changes in target worktree
-	statusRaw := s.RunGit(ctx, []string{"git", "status", "--porcelain"}, targetPath, []int{0}, true, false)
+	statusRaw := s.RunGit(ctx, []string{"git", "status", "--porcelain"}, targetPath, nil, true, false)
 	if strings.TrimSpace(statusRaw) != "" {
 		return false, fmt.Errorf("target worktree has uncommitted changes")
 	}
@@ -1833,7 +2426,11 @@ func (s *Service) CherryPickCommit(ctx context.Context, commitSHA, targetPath st
 	}
 	cmd.Dir = targetPath
 
-	output, err := cmd.CombinedOutput()
+	var output []byte
+	err = s.gated(func() (err error) {
+		output, err = cmd.CombinedOutput()
+		return commandError(cmd, err)
+	})
 	if err != nil {
 		// Cherry-pick failed - check if it's due to conflicts
 		detail := strings.TrimSpace(string(output))
@@ -1862,23 +2459,49 @@ func localRepoKey(path string) string {
 
 // ResolveRepoName resolves the repository name using various methods.
 // ResolveRepoName returns the repository identifier for caching purposes.
+// The result is memoised for the lifetime of the service.
 func (s *Service) ResolveRepoName(ctx context.Context) string {
+	s.repoNameMu.Lock()
+	defer s.repoNameMu.Unlock()
+	if s.repoName == "" {
+		s.repoName = s.resolveRepoName(ctx)
+	}
+	return s.repoName
+}
+
+// SetRepoNameCacheFile sets the file used to persist repository names
+// resolved through gh or glab across runs, keyed by remote URL.
+func (s *Service) SetRepoNameCacheFile(path string) {
+	s.repoNameCacheFile = path
+}
+
+func (s *Service) resolveRepoName(ctx context.Context) string {
 	var repoName string
 
-	// Try git remote get-url origin
-	remoteURL := s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", []int{0}, true, true)
+	// The remote URL and the top-level path are both cheap local lookups,
+	// so they run concurrently rather than one after the other.
+	var remoteURL, topLevel string
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		remoteURL = s.RunGit(ctx, []string{"git", "remote", "get-url", "origin"}, "", nil, true, true)
+	}()
+	go func() {
+		defer wg.Done()
+		topLevel = s.RunGit(ctx, []string{"git", "rev-parse", "--show-toplevel"}, "", nil, true, true)
+	}()
+	wg.Wait()
 
 	// Optimization: If it's a standard GitHub/GitLab URL, parse directly and avoid external tool overhead
 	if remoteURL != "" {
 		if strings.Contains(remoteURL, "github.com") {
-			re := regexp.MustCompile(`github\.com[:/](.+)(?:\.git)?$`)
-			matches := re.FindStringSubmatch(remoteURL)
+			matches := githubRepoRe.FindStringSubmatch(remoteURL)
 			if len(matches) > 1 {
 				repoName = matches[1]
 			}
 		} else if strings.Contains(remoteURL, "gitlab.com") {
-			re := regexp.MustCompile(`gitlab\.com[:/](.+)(?:\.git)?$`)
-			matches := re.FindStringSubmatch(remoteURL)
+			matches := gitlabRepoRe.FindStringSubmatch(remoteURL)
 			if len(matches) > 1 {
 				repoName = matches[1]
 			}
@@ -1886,45 +2509,108 @@ func (s *Service) ResolveRepoName(ctx context.Context) string {
 	}
 
 	if repoName == "" {
-		// Try gh repo view
-		if out := s.RunGit(ctx, []string{"gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"}, "", []int{0}, true, true); out != "" {
-			repoName = out
+		repoName = s.resolveRepoNameFromForge(ctx, remoteURL)
+	}
+
+	if repoName == "" && remoteURL != "" {
+		// Fallback: Parse remote URL if we have it (even if not github/gitlab, maybe self-hosted?)
+		matches := repoPathRe.FindStringSubmatch(remoteURL)
+		if len(matches) > 1 {
+			repoName = matches[1]
 		}
 	}
 
+	if repoName == "" && topLevel != "" {
+		repoName = localRepoKey(topLevel)
+	}
+
 	if repoName == "" {
-		// Try glab repo view
-		if out := s.RunGit(ctx, []string{"glab", "repo", "view", "-F", "json"}, "", []int{0}, false, true); out != "" {
+		return "unknown"
+	}
+
+	return strings.TrimSuffix(repoName, ".git")
+}
+
+// repoNameCacheTTL bounds how long a name resolved through gh or glab is
+// reused. The same remote URL can come to name another repository after a
+// rename or transfer, and expired entries are dropped when the file is
+// written, so remotes no longer in use do not accumulate.
+const repoNameCacheTTL = 7 * 24 * time.Hour
+
+// repoNameEntry is a persisted gh/glab lookup.
+type repoNameEntry struct {
+	Name       string `json:"name"`
+	ResolvedAt int64  `json:"resolved_at"`
+}
+
+// resolveRepoNameFromForge asks gh for the repository name, then glab when gh
+// has no answer. Names found for a remote URL are persisted so later runs
+// skip these network round trips.
+func (s *Service) resolveRepoNameFromForge(ctx context.Context, remoteURL string) string {
+	now := time.Now()
+	cached := s.loadRepoNameCache(now)
+	if entry, ok := cached[remoteURL]; remoteURL != "" && ok {
+		return entry.Name
+	}
+
+	name := s.RunGit(ctx, []string{"gh", "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"}, "", nil, true, true)
+	if name == "" {
+		if out := s.RunGit(ctx, []string{"glab", "repo", "view", "-F", "json"}, "", nil, false, true); out != "" {
 			var data map[string]any
 			if err := json.Unmarshal([]byte(out), &data); err == nil {
 				if path, ok := data["path_with_namespace"].(string); ok {
-					repoName = path
+					name = path
 				}
 			}
 		}
 	}
-
-	if repoName == "" && remoteURL != "" {
-		// Fallback: Parse remote URL if we have it (even if not github/gitlab, maybe self-hosted?)
-		re := regexp.MustCompile(`[:/]([^/]+/[^/]+)(?:\.git)?$`)
-		matches := re.FindStringSubmatch(remoteURL)
-		if len(matches) > 1 {
-			repoName = matches[1]
+	if name != "" && remoteURL != "" {
+		if cached == nil {
+			cached = make(map[string]repoNameEntry)
 		}
+		cached[remoteURL] = repoNameEntry{Name: name, ResolvedAt: now.Unix()}
+		s.saveRepoNameCache(cached)
 	}
+	return name
+}
 
-	if repoName == "" {
-		// Try git rev-parse --show-toplevel
-		if out := s.RunGit(ctx, []string{"git", "rev-parse", "--show-toplevel"}, "", []int{0}, true, true); out != "" {
-			repoName = localRepoKey(out)
+// loadRepoNameCache returns the persisted names that have not expired at now.
+func (s *Service) loadRepoNameCache(now time.Time) map[string]repoNameEntry {
+	if s.repoNameCacheFile == "" {
+		return nil
+	}
+	// #nosec G304 -- path is set by the application from its worktree directory
+	data, err := os.ReadFile(s.repoNameCacheFile)
+	if err != nil {
+		return nil
+	}
+	var names map[string]repoNameEntry
+	if err := json.Unmarshal(data, &names); err != nil {
+		return nil
+	}
+	for url, entry := range names {
+		if entry.Name == "" || now.Sub(time.Unix(entry.ResolvedAt, 0)) >= repoNameCacheTTL {
+			delete(names, url)
 		}
 	}
+	return names
+}
 
-	if repoName == "" {
-		return "unknown"
+func (s *Service) saveRepoNameCache(names map[string]repoNameEntry) {
+	if s.repoNameCacheFile == "" {
+		return
+	}
+	data, err := json.Marshal(names)
+	if err != nil {
+		return
+	}
+	if err := os.MkdirAll(filepath.Dir(s.repoNameCacheFile), utils.DefaultDirPerms); err != nil {
+		s.debugf("create repo name cache dir: %v", err)
+		return
+	}
+	if err := os.WriteFile(s.repoNameCacheFile, data, 0o600); err != nil {
+		s.debugf("write repo name cache: %v", err)
 	}
-
-	return strings.TrimSuffix(repoName, ".git")
 }
 
 // BuildThreePartDiff assembles a comprehensive diff showing staged, modified, and untracked sections.
@@ -1933,11 +2619,39 @@ func (s *Service) ResolveRepoName(ctx context.Context) string {
 // Part 2: Unstaged changes (git diff)
 // Part 3: Untracked files (limited by MaxUntrackedDiffs)
 func (s *Service) BuildThreePartDiff(ctx context.Context, path string, cfg *config.AppConfig) string {
+	// The three sources are independent, so they are collected concurrently
+	// and assembled in order below, where the size limits still apply.
+	// A diff longer than MaxDiffChars is cut below, so reading one byte past
+	// the limit is enough to produce the same result.
+	diffLimit := 0
+	if cfg.MaxDiffChars > 0 {
+		diffLimit = cfg.MaxDiffChars + 1
+	}
+	var stagedDiff, unstagedDiff string
+	var untrackedFiles []string
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		stagedDiff = s.runGitLimited(ctx, []string{"git", "diff", "--cached", "--patch", "--no-color"}, path, diffLimit)
+	}()
+	go func() {
+		defer wg.Done()
+		unstagedDiff = s.runGitLimited(ctx, []string{"git", "diff", "--patch", "--no-color"}, path, diffLimit)
+	}()
+	if cfg.MaxUntrackedDiffs > 0 {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			untrackedFiles = s.getUntrackedFiles(ctx, path)
+		}()
+	}
+	wg.Wait()
+
 	var parts []string
 	totalChars := 0
 
 	// Part 1: Staged changes
-	stagedDiff := s.RunGit(ctx, []string{"git", "diff", "--cached", "--patch", "--no-color"}, path, []int{0}, false, false)
 	if stagedDiff != "" {
 		header := "=== Staged Changes ===\n"
 		parts = append(parts, header+stagedDiff)
@@ -1945,29 +2659,21 @@ func (s *Service) BuildThreePartDiff(ctx context.Context, path string, cfg *conf
 	}
 
 	// Part 2: Unstaged changes
-	if totalChars < cfg.MaxDiffChars {
-		unstagedDiff := s.RunGit(ctx, []string{"git", "diff", "--patch", "--no-color"}, path, []int{0}, false, false)
-		if unstagedDiff != "" {
-			header := "=== Unstaged Changes ===\n"
-			parts = append(parts, header+unstagedDiff)
-			totalChars += len(header) + len(unstagedDiff)
-		}
+	if totalChars < cfg.MaxDiffChars && unstagedDiff != "" {
+		header := "=== Unstaged Changes ===\n"
+		parts = append(parts, header+unstagedDiff)
+		totalChars += len(header) + len(unstagedDiff)
 	}
 
 	// Part 3: Untracked files (limited by config)
 	if totalChars < cfg.MaxDiffChars && cfg.MaxUntrackedDiffs > 0 {
-		untrackedFiles := s.getUntrackedFiles(ctx, path)
 		untrackedCount := len(untrackedFiles)
-		displayCount := untrackedCount
-		if displayCount > cfg.MaxUntrackedDiffs {
-			displayCount = cfg.MaxUntrackedDiffs
-		}
+		displayCount := min(untrackedCount, cfg.MaxUntrackedDiffs)
+		diffs := s.untrackedDiffs(ctx, path, untrackedFiles[:displayCount])
 
 		for i := 0; i < displayCount && totalChars < cfg.MaxDiffChars; i++ {
-			file := untrackedFiles[i]
-			diff := s.RunGit(ctx, []string{"git", "diff", "--no-index", "/dev/null", file}, path, []int{0, 1}, false, false)
-			if diff != "" {
-				header := fmt.Sprintf("=== Untracked: %s ===\n", file)
+			if diff := diffs[i]; diff != "" {
+				header := fmt.Sprintf("=== Untracked: %s ===\n", untrackedFiles[i])
 				parts = append(parts, header+diff)
 				totalChars += len(header) + len(diff)
 			}
@@ -1989,23 +2695,141 @@ func (s *Service) BuildThreePartDiff(ctx context.Context, path string, cfg *conf
 	return result
 }
 
+// untrackedDiffConcurrency caps the `git diff --no-index` processes run at
+// once for untracked files.
+const untrackedDiffConcurrency = 4
+
+// untrackedDiffs returns the diff of each untracked file against /dev/null,
+// in the order of files.
+func (s *Service) untrackedDiffs(ctx context.Context, path string, files []string) []string {
+	diffs := make([]string, len(files))
+	var batched map[string]string
+	if len(files) > 1 {
+		batched = s.batchUntrackedDiffs(ctx, path, files)
+	}
+
+	sem := make(chan struct{}, untrackedDiffConcurrency)
+	var wg sync.WaitGroup
+	for i, file := range files {
+		if diff, ok := batched[file]; ok {
+			diffs[i] = diff
+			continue
+		}
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			diffs[i] = s.RunGit(ctx, []string{"git", "diff", "--no-index", "/dev/null", file}, path, []int{0, 1}, false, false)
+		}()
+	}
+	wg.Wait()
+	return diffs
+}
+
+// batchUntrackedDiffs diffs untracked files with two git calls instead of one
+// per file: the files are added intent-to-add to a throwaway index, and
+// `git diff` against that index reports them as new files, exactly as
+// `git diff --no-index /dev/null <file>` would. Diffs are keyed by path;
+// entries git quotes or expands (directories) are left to the caller.
+func (s *Service) batchUntrackedDiffs(ctx context.Context, path string, files []string) map[string]string {
+	plain := make([]string, 0, len(files))
+	for _, file := range files {
+		if !strings.HasPrefix(file, "\"") && !strings.HasSuffix(file, "/") {
+			plain = append(plain, file)
+		}
+	}
+	if len(plain) == 0 {
+		return nil
+	}
+
+	tmpDir, err := os.MkdirTemp("", "lazyworktree-index-")
+	if err != nil {
+		s.debugf("untracked diff index: %v", err)
+		return nil
+	}
+	defer func() { _ = os.RemoveAll(tmpDir) }()
+	indexEnv := "GIT_INDEX_FILE=" + filepath.Join(tmpDir, "index")
+
+	run := func(args ...string) (string, bool) {
+		s.debugf("run: %s (cwd=%s, %s)", commandLine(args), path, indexEnv)
+		cmd, err := s.prepareAllowedCommand(ctx, args)
+		if err != nil {
+			return "", false
+		}
+		cmd.Dir = path
+		cmd.Env = append(os.Environ(), indexEnv)
+		var out []byte
+		err = s.gated(func() (err error) {
+			out, err = cmd.Output()
+			return commandError(cmd, err)
+		})
+		if err != nil {
+			s.debugf("error: %s: %v", commandLine(args), err)
+			return "", false
+		}
+		return string(out), true
+	}
+
+	if _, ok := run(append([]string{"git", "add", "--intent-to-add", "--"}, plain...)...); !ok {
+		return nil
+	}
+	out, ok := run(append([]string{"git", "diff", "--patch", "--no-color", "--"}, plain...)...)
+	if !ok {
+		return nil
+	}
+	return splitDiffByFile(out)
+}
+
+// splitDiffByFile splits a multi-file patch into per-file patches keyed by
+// path. Only unquoted, non-renamed headers ("diff --git a/X b/X") are kept.
+func splitDiffByFile(raw string) map[string]string {
+	diffs := make(map[string]string)
+	var file string
+	var current strings.Builder
+	flush := func() {
+		if file != "" {
+			diffs[file] = current.String()
+		}
+		current.Reset()
+	}
+	for line := range strings.SplitAfterSeq(raw, "\n") {
+		if header, ok := strings.CutPrefix(line, "diff --git "); ok {
+			flush()
+			file = ""
+			if rest, ok := strings.CutPrefix(strings.TrimSuffix(header, "\n"), "a/"); ok {
+				if n := len(rest) - len(" b/"); n > 0 && n%2 == 0 && rest[n/2:] == " b/"+rest[:n/2] {
+					file = rest[:n/2]
+				}
+			}
+		}
+		current.WriteString(line)
+	}
+	flush()
+	return diffs
+}
+
 func (s *Service) getUntrackedFiles(ctx context.Context, path string) []string {
-	statusRaw := s.RunGit(ctx, []string{"git", "status", "--porcelain"}, path, []int{0}, false, false)
+	// Only the "??" entries are kept, so the status is consumed as git
+	// writes it instead of buffering every modified path first.
 	var untracked []string
-	for _, line := range strings.Split(statusRaw, "\n") {
-		if strings.HasPrefix(line, "?? ") {
-			file := strings.TrimPrefix(line, "?? ")
+	ok := s.runGitLines(ctx, []string{"git", "status", "--porcelain"}, path, false, func(line string) {
+		if file, ok := strings.CutPrefix(line, "?? "); ok {
 			untracked = append(untracked, file)
 		}
+	})
+	if !ok {
+		return nil
 	}
 	return untracked
 }
 
 // GetCommitFiles returns the list of files changed in a specific commit.
+// A root commit lists every file it adds.
 func (s *Service) GetCommitFiles(ctx context.Context, commitSHA, worktreePath string) ([]models.CommitFile, error) {
 	raw := s.RunGit(ctx, []string{
-		"git", "diff-tree", "--name-status", "-r", "--no-commit-id", commitSHA,
-	}, worktreePath, []int{0}, false, false)
+		"git", "diff-tree", "--name-status", "-r", "--root", "--no-commit-id", commitSHA,
+	}, worktreePath, nil, false, false)
 
 	if raw == "" {
 		return []models.CommitFile{}, nil
@@ -2014,6 +2838,19 @@ func (s *Service) GetCommitFiles(ctx context.Context, commitSHA, worktreePath st
 	return parseCommitFiles(raw), nil
 }
 
+// GetCommitFilesWithHeader returns the commit formatted with the given pretty
+// format together with the files it changed, read from a single diff-tree
+// call. --always keeps the header for commits without a diff (merges, empty
+// commits) so callers never need a second git call for the metadata.
+func (s *Service) GetCommitFilesWithHeader(ctx context.Context, commitSHA, worktreePath, format string) (string, []models.CommitFile, error) {
+	raw := s.RunGit(ctx, []string{
+		"git", "diff-tree", "--name-status", "-r", "--root", "--always", "--format=" + format + "%x00", commitSHA,
+	}, worktreePath, nil, false, false)
+
+	header, files, _ := strings.Cut(raw, "\x00")
+	return strings.TrimSpace(header), parseCommitFiles(files), nil
+}
+
 // parseCommitFiles parses the output of git diff-tree --name-status.
 // Format: "M\tpath" or "R100\told\tnew" for renames.
 func parseCommitFiles(raw string) []models.CommitFile {
@@ -4,7 +4,9 @@ import (
 	"context"
 	"os"
 	"os/exec"
+	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -112,3 +114,81 @@ func TestResolveRepoName(t *testing.T) {
 		assert.Equal(t, localRepoKey(top), name)
 	})
 }
+
+func TestResolveRepoNamePersistsForgeLookup(t *testing.T) {
+	tmpDir := t.TempDir()
+	runGit(t, tmpDir, "init")
+	runGit(t, tmpDir, "remote", "add", "origin", "https://git.example.com/group/sub/project.git")
+	withCwd(t, tmpDir)
+
+	writeStubCommand(t, "gh", "LAZYWORKTREE_TEST_GH_NAME")
+	t.Setenv("LAZYWORKTREE_TEST_GH_NAME", "group/sub/project")
+
+	cacheFile := filepath.Join(t.TempDir(), ".repo-names.json")
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.SetRepoNameCacheFile(cacheFile)
+	assert.Equal(t, "group/sub/project", service.ResolveRepoName(context.Background()))
+
+	// A fresh service reuses the persisted name even once gh stops answering.
+	t.Setenv("LAZYWORKTREE_TEST_GH_NAME", "")
+	fresh := NewService(func(string, string) {}, func(string, string, string) {})
+	fresh.SetRepoNameCacheFile(cacheFile)
+	assert.Equal(t, "group/sub/project", fresh.ResolveRepoName(context.Background()))
+}
+
+func TestResolveRepoNameFallsBackToGlab(t *testing.T) {
+	tmpDir := t.TempDir()
+	runGit(t, tmpDir, "init")
+	runGit(t, tmpDir, "remote", "add", "origin", "https://git.example.com/group/project.git")
+	withCwd(t, tmpDir)
+
+	writeStubCommand(t, "gh", "LAZYWORKTREE_TEST_GH_NAME")
+	writeStubCommand(t, "glab", "LAZYWORKTREE_TEST_GLAB_JSON")
+	t.Setenv("LAZYWORKTREE_TEST_GH_NAME", "group/from-gh")
+	t.Setenv("LAZYWORKTREE_TEST_GLAB_JSON", `{"path_with_namespace":"group/from-glab"}`)
+
+	var spawned []string
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.SetCommandRunner(func(ctx context.Context, name string, args ...string) *exec.Cmd {
+		spawned = append(spawned, name)
+		return exec.CommandContext(ctx, name, args...)
+	})
+	assert.Equal(t, "group/from-gh", service.ResolveRepoName(context.Background()))
+	assert.NotContains(t, spawned, "glab", "glab only runs when gh has no answer")
+
+	t.Setenv("LAZYWORKTREE_TEST_GH_NAME", "")
+	fresh := NewService(func(string, string) {}, func(string, string, string) {})
+	assert.Equal(t, "group/from-glab", fresh.ResolveRepoName(context.Background()))
+}
+
+func TestRepoNameCacheExpires(t *testing.T) {
+	t.Parallel()
+
+	cacheFile := filepath.Join(t.TempDir(), ".repo-names.json")
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.SetRepoNameCacheFile(cacheFile)
+
+	now := time.Now()
+	service.saveRepoNameCache(map[string]repoNameEntry{
+		"https://git.example.com/fresh.git": {Name: "group/fresh", ResolvedAt: now.Unix()},
+		"https://git.example.com/stale.git": {Name: "group/stale", ResolvedAt: now.Add(-repoNameCacheTTL).Unix()},
+	})
+
+	assert.Equal(t, map[string]repoNameEntry{
+		"https://git.example.com/fresh.git": {Name: "group/fresh", ResolvedAt: now.Unix()},
+	}, service.loadRepoNameCache(now))
+}
+
+func TestRepoPathRe(t *testing.T) {
+	t.Parallel()
+
+	for url, want := range map[string]string{
+		"https://git.example.com/group/sub/project.git": "sub/project",
+		"git@git.example.com:owner/repo.git":            "owner/repo",
+		"ssh://git@git.example.com/owner/repo":          "owner/repo",
+	} {
+		matches := repoPathRe.FindStringSubmatch(url)
+		require.Len(t, matches, 2, url)
+		assert.Equal(t, want, matches[1], url)
+	}
+}
@@ -3,13 +3,16 @@ package git
 import (
 	"context"
 	"encoding/json"
+	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"runtime"
 	"strconv"
 	"strings"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/chmouel/lazyworktree/internal/config"
 	"github.com/chmouel/lazyworktree/internal/models"
@@ -30,13 +33,7 @@ func TestNewService(t *testing.T) {
 	assert.NotNil(t, service.notify)
 	assert.NotNil(t, service.notifyOnce)
 
-	expectedSlots := runtime.NumCPU() * 2
-	if expectedSlots < 4 {
-		expectedSlots = 4
-	}
-	if expectedSlots > 32 {
-		expectedSlots = 32
-	}
+	expectedSlots := min(runtime.NumCPU()*4, maxConcurrentCommands)
 
 	// Semaphore should have the expected number of slots
 	count := 0
@@ -180,6 +177,69 @@ func TestGetMainWorktreePathFallback(t *testing.T) {
 	assert.Equal(t, expected, actual)
 }
 
+func TestGetMainWorktreePathIsCached(t *testing.T) {
+	t.Parallel()
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	calls := 0
+	service.SetCommandRunner(func(_ context.Context, name string, args ...string) *exec.Cmd {
+		calls++
+		return exec.Command("printf", "worktree /repo/main\\nHEAD abc\\n")
+	})
+	ctx := context.Background()
+
+	assert.Equal(t, "/repo/main", service.GetMainWorktreePath(ctx))
+	assert.Equal(t, "/repo/main", service.GetMainWorktreePath(ctx))
+	assert.Equal(t, 1, calls)
+}
+
+func TestRecentWorktreeList(t *testing.T) {
+	t.Parallel()
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	calls := 0
+	service.SetCommandRunner(func(_ context.Context, name string, args ...string) *exec.Cmd {
+		calls++
+		return exec.Command("printf", "worktree /repo/main\\nHEAD abc\\n")
+	})
+	ctx := context.Background()
+
+	raw := service.RecentWorktreeList(ctx, 0)
+	assert.Equal(t, "worktree /repo/main\nHEAD abc", raw)
+	assert.Equal(t, raw, service.RecentWorktreeList(ctx, time.Minute))
+	assert.Equal(t, "/repo/main", service.GetMainWorktreePath(ctx))
+	assert.Equal(t, 1, calls, "recent listing must be reused")
+
+	service.RecentWorktreeList(ctx, 0)
+	assert.Equal(t, 2, calls, "maxAge 0 always runs git")
+}
+
+func TestRecentStatus(t *testing.T) {
+	t.Parallel()
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	raw := "# branch.oid abc\n# branch.head main\n1 .M N... 100644 100644 100644 abc abc file.go\n"
+
+	_, ok := service.RecentStatus("/repo/main", time.Minute)
+	assert.False(t, ok)
+
+	service.rememberStatus("/repo/main", raw)
+	service.rememberStatus("/repo/feature", "")
+
+	got, ok := service.RecentStatus("/repo/main", time.Minute)
+	assert.True(t, ok)
+	assert.Equal(t, raw, got)
+
+	_, ok = service.RecentStatus("/repo/main", 0)
+	assert.False(t, ok, "snapshot older than maxAge must not be reused")
+	_, ok = service.RecentStatus("/repo/feature", time.Minute)
+	assert.False(t, ok, "failed status calls are not remembered")
+
+	service.ForgetStatus("/repo/main")
+	_, ok = service.RecentStatus("/repo/main", time.Minute)
+	assert.False(t, ok)
+}
+
 func TestRenameWorktree(t *testing.T) {
 	t.Parallel()
 	notify := func(_ string, _ string) {}
@@ -259,6 +319,163 @@ func TestExecuteCommands(t *testing.T) {
 		// May fail if shell execution is restricted, but should not panic
 		_ = err
 	})
+
+	t.Run("link_topsymlinks links root entries only", func(t *testing.T) {
+		mainDir := t.TempDir()
+		setupGitRepo(t, mainDir)
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, ".gitignore"), []byte(".env\n*.pyc\n"), 0o600))
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, ".env"), []byte("SECRET=1"), 0o600))
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, "notes.txt"), []byte("notes"), 0o600))
+		require.NoError(t, os.MkdirAll(filepath.Join(mainDir, "pkg"), 0o750))
+		require.NoError(t, os.WriteFile(filepath.Join(mainDir, "pkg", "mod.pyc"), []byte("x"), 0o600))
+
+		worktreeDir := t.TempDir()
+		env := map[string]string{"MAIN_WORKTREE_PATH": mainDir, "WORKTREE_PATH": worktreeDir}
+		require.NoError(t, service.ExecuteCommands(ctx, []string{"link_topsymlinks"}, worktreeDir, env))
+
+		for _, name := range []string{".env", ".gitignore", "notes.txt"} {
+			target, err := os.Readlink(filepath.Join(worktreeDir, name))
+			require.NoError(t, err, name)
+			assert.Equal(t, filepath.Join(mainDir, name), target)
+		}
+		assert.NoFileExists(t, filepath.Join(worktreeDir, "pkg", "mod.pyc"))
+	})
+}
+
+func TestExecuteCommandsParallel(t *testing.T) {
+	t.Parallel()
+
+	if _, err := exec.LookPath("bash"); err != nil {
+		t.Skip("bash not available")
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	tmpDir := t.TempDir()
+
+	err := service.ExecuteCommandsParallel(context.Background(), []string{
+		"touch one",
+		"exit 3",
+		"",
+		"touch two",
+	}, tmpDir, nil)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "exit 3")
+
+	// A failing command does not stop the others.
+	assert.FileExists(t, filepath.Join(tmpDir, "one"))
+	assert.FileExists(t, filepath.Join(tmpDir, "two"))
+
+	require.NoError(t, service.ExecuteCommandsParallel(context.Background(), nil, tmpDir, nil))
+}
+
+func TestRunGitLimited(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	require.NoError(t, os.WriteFile(filepath.Join(repo, "big.txt"), []byte(strings.Repeat("line\n", 20000)), 0o600))
+	runGit(t, repo, "add", "big.txt")
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	ctx := context.Background()
+	args := []string{"git", "diff", "--cached", "--patch", "--no-color"}
+
+	full := service.runGitLimited(ctx, args, repo, 0)
+	require.Greater(t, len(full), 1000)
+	assert.Equal(t, full, service.RunGit(ctx, args, repo, []int{0}, false, false))
+
+	head := service.runGitLimited(ctx, args, repo, 1000)
+	assert.Equal(t, full[:1000], head)
+
+	assert.Equal(t, full, service.runGitLimited(ctx, args, repo, len(full)+10))
+}
+
+func TestRunGitLines(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	for _, name := range []string{"a.txt", "b.txt"} {
+		require.NoError(t, os.WriteFile(filepath.Join(repo, name), []byte("x\n"), 0o600))
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	ctx := context.Background()
+
+	var lines []string
+	ok := service.runGitLines(ctx, []string{"git", "status", "--porcelain"}, repo, false, func(line string) {
+		lines = append(lines, line)
+	})
+	require.True(t, ok)
+	assert.Equal(t, []string{"?? a.txt", "?? b.txt"}, lines)
+	assert.Equal(t, []string{"a.txt", "b.txt"}, service.getUntrackedFiles(ctx, repo))
+
+	ok = service.runGitLines(ctx, []string{"git", "rev-parse", "--verify", "refs/heads/missing"}, repo, true, func(string) {})
+	assert.False(t, ok)
+}
+
+func TestStreamedGitFailuresAreReportedOnce(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+
+	var reported []string
+	service := NewService(func(string, string) {}, func(_, msg, _ string) { reported = append(reported, msg) })
+	spawns := 0
+	service.SetCommandRunner(func(ctx context.Context, name string, args ...string) *exec.Cmd {
+		spawns++
+		return exec.CommandContext(ctx, name, args...)
+	})
+	ctx := context.Background()
+	args := []string{"git", "rev-parse", "--verify", "refs/heads/missing"}
+
+	assert.Empty(t, service.runGitLimited(ctx, args, repo, 1000))
+	assert.False(t, service.runGitLines(ctx, args, repo, false, func(string) {}))
+
+	assert.Equal(t, 2, spawns, "a failed command should not be run again to report it")
+	require.Len(t, reported, 2)
+	for _, msg := range reported {
+		assert.Contains(t, msg, "Command failed: git rev-parse --verify refs/heads/missing: fatal:")
+	}
+}
+
+func TestCommandLine(t *testing.T) {
+	t.Parallel()
+
+	assert.Equal(t, "git status --porcelain", commandLine{"git", "status", "--porcelain"}.String())
+	assert.Equal(t, "<empty>", commandLine(nil).String())
+	assert.Equal(t, "run: git log", fmt.Sprintf("run: %s", commandLine{"git", "log"}))
+}
+
+func TestRunGitWaitsForSemaphoreToken(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.semaphore = make(chan struct{}, 1)
+
+	done := make(chan string, 1)
+	go func() {
+		done <- service.RunGit(context.Background(), []string{"git", "rev-parse", "--is-inside-work-tree"}, repo, nil, true, false)
+	}()
+
+	select {
+	case <-done:
+		t.Fatal("expected git to wait for a free token")
+	case <-time.After(100 * time.Millisecond):
+	}
+
+	service.releaseSemaphore()
+	select {
+	case out := <-done:
+		assert.Equal(t, "true", out)
+	case <-time.After(10 * time.Second):
+		t.Fatal("git did not run once a token was free")
+	}
+	assert.Len(t, service.semaphore, 1, "token should be returned")
 }
 
 func TestBuildThreePartDiff(t *testing.T) {
@@ -283,6 +500,51 @@ func TestBuildThreePartDiff(t *testing.T) {
 	})
 }
 
+func TestBuildThreePartDiffSections(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	require.NoError(t, os.WriteFile(filepath.Join(repo, "staged.txt"), []byte("staged\n"), 0o600))
+	runGit(t, repo, "add", "staged.txt")
+	require.NoError(t, os.WriteFile(filepath.Join(repo, "README.md"), []byte("# Changed\n"), 0o600))
+	for _, name := range []string{"u1.txt", "u2.txt", "u3.txt"} {
+		require.NoError(t, os.WriteFile(filepath.Join(repo, name), []byte(name+"\n"), 0o600))
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	diff := service.BuildThreePartDiff(context.Background(), repo, &config.AppConfig{
+		MaxUntrackedDiffs: 2,
+		MaxDiffChars:      200000,
+	})
+
+	staged := strings.Index(diff, "=== Staged Changes ===")
+	unstaged := strings.Index(diff, "=== Unstaged Changes ===")
+	first := strings.Index(diff, "=== Untracked: u1.txt ===")
+	second := strings.Index(diff, "=== Untracked: u2.txt ===")
+	require.NotEqual(t, -1, staged)
+	assert.Less(t, staged, unstaged)
+	assert.Less(t, unstaged, first)
+	assert.Less(t, first, second)
+	assert.NotContains(t, diff, "u3.txt ===")
+	assert.Contains(t, diff, "[...showing 2 of 3 untracked files]")
+	assert.Contains(t, diff, "+++ b/u2.txt\n@@ -0,0 +1 @@\n+u2.txt\n")
+}
+
+func TestSplitDiffByFile(t *testing.T) {
+	t.Parallel()
+
+	raw := "diff --git a/a.txt b/a.txt\nnew file mode 100644\n+a\n" +
+		"diff --git \"a/\\303\\251.txt\" \"b/\\303\\251.txt\"\nnew file mode 100644\n" +
+		"diff --git a/dir/b b.txt b/dir/b b.txt\nnew file mode 100644\n+b\n"
+
+	diffs := splitDiffByFile(raw)
+	assert.Equal(t, map[string]string{
+		"a.txt":       "diff --git a/a.txt b/a.txt\nnew file mode 100644\n+a\n",
+		"dir/b b.txt": "diff --git a/dir/b b.txt b/dir/b b.txt\nnew file mode 100644\n+b\n",
+	}, diffs)
+}
+
 func TestRunGit(t *testing.T) {
 	t.Parallel()
 	notify := func(_ string, _ string) {}
@@ -301,6 +563,38 @@ func TestRunGit(t *testing.T) {
 		}
 	})
 
+	t.Run("nil return codes accept only success", func(t *testing.T) {
+		repo := t.TempDir()
+		setupGitRepo(t, repo)
+
+		assert.NotEmpty(t, service.RunGit(ctx, []string{"git", "rev-parse", "HEAD"}, repo, nil, true, true))
+		assert.Empty(t, service.RunGit(ctx, []string{"git", "rev-parse", "--verify", "--quiet", "refs/heads/missing"}, repo, nil, true, true))
+	})
+
+	t.Run("failure reports stderr", func(t *testing.T) {
+		var message string
+		failing := NewService(func(string, string) {}, func(_, msg, _ string) { message = msg })
+		failing.SetCommandRunner(func(_ context.Context, _ string, _ ...string) *exec.Cmd {
+			return exec.Command("sh", "-c", "echo partial; echo 'fatal: broken' >&2; exit 3")
+		})
+		assert.Empty(t, failing.RunGit(ctx, []string{"git", "status"}, "", nil, true, false))
+		assert.Equal(t, "Command failed: git status: fatal: broken", message)
+
+		failing.SetCommandRunner(func(_ context.Context, _ string, _ ...string) *exec.Cmd {
+			return exec.Command("sh", "-c", "echo partial; exit 3")
+		})
+		assert.Equal(t, "partial", failing.RunGit(ctx, []string{"git", "status"}, "", []int{3}, true, false))
+	})
+
+	t.Run("stderr capture is capped", func(t *testing.T) {
+		var buf stderrBuffer
+		n, err := buf.Write(make([]byte, stderrBufferLimit+10))
+		require.NoError(t, err)
+		assert.Equal(t, stderrBufferLimit+10, n)
+		_, _ = buf.Write([]byte("more"))
+		assert.Len(t, buf.String(), stderrBufferLimit)
+	})
+
 	t.Run("run git with allowed error code", func(t *testing.T) {
 		// Run a command that will likely fail with code 128 (invalid command)
 		output := service.RunGit(ctx, []string{"git", "invalid-command-xyz"}, "", []int{128}, true, false)
@@ -320,6 +614,41 @@ func TestRunGit(t *testing.T) {
 	})
 }
 
+func TestPrepareAllowedCommandBoundsWait(t *testing.T) {
+	t.Parallel()
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	cmd, err := service.prepareAllowedCommand(context.Background(), []string{"git", "--version"})
+	require.NoError(t, err)
+	assert.Equal(t, commandWaitDelay, cmd.WaitDelay)
+	assert.Nil(t, cmd.Stdin)
+
+	_, err = service.prepareAllowedCommand(context.Background(), []string{"sh", "-c", "true"})
+	assert.Error(t, err)
+}
+
+func TestRunGitSucceedsWhenHelperHoldsPipes(t *testing.T) {
+	t.Parallel()
+
+	var notified []string
+	service := NewService(
+		func(message, _ string) { notified = append(notified, message) },
+		func(_, message, _ string) { notified = append(notified, message) },
+	)
+	service.SetCommandRunner(func(ctx context.Context, _ string, _ ...string) *exec.Cmd {
+		// The backgrounded sleep inherits the output pipes and keeps them
+		// open after the shell has exited successfully.
+		cmd := exec.CommandContext(ctx, "sh", "-c", "sleep 1 & echo ok")
+		cmd.WaitDelay = 50 * time.Millisecond
+		return cmd
+	})
+
+	ctx := context.Background()
+	assert.Equal(t, "ok", service.RunGit(ctx, []string{"git", "fetch"}, "", nil, true, false))
+	assert.True(t, service.RunCommandChecked(ctx, []string{"git", "fetch"}, "", "fetch failed"))
+	assert.Empty(t, notified)
+}
+
 func TestNotifications(t *testing.T) {
 	t.Parallel()
 	t.Run("notify function called", func(t *testing.T) {
@@ -440,6 +769,36 @@ func TestFetchPRForWorktree(t *testing.T) {
 	})
 }
 
+func TestFetchPRsForWorktrees(t *testing.T) {
+	t.Parallel()
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.SetCommandRunner(func(_ context.Context, name string, args ...string) *exec.Cmd {
+		if name == "git" {
+			return exec.Command("echo", "git@github.com:owner/repo.git")
+		}
+		// Each worktree directory is named after the PR number gh reports.
+		return exec.Command("sh", "-c", `n=$(basename "$PWD"); [ "$n" = none ] && exit 1; printf '{"number":%s,"state":"OPEN","headRefName":"b%s"}' "$n" "$n"`)
+	})
+
+	root := t.TempDir()
+	paths := make([]string, 0, 4)
+	for _, name := range []string{"1", "2", "3", "none"} {
+		path := filepath.Join(root, name)
+		require.NoError(t, os.Mkdir(path, 0o750))
+		paths = append(paths, path)
+	}
+
+	prs, errs := service.FetchPRsForWorktrees(context.Background(), paths)
+	require.Len(t, prs, 3)
+	for i, path := range paths[:3] {
+		assert.NotContains(t, errs, path)
+		assert.Equal(t, i+1, prs[path].Number)
+		assert.Equal(t, "b"+strconv.Itoa(i+1), prs[path].Branch)
+	}
+	assert.NotContains(t, prs, paths[3])
+}
+
 func TestGithubBucketToConclusion(t *testing.T) {
 	t.Parallel()
 	notify := func(_ string, _ string) {}
@@ -2082,3 +2441,400 @@ func TestMapGitHubConclusion(t *testing.T) {
 		})
 	}
 }
+
+func TestCountReachableCommits(t *testing.T) {
+	t.Parallel()
+
+	graph := parseRevListParents("c3 c2\nc2 c1 m1\nc1 base\nm1 base\nf1 c1\n")
+	counts := countReachableCommits(graph, []string{"c3", "f1", "pushed"}, 100)
+	assert.Equal(t, 4, counts["c3"])
+	assert.Equal(t, 2, counts["f1"])
+	assert.Equal(t, 0, counts["pushed"])
+
+	limited := countReachableCommits(graph, []string{"c3"}, 2)
+	assert.Equal(t, 2, limited["c3"])
+}
+
+func TestCountUnpushedCommitsRecountsTipsOutsideWindow(t *testing.T) {
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	withCwd(t, repo)
+
+	// The old branch's only commit predates every commit on the current
+	// branch, so the newest-first walk fills its window of 2*2 commits
+	// without reaching it.
+	current := runGit(t, repo, "branch", "--show-current")
+	runGit(t, repo, "switch", "-c", "old")
+	t.Setenv("GIT_COMMITTER_DATE", "2001-01-01T00:00:00Z")
+	runGit(t, repo, "commit", "--allow-empty", "-m", "old")
+	oldTip := runGit(t, repo, "rev-parse", "HEAD")
+
+	runGit(t, repo, "switch", current)
+	t.Setenv("GIT_COMMITTER_DATE", "2020-01-01T00:00:00Z")
+	for i := range 4 {
+		runGit(t, repo, "commit", "--allow-empty", "-m", "new-"+strconv.Itoa(i))
+	}
+	newTip := runGit(t, repo, "rev-parse", "HEAD")
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	counts := service.countUnpushedCommits(context.Background(), []string{newTip, oldTip}, 2)
+	assert.Equal(t, 2, counts[newTip])
+	assert.Equal(t, 2, counts[oldTip])
+}
+
+func TestGetWorktreesCountsUnpushedCommits(t *testing.T) {
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	withCwd(t, repo)
+
+	wtPath := filepath.Join(t.TempDir(), "feature")
+	runGit(t, repo, "worktree", "add", "-b", "feature", wtPath)
+	for _, name := range []string{"a.txt", "b.txt"} {
+		require.NoError(t, os.WriteFile(filepath.Join(wtPath, name), []byte(name), 0o600))
+		runGit(t, wtPath, "add", name)
+		runGit(t, wtPath, "commit", "-m", name)
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	worktrees, err := service.GetWorktrees(context.Background())
+	require.NoError(t, err)
+	require.Len(t, worktrees, 2)
+
+	unpushed := make(map[string]int)
+	for _, wt := range worktrees {
+		unpushed[wt.Branch] = wt.Unpushed
+	}
+	assert.Equal(t, 3, unpushed["feature"])
+	assert.Equal(t, 1, unpushed[runGit(t, repo, "branch", "--show-current")])
+}
+
+func TestGetWorktreesWithMoreWorktreesThanWorkers(t *testing.T) {
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	withCwd(t, repo)
+
+	base := t.TempDir()
+	for i := range 5 {
+		name := "wt-" + strconv.Itoa(i)
+		runGit(t, repo, "worktree", "add", "-b", name, filepath.Join(base, name))
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	service.semaphore = make(chan struct{}, 2)
+	service.semaphore <- struct{}{}
+	service.semaphore <- struct{}{}
+
+	var mu sync.Mutex
+	probed := 0
+	worktrees, err := service.GetWorktreesWithProgress(context.Background(), func(models.WorktreeInfo) {
+		mu.Lock()
+		probed++
+		mu.Unlock()
+	})
+	require.NoError(t, err)
+	require.Len(t, worktrees, 6)
+	assert.Equal(t, 6, probed)
+}
+
+func TestGetWorktreesResolvesMainBranchFromOriginHead(t *testing.T) {
+	origin := t.TempDir()
+	setupGitRepo(t, origin)
+	runGit(t, origin, "branch", "-M", "trunk")
+
+	clone := filepath.Join(t.TempDir(), "clone")
+	runGit(t, origin, "clone", origin, clone)
+	withCwd(t, clone)
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	_, err := service.GetWorktrees(context.Background())
+	require.NoError(t, err)
+	assert.Equal(t, "trunk", service.mainBranch)
+}
+
+func TestMainBranchFromSymref(t *testing.T) {
+	t.Parallel()
+
+	assert.Equal(t, "main", mainBranchFromSymref("origin/main"))
+	assert.Equal(t, "develop", mainBranchFromSymref("develop"))
+	assert.Empty(t, mainBranchFromSymref(""))
+}
+
+func TestResolveRevisionReusesCatFileProcess(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	ctx := context.Background()
+
+	assert.Equal(t, runGit(t, repo, "rev-parse", "HEAD"), service.ResolveRevision(ctx, repo, "HEAD"))
+	proc, ok := service.catFiles.Get(repo)
+	require.True(t, ok)
+
+	runGit(t, repo, "commit", "--allow-empty", "-m", "second")
+	assert.Equal(t, runGit(t, repo, "rev-parse", "HEAD"), service.ResolveRevision(ctx, repo, "HEAD"))
+	assert.Empty(t, service.ResolveRevision(ctx, repo, "does-not-exist"))
+	assert.Empty(t, service.ResolveRevision(ctx, repo, "HEAD\nHEAD"))
+	current, _ := service.catFiles.Get(repo)
+	assert.Same(t, proc, current)
+
+	service.Close()
+	assert.Zero(t, service.catFiles.Len())
+}
+
+func TestReleaseWorktreeStopsCatFileProcesses(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	base := t.TempDir()
+	removed := filepath.Join(base, "removed")
+	moved := filepath.Join(base, "moved")
+	pruned := filepath.Join(base, "pruned")
+	for _, dir := range []string{removed, moved, pruned} {
+		runGit(t, repo, "worktree", "add", "-b", filepath.Base(dir), dir)
+	}
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	ctx := context.Background()
+	for _, dir := range []string{repo, removed, moved, pruned} {
+		require.NotEmpty(t, service.ResolveRevision(ctx, dir, "HEAD"))
+	}
+	require.Equal(t, 4, service.catFiles.Len())
+
+	service.ReleaseWorktree(removed)
+	require.True(t, service.RunCommandChecked(ctx, []string{"git", "worktree", "remove", "--force", removed}, repo, "remove"))
+	require.True(t, service.RenameWorktree(ctx, moved, filepath.Join(base, "renamed"), "other", "renamed"))
+	require.NoError(t, os.RemoveAll(pruned))
+	service.ReleaseMissingWorktrees()
+
+	_, ok := service.catFiles.Get(repo)
+	assert.True(t, ok, "unrelated worktrees keep their process")
+	assert.Equal(t, 1, service.catFiles.Len())
+}
+
+func TestReadObjectStopsProcessWhenContextEnds(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	// A helper that never answers stands in for a lookup stuck on a lazy
+	// fetch.
+	service.SetCommandRunner(func(ctx context.Context, _ string, _ ...string) *exec.Cmd {
+		return exec.CommandContext(ctx, "sleep", "60")
+	})
+
+	ctx, cancel := context.WithTimeout(context.Background(), 100*time.Millisecond)
+	defer cancel()
+	_, err := service.readObject(ctx, repo, "HEAD")
+	require.ErrorIs(t, err, context.DeadlineExceeded)
+	assert.Zero(t, service.catFiles.Len(), "the stuck process is discarded")
+}
+
+func TestCatFileProcessesAreBounded(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	ctx := context.Background()
+	for i := range maxCatFileProcesses + 2 {
+		dir := filepath.Join(repo, "dir-"+strconv.Itoa(i))
+		require.NoError(t, os.Mkdir(dir, 0o750))
+		require.NotEmpty(t, service.ResolveRevision(ctx, dir, "HEAD"))
+	}
+	assert.Equal(t, maxCatFileProcesses, service.catFiles.Len())
+}
+
+func TestRevisionExists(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	runGit(t, repo, "branch", "feature")
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	ctx := context.Background()
+
+	assert.True(t, service.RevisionExists(ctx, repo, "refs/heads/feature"))
+	assert.True(t, service.RevisionExists(ctx, repo, "HEAD^{commit}"))
+	assert.False(t, service.RevisionExists(ctx, repo, "refs/heads/missing"))
+	assert.Equal(t, 1, service.catFiles.Len())
+
+	// A helper that cannot start falls back to spawning rev-parse.
+	var spawned []string
+	service.Close()
+	service.SetCommandRunner(func(ctx context.Context, name string, args ...string) *exec.Cmd {
+		spawned = append(spawned, strings.Join(args, " "))
+		if args[0] == "cat-file" {
+			return exec.CommandContext(ctx, "false")
+		}
+		return exec.CommandContext(ctx, name, args...)
+	})
+	assert.True(t, service.RevisionExists(ctx, repo, "refs/heads/feature"))
+	assert.Equal(t, []string{"cat-file --batch", "rev-parse --verify --quiet refs/heads/feature"}, spawned)
+}
+
+func TestReadCommit(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	runGit(t, repo, "commit", "--allow-empty", "-m", "subject line\n\nbody line one\nbody line two")
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	t.Cleanup(service.Close)
+	ctx := context.Background()
+
+	commit, err := service.ReadCommit(ctx, repo, "HEAD")
+	require.NoError(t, err)
+	assert.Equal(t, runGit(t, repo, "rev-parse", "HEAD"), commit.SHA)
+	assert.Equal(t, []string{runGit(t, repo, "rev-parse", "HEAD~1")}, commit.Parents)
+	assert.Equal(t, runGit(t, repo, "log", "-1", "--format=%an"), commit.AuthorName)
+	assert.Equal(t, runGit(t, repo, "log", "-1", "--format=%ae"), commit.AuthorEmail)
+	assert.Equal(t, runGit(t, repo, "log", "-1", "--format=%at"), strconv.FormatInt(commit.AuthorDate.Unix(), 10))
+	assert.Equal(t, "subject line", commit.Subject)
+	assert.Equal(t, "body line one\nbody line two", commit.Body)
+
+	_, err = service.ReadCommit(ctx, repo, "HEAD^{tree}")
+	require.Error(t, err)
+}
+
+func TestGetCommitFilesWithHeader(t *testing.T) {
+	t.Parallel()
+
+	repo := t.TempDir()
+	setupGitRepo(t, repo)
+	require.NoError(t, os.WriteFile(filepath.Join(repo, "added.txt"), []byte("new\n"), 0o600))
+	runGit(t, repo, "add", "added.txt")
+	runGit(t, repo, "commit", "-m", "add file", "-m", "with a body")
+
+	service := NewService(func(string, string) {}, func(string, string, string) {})
+	header, files, err := service.GetCommitFilesWithHeader(context.Background(), "HEAD", repo, "%H%x1f%s%x1f%b")
+	require.NoError(t, err)
+
+	assert.Equal(t, runGit(t, repo, "rev-parse", "HEAD")+"\x1fadd file\x1fwith a body", header)
+	require.Len(t, files, 1)
+	assert.Equal(t, "added.txt", files[0].Filename)
+	assert.Equal(t, "A", files[0].ChangeType)
+
+	// The root commit and commits without a diff still report their header.
+	root := runGit(t, repo, "rev-list", "--max-parents=0", "HEAD")
+	header, files, err = service.GetCommitFilesWithHeader(context.Background(), root, repo, "%H")
+	require.NoError(t, err)
+	assert.Equal(t, root, header)
+	require.Len(t, files, 1)
+	assert.Equal(t, "README.md", files[0].Filename)
+
+	runGit(t, repo, "commit", "--allow-empty", "-m", "empty")
+	header, files, err = service.GetCommitFilesWithHeader(context.Background(), "HEAD", repo, "%s")
+	require.NoError(t, err)
+	assert.Equal(t, "empty", header)
+	assert.Empty(t, files)
+}
+
+func TestParseCommitObject(t *testing.T) {
+	t.Parallel()
+
+	raw := "tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n" +
+		"parent 1111111111111111111111111111111111111111\n" +
+		"parent 2222222222222222222222222222222222222222\n" +
+		"author Jane Doe <jane@example.com> 1700000000 -0130\n" +
+		"committer Jane Doe <jane@example.com> 1700000000 -0130\n" +
+		"\n" +
+		"Merge branch 'feature'\n" +
+		"into main\n" +
+		"\n" +
+		"Details here.\n"
+
+	commit := parseCommitObject("abc", []byte(raw))
+	assert.Equal(t, "abc", commit.SHA)
+	assert.Len(t, commit.Parents, 2)
+	assert.Equal(t, "Jane Doe", commit.AuthorName)
+	assert.Equal(t, "jane@example.com", commit.AuthorEmail)
+	assert.Equal(t, int64(1700000000), commit.AuthorDate.Unix())
+	_, offset := commit.AuthorDate.Zone()
+	assert.Equal(t, -(3600 + 30*60), offset)
+	assert.Equal(t, "Merge branch 'feature' into main", commit.Subject)
+	assert.Equal(t, "Details here.", commit.Body)
+}
+
+func TestParseWorktreeStatus(t *testing.T) {
+	t.Parallel()
+
+	raw := strings.Join([]string{
+		"# branch.oid 0123456789abcdef",
+		"# branch.head feature",
+		"# branch.upstream origin/feature",
+		"# branch.ab +3 -1",
+		"1 M. N... 100644 100644 100644 abc def staged.go",
+		"1 .M N... 100644 100644 100644 abc def modified.go",
+		"2 RM N... 100644 100644 100644 abc def R100 new.go\told.go",
+		"? untracked.txt",
+		"? other.txt",
+	}, "\n")
+
+	st := parseWorktreeStatus(raw)
+	assert.Equal(t, "0123456789abcdef", st.headOID)
+	assert.True(t, st.hasUpstream)
+	assert.Equal(t, "origin/feature", st.upstreamBranch)
+	assert.Equal(t, 3, st.ahead)
+	assert.Equal(t, 1, st.behind)
+	assert.Equal(t, 2, st.staged)
+	assert.Equal(t, 2, st.modified)
+	assert.Equal(t, 2, st.untracked)
+
+	clean := parseWorktreeStatus("# branch.oid (initial)\n# branch.head main")
+	assert.False(t, clean.hasUpstream)
+	assert.Zero(t, clean.staged+clean.modified+clean.untracked)
+
+	ignored := parseWorktreeStatus("\n# stash 2\nu UU N... 100644 100644 100644 100644 a b c conflict.go\n! build/\n1 M\n")
+	assert.Zero(t, ignored.staged+ignored.modified+ignored.untracked)
+}
+
+func TestDecodeJSONArray(t *testing.T) {
+	t.Parallel()
+
+	var got []githubPRListItem
+	raw := `[{"headRefName":"feature","number":7,"author":{"login":"octo","name":"Octo","is_bot":true}},{"headRefName":"","number":8}]`
+	require.NoError(t, decodeJSONArray(raw, func(p *githubPRListItem) {
+		got = append(got, *p)
+	}))
+	require.Len(t, got, 2)
+	assert.Equal(t, "feature", got[0].HeadRefName)
+	assert.Equal(t, 7, got[0].Number)
+	require.NotNil(t, got[0].Author)
+	assert.Equal(t, "octo", got[0].Author.Login)
+	assert.True(t, got[0].Author.IsBot)
+	assert.Nil(t, got[1].Author)
+
+	require.Error(t, decodeJSONArray(`{"headRefName":"x"}`, func(*githubPRListItem) {}))
+	require.Error(t, decodeJSONArray(`[{"number":1},`, func(*githubPRListItem) {}))
+}
+
+func TestRunGitFailureKeyIgnoresCwd(t *testing.T) {
+	t.Parallel()
+
+	var keys []string
+	service := NewService(func(string, string) {}, func(key, _, _ string) {
+		keys = append(keys, key)
+	})
+	service.SetCommandRunner(func(ctx context.Context, _ string, _ ...string) *exec.Cmd {
+		return exec.CommandContext(ctx, "sh", "-c", "exit 3")
+	})
+
+	for _, cwd := range []string{t.TempDir(), t.TempDir()} {
+		service.RunGit(context.Background(), []string{"git", "status"}, cwd, []int{0}, true, false)
+	}
+	require.Len(t, keys, 2)
+	assert.Equal(t, keys[0], keys[1])
+}
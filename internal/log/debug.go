@@ -85,6 +85,15 @@ func SetFile(path string) error {
 	return nil
 }
 
+// Enabled reports whether debug messages are kept, either buffered until a
+// log file is set or written to one. Callers can skip building messages
+// nobody will read when it returns false.
+func Enabled() bool {
+	globalDebugLogger.mu.Lock()
+	defer globalDebugLogger.mu.Unlock()
+	return !globalDebugLogger.discard
+}
+
 // Printf writes a formatted debug message via the standard logger.
 func Printf(format string, args ...any) {
 	stdLogger.Printf(format, args...)
@@ -301,6 +301,27 @@ func TestSetFile(t *testing.T) {
 	})
 }
 
+func TestEnabled(t *testing.T) {
+	restore := resetDebugLogger(t)
+	t.Cleanup(restore)
+
+	if !Enabled() {
+		t.Fatal("Enabled() = false while buffering, want true")
+	}
+	if err := SetFile(""); err != nil {
+		t.Fatalf("SetFile(\"\") error = %v, want nil", err)
+	}
+	if Enabled() {
+		t.Fatal("Enabled() = true after discarding, want false")
+	}
+	if err := SetFile(filepath.Join(t.TempDir(), "debug.log")); err != nil {
+		t.Fatalf("SetFile() error = %v, want nil", err)
+	}
+	if !Enabled() {
+		t.Fatal("Enabled() = false with a log file, want true")
+	}
+}
+
 func TestPrintln(t *testing.T) {
 	t.Run("println writes to buffer", func(t *testing.T) {
 		restore := resetDebugLogger(t)
@@ -48,15 +48,17 @@ type CICheck struct {
 }
 
 // WorktreeInfo summarizes the information for a git worktree.
+// The flags are grouped together so they share one word instead of each
+// being padded to eight bytes; keep new bool fields with them.
 type WorktreeInfo struct {
 	Path           string
 	Branch         string
 	IsMain         bool
 	Dirty          bool
+	HasUpstream    bool
 	Ahead          int
 	Behind         int
-	Unpushed       int // Commits not on any remote (for branches without upstream)
-	HasUpstream    bool
+	Unpushed       int    // Commits not on any remote (for branches without upstream)
 	UpstreamBranch string // The upstream branch name (e.g., "origin/main" or "chmouel/feature-branch")
 	LastActive     string
 	LastActiveTS   int64
@@ -89,6 +91,8 @@ const (
 	CommandPaletteHistoryFilename = ".command-palette-history.json"
 	// WorktreeNotesFilename stores per-worktree annotations.
 	WorktreeNotesFilename = ".worktree-notes.json"
+	// RepoNamesFilename stores repository names resolved through gh or glab, keyed by remote URL.
+	RepoNamesFilename = ".repo-names.json"
 )
 
 // PR fetch status values for WorktreeInfo.PRFetchStatus field.
@@ -0,0 +1,99 @@
+package utils
+
+import (
+	"container/list"
+	"sync"
+)
+
+// LRUCache is a thread-safe, size-bounded cache evicting the least recently
+// used entry once capacity is reached.
+type LRUCache[K comparable, V any] struct {
+	mu       sync.Mutex
+	capacity int
+	order    *list.List
+	entries  map[K]*list.Element
+}
+
+type lruEntry[K comparable, V any] struct {
+	key   K
+	value V
+}
+
+// NewLRUCache creates an LRU cache holding at most capacity entries.
+func NewLRUCache[K comparable, V any](capacity int) *LRUCache[K, V] {
+	return &LRUCache[K, V]{
+		capacity: max(capacity, 1),
+		order:    list.New(),
+		entries:  make(map[K]*list.Element),
+	}
+}
+
+// Get returns the value for key and marks it as recently used.
+func (c *LRUCache[K, V]) Get(key K) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.entries[key]
+	if !ok {
+		var zero V
+		return zero, false
+	}
+	c.order.MoveToFront(elem)
+	return elem.Value.(*lruEntry[K, V]).value, true
+}
+
+// Set stores value for key, evicting the least recently used entry if needed.
+// The evicted value is returned so callers can release what it holds.
+func (c *LRUCache[K, V]) Set(key K, value V) (evicted V, ok bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if elem, found := c.entries[key]; found {
+		elem.Value.(*lruEntry[K, V]).value = value
+		c.order.MoveToFront(elem)
+		return evicted, false
+	}
+	c.entries[key] = c.order.PushFront(&lruEntry[K, V]{key: key, value: value})
+	if c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		entry := oldest.Value.(*lruEntry[K, V])
+		delete(c.entries, entry.key)
+		return entry.value, true
+	}
+	return evicted, false
+}
+
+// DeleteFunc removes every entry whose key matches fn and returns the
+// removed values.
+func (c *LRUCache[K, V]) DeleteFunc(fn func(K) bool) []V {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	var removed []V
+	for key, elem := range c.entries {
+		if fn(key) {
+			removed = append(removed, elem.Value.(*lruEntry[K, V]).value)
+			c.order.Remove(elem)
+			delete(c.entries, key)
+		}
+	}
+	return removed
+}
+
+// Clear removes all entries.
+func (c *LRUCache[K, V]) Clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.order.Init()
+	c.entries = make(map[K]*list.Element)
+}
+
+// Len returns the number of cached entries.
+func (c *LRUCache[K, V]) Len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	return c.order.Len()
+}
@@ -0,0 +1,65 @@
+package utils
+
+import "testing"
+
+func TestLRUCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	cache := NewLRUCache[string, int](2)
+	cache.Set("a", 1)
+	cache.Set("b", 2)
+
+	if _, ok := cache.Get("a"); !ok {
+		t.Fatal("expected a to be cached")
+	}
+	if evicted, ok := cache.Set("c", 3); !ok || evicted != 2 {
+		t.Errorf("Set(c) evicted %d, %v, want 2, true", evicted, ok)
+	}
+
+	if _, ok := cache.Get("b"); ok {
+		t.Error("expected b to be evicted")
+	}
+	if v, ok := cache.Get("a"); !ok || v != 1 {
+		t.Errorf("Get(a) = %d, %v, want 1, true", v, ok)
+	}
+	if v, ok := cache.Get("c"); !ok || v != 3 {
+		t.Errorf("Get(c) = %d, %v, want 3, true", v, ok)
+	}
+	if cache.Len() != 2 {
+		t.Errorf("Len() = %d, want 2", cache.Len())
+	}
+}
+
+func TestLRUCacheSetUpdatesExisting(t *testing.T) {
+	cache := NewLRUCache[string, int](2)
+	cache.Set("a", 1)
+	cache.Set("a", 2)
+
+	if v, _ := cache.Get("a"); v != 2 {
+		t.Errorf("Get(a) = %d, want 2", v)
+	}
+	if cache.Len() != 1 {
+		t.Errorf("Len() = %d, want 1", cache.Len())
+	}
+}
+
+func TestLRUCacheDeleteFuncAndClear(t *testing.T) {
+	cache := NewLRUCache[string, int](4)
+	cache.Set("keep", 1)
+	cache.Set("drop-1", 2)
+	cache.Set("drop-2", 3)
+
+	removed := cache.DeleteFunc(func(key string) bool { return key != "keep" })
+	if len(removed) != 2 {
+		t.Errorf("DeleteFunc removed %v, want 2 values", removed)
+	}
+	if cache.Len() != 1 {
+		t.Fatalf("Len() = %d, want 1", cache.Len())
+	}
+	if _, ok := cache.Get("keep"); !ok {
+		t.Error("expected keep to survive DeleteFunc")
+	}
+
+	cache.Clear()
+	if cache.Len() != 0 {
+		t.Errorf("Len() after Clear = %d, want 0", cache.Len())
+	}
+}